@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark first-use cost of the exercise catalogue: raw JSON vs compiled cache.
+
+Each mode runs in a fresh interpreter so nothing is warm:
+
+- ``json``      the old path - ``json.loads`` of the full 354 KB file;
+- ``compile``   first run with no cache - parse, project, write the cache;
+- ``compiled``  later runs - mmap + ``marshal.loads`` of the cache.
+
+Reported per mode: wall time of the load and the process RSS growth across it
+(measured untraced), and the Python heap retained by the result (tracemalloc,
+in a separate run so tracing overhead does not skew the timing).
+
+Usage:  uv run python scripts/bench_exercise_catalogue.py [--runs N]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+
+CHILD = r"""
+import json, os, resource, sys, time, tracemalloc
+from pathlib import Path
+
+mode, cache_dir, trace = sys.argv[1], Path(sys.argv[2]), sys.argv[3] == "trace"
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+from tp_mcp.tools import _exercises
+_exercises.CACHE_DIR = cache_dir
+source = _exercises._source()
+
+if trace:
+    tracemalloc.start()
+rss0 = rss_kb()
+t0 = time.perf_counter()
+if mode == "json":
+    catalogue = json.loads(source.read_text(encoding="utf-8"))
+else:
+    catalogue = _exercises.load_catalogue()
+elapsed = time.perf_counter() - t0
+if trace:
+    print(json.dumps({"heap_kb": tracemalloc.get_traced_memory()[0] / 1024}))
+else:
+    print(json.dumps({"ms": elapsed * 1000, "rss_kb": rss_kb() - rss0}))
+"""
+
+
+def run(mode: str, cache_dir: str) -> dict[str, float]:
+    result: dict[str, float] = {}
+    for trace in ("time", "trace"):
+        with tempfile.TemporaryDirectory() as scratch:
+            # "compile" must start cold every time; the other modes share the warm cache.
+            target = scratch if mode == "compile" else cache_dir
+            out = subprocess.run(
+                [sys.executable, "-c", CHILD, mode, target, trace], check=True, capture_output=True, text=True,
+            )
+        result.update(json.loads(out.stdout))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results: dict[str, list[dict[str, float]]] = {"json": [], "compile": [], "compiled": []}
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            results["json"].append(run("json", cache_dir))
+            results["compile"].append(run("compile", cache_dir))
+            run("compiled", cache_dir)  # first pass compiles into the shared cache
+            results["compiled"].append(run("compiled", cache_dir))
+
+    print(f"{'mode':<10} {'load ms':>9} {'heap KB':>9} {'RSS KB':>8}   (median of {args.runs})")
+    for mode, rows in results.items():
+        print(
+            f"{mode:<10} {statistics.median(r['ms'] for r in rows):>9.2f}"
+            f" {statistics.median(r['heap_kb'] for r in rows):>9.0f}"
+            f" {statistics.median(r['rss_kb'] for r in rows):>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
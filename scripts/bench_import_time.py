@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark and guard the server's cold-start import cost.
+
+MCP hosts respawn ``tp-mcp serve`` constantly, so everything imported before
+the stdio handshake is paid on every launch. Each run imports the server in a
+fresh interpreter under ``python -X importtime`` and reports:
+
+- ``total``       cumulative import time of ``tp_mcp.server``;
+- ``first-party`` the same minus the MCP SDK (``mcp``, ``mcp_types``) and
+  whatever it imports - the floor every MCP server pays. What remains is
+  tp_mcp's own modules and the packages they pull in (e.g. keyring).
+
+The guard fails (exit 1) if a module that should load lazily - any tool module,
+the HTTP client, the pydantic response models or the credential stores - is
+imported at startup, or if ``--budget-ms`` is given and the median first-party
+time exceeds it.
+
+Usage:  uv run python scripts/bench_import_time.py [--runs N] [--budget-ms MS] [--top N]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+# Must not be imported by ``import tp_mcp.server``.
+LAZY = re.compile(
+    r"^(tp_mcp\.tools\.(?!_constants$)\w+|tp_mcp\.client\.(http|models|roster)|tp_mcp\.auth(\..*)?|keyring(\..*)?)$"
+)
+_SDK = re.compile(r"^(mcp|mcp_types)(\.|$)")
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def run_once() -> list[tuple[int, int, int, str]]:
+    """(self us, cumulative us, depth, module) in import-completion order."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import tp_mcp.server"],
+        check=True, capture_output=True, text=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            rows.append((int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2, m.group(4)))
+    return rows
+
+
+def first_party_us(rows: list[tuple[int, int, int, str]]) -> int:
+    """Import time of ``tp_mcp.server`` minus the MCP SDK subtrees it pulls in."""
+    total = 0
+    # importtime prints children before their parent; walk backwards to see parents first.
+    sdk: list[bool] = []  # per depth: is this frame inside an MCP SDK import?
+    for self_us, _cum, depth, name in reversed(rows):
+        if depth == 0 and name != "tp_mcp.server":
+            break  # interpreter startup (site, encodings) precedes the server import
+        del sdk[depth:]
+        inside = bool(sdk and sdk[-1]) or _SDK.match(name) is not None
+        sdk.append(inside)
+        if not inside:
+            total += self_us
+    return total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if median first-party time exceeds this")
+    parser.add_argument("--top", type=int, default=10, help="show the N slowest first-party modules")
+    args = parser.parse_args()
+
+    totals, first_party = [], []
+    rows: list[tuple[int, int, int, str]] = []
+    for _ in range(args.runs):
+        rows = run_once()
+        totals.append(next(cum for _s, cum, _d, name in rows if name == "tp_mcp.server") / 1000)
+        first_party.append(first_party_us(rows) / 1000)
+
+    print(f"tp_mcp.server import (median of {args.runs}):")
+    print(f"  total        {statistics.median(totals):8.1f} ms")
+    print(f"  first-party  {statistics.median(first_party):8.1f} ms")
+    own = sorted((r for r in rows if r[3].startswith("tp_mcp")), key=lambda r: -r[0])[: args.top]
+    for self_us, _cum, _depth, name in own:
+        print(f"    {self_us / 1000:7.1f} ms  {name}")
+
+    failed = False
+    eager = sorted({name for *_, name in rows if LAZY.match(name)})
+    if eager:
+        failed = True
+        print("FAIL: imported at startup but should load on first tool call:")
+        for name in eager:
+            print(f"  {name}")
+    if args.budget_ms is not None and statistics.median(first_party) > args.budget_ms:
+        failed = True
+        print(f"FAIL: first-party import time over budget ({args.budget_ms} ms)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark tool-result encoding: payload size and encode time per mode.
+
+Encodes synthetic results shaped like the largest real ones - a year of daily
+PMC data (``tp_get_fitness``) and 90 days of workouts (``tp_get_workouts``) -
+with each encoder:
+
+- ``pretty``          the old format, ``json.dumps(result, indent=2)``;
+- ``compact/stdlib``  ``tp_mcp.output.dumps`` with the stdlib encoder;
+- ``compact/orjson``  the same with orjson (skipped if not installed);
+- ``columns``         ``format="columns"`` (``output.to_columns``), compact.
+
+Usage:  uv run python scripts/bench_output.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from datetime import date, timedelta
+
+from tp_mcp import output
+
+
+def fitness_result() -> dict:
+    start = date(2025, 1, 1)
+    days = [
+        {"date": (start + timedelta(days=i)).isoformat(), "tss": 60.0 + i % 40,
+         "ctl": 55.3 + i / 10, "atl": 61.2 + i % 7, "tsb": -5.9 + i % 11}
+        for i in range(365)
+    ]
+    return {"start_date": days[0]["date"], "end_date": days[-1]["date"], "current": days[-1], "daily_data": days}
+
+
+def workouts_result() -> dict:
+    start = date(2025, 1, 1)
+    workouts = [
+        {"id": 3000000 + i, "date": (start + timedelta(days=i // 2)).isoformat(), "title": f"Endurance ride {i}",
+         "sport": "Bike", "type": "completed", "duration_planned": 1.5, "duration_actual": 1.42,
+         "tss_planned": 80.0, "tss_actual": 74.6, "distance_km": 42.7, "description": "Z2, cadence 90"}
+        for i in range(180)
+    ]
+    return {"workouts": workouts, "count": len(workouts)}
+
+
+def bench(fn, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        t = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t) * 1000)
+    return statistics.median(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    def compact(result: dict, encoder: str) -> str:
+        os.environ[output.JSON_ENV] = encoder
+        return output.dumps(result)
+
+    encoders = {
+        "pretty": lambda r: json.dumps(r, indent=2),
+        "compact/stdlib": lambda r: compact(r, "stdlib"),
+    }
+    if output._orjson() is not None:
+        encoders["compact/orjson"] = lambda r: compact(r, "auto")
+
+    cases = (
+        ("tp_get_fitness, 365 days", fitness_result(), "daily_data"),
+        ("tp_get_workouts, 180", workouts_result(), "workouts"),
+    )
+    for label, result, key in cases:
+        encoders["columns"] = lambda r, key=key: compact({**r, key: output.to_columns(r[key])}, "auto")
+        print(label)
+        baseline = len(json.dumps(result, indent=2))
+        for name, encode in encoders.items():
+            size = len(encode(result))
+            ms = bench(lambda encode=encode, result=result: encode(result), args.runs)
+            print(f"  {name:15} {size / 1024:7.1f} KB ({size / baseline:4.0%})  {ms:6.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,7 +6,8 @@ sandboxed iframe, linked by ``_meta.ui.resourceUri`` on the tool. The SDK's
 small amount of wiring itself:
 
 - ``register_app(tool_name, uri, html_file, title)`` binds a tool to an HTML
-  resource shipped as package data in this directory.
+  resource shipped as package data in this directory; ``extra_tools`` binds
+  further tools whose results the same UI renders.
 - ``stamp_tools(tools)`` writes the ``_meta`` keys onto the bound Tool objects
   (both the nested spec shape and the deprecated flat key pre-GA hosts read).
 - ``list_resources()`` / ``read_resource(uri)`` back the server's
@@ -41,16 +42,23 @@ class AppBinding:
     uri: str
     html_file: str  # filename inside src/tp_mcp/apps/
     title: str
+    extra_tools: tuple[str, ...] = ()  # other tools rendered by the same UI
+
+    @property
+    def tool_names(self) -> tuple[str, ...]:
+        return (self.tool_name, *self.extra_tools)
 
 
 # Populated at import time by the register_app calls at the bottom of this file.
 APPS: dict[str, AppBinding] = {}
 
 
-def register_app(tool_name: str, uri: str, html_file: str, title: str) -> None:
+def register_app(
+    tool_name: str, uri: str, html_file: str, title: str, extra_tools: tuple[str, ...] = ()
+) -> None:
     if not uri.startswith("ui://"):
         raise ValueError(f"App resource URI must be ui://...: {uri!r}")
-    APPS[uri] = AppBinding(tool_name=tool_name, uri=uri, html_file=html_file, title=title)
+    APPS[uri] = AppBinding(tool_name=tool_name, uri=uri, html_file=html_file, title=title, extra_tools=extra_tools)
 
 
 def load_html(html_file: str) -> str:
@@ -64,7 +72,7 @@ def stamp_tools(tools: list[Tool]) -> None:
     Emits both the nested spec shape and the deprecated flat
     ``"ui/resourceUri"`` key some pre-GA hosts still read.
     """
-    by_tool = {b.tool_name: b for b in APPS.values()}
+    by_tool = {name: b for b in APPS.values() for name in b.tool_names}
     for tool in tools:
         binding = by_tool.get(tool.name)
         if binding is None:
@@ -96,7 +104,8 @@ def read_resource(uri: str) -> tuple[str, str] | None:
 # ---------------------------------------------------------------------------
 register_app("tp_get_fitness", "ui://trainingpeaks/pmc-chart.html", "pmc_chart.html", "Fitness chart (PMC)")
 register_app(
-    "tp_get_weekly_summary", "ui://trainingpeaks/weekly-summary.html", "weekly_summary.html", "Weekly summary card"
+    "tp_get_weekly_summary", "ui://trainingpeaks/weekly-summary.html", "weekly_summary.html", "Weekly summary card",
+    extra_tools=("tp_get_training_summary",),
 )
 register_app(
     "tp_get_workout", "ui://trainingpeaks/workout-structure.html", "workout_structure.html", "Workout structure viewer"
@@ -1,6 +1,6 @@
 """Cookie validation for TrainingPeaks authentication."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 import httpx
@@ -29,6 +29,9 @@ class AuthResult:
     user_id: int | None = None
     email: str | None = None
     message: str = ""
+    # The token obtained while validating, so callers can reuse it (never logged).
+    access_token: str | None = field(default=None, repr=False)
+    expires_in: float | None = None
 
     @property
     def is_valid(self) -> bool:
@@ -99,6 +102,8 @@ async def validate_auth(cookie: str) -> AuthResult:
                     user_id=user_id,
                     email=email,
                     message="Authentication valid",
+                    access_token=access_token,
+                    expires_in=token_info.get("expires_in", 3600) if access_token else None,
                 )
             elif response.status_code == 401:
                 return AuthResult(
@@ -3,16 +3,8 @@
 import getpass
 import sys
 
-from tp_mcp.auth import (
-    AuthStatus,
-    clear_credential,
-    get_credential,
-    get_storage_backend,
-    is_keyring_available,
-    store_credential,
-    validate_auth_sync,
-)
-from tp_mcp.auth.browser import extract_tp_cookie
+# Auth imports live in the commands that need them: ``tp-mcp serve`` should not
+# import the credential stores (keyring) before the MCP handshake.
 
 
 def cmd_auth(from_browser: str | None = None) -> int:
@@ -25,6 +17,9 @@ def cmd_auth(from_browser: str | None = None) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    from tp_mcp.auth import AuthStatus, get_credential, is_keyring_available, store_credential, validate_auth_sync
+    from tp_mcp.auth.browser import extract_tp_cookie
+
     print("TrainingPeaks MCP Authentication")
     print("=" * 40)
     print()
@@ -119,6 +114,8 @@ def cmd_auth_status() -> int:
     Returns:
         Exit code (0 for authenticated, 1 for not authenticated).
     """
+    from tp_mcp.auth import get_credential, get_storage_backend, validate_auth_sync
+
     cred = get_credential()
     if not cred.success or not cred.cookie:
         print("Not authenticated.")
@@ -146,6 +143,8 @@ def cmd_auth_clear() -> int:
     Returns:
         Exit code (0 for success).
     """
+    from tp_mcp.auth import clear_credential
+
     result = clear_credential()
     if result.success:
         print("Credentials cleared.")
@@ -154,15 +153,18 @@ def cmd_auth_clear() -> int:
     return 0
 
 
-def cmd_serve() -> int:
+def cmd_serve(profile: str | None = None) -> int:
     """Start the MCP server.
 
+    Args:
+        profile: Tool profile to serve (default: TP_MCP_PROFILE, else all tools).
+
     Returns:
         Exit code.
     """
     from tp_mcp.server import run_server
 
-    return run_server()
+    return run_server(profile=profile)
 
 
 def cmd_config() -> int:
@@ -211,12 +213,14 @@ def cmd_help() -> int:
     print("  auth-clear            Clear stored cookie")
     print("  config                Output Claude Desktop config snippet")
     print("  serve                 Start the MCP server")
+    print("    --profile X         Serve a tool subset (read-only, athlete, coach, strength, admin)")
     print("  help                  Show this help message")
     print()
     print("Examples:")
     print("  tp-mcp auth                      # Manual cookie entry")
     print("  tp-mcp auth --from-browser auto  # Auto-detect browser")
     print("  tp-mcp auth --from-browser chrome")
+    print("  tp-mcp serve --profile athlete   # Smaller tool list, no coach/account tools")
     print()
     return 0
 
@@ -245,11 +249,22 @@ def main() -> int:
                 return 1
         return cmd_auth(from_browser=from_browser)
 
+    if command == "serve":
+        args = sys.argv[2:]
+        profile = None
+        if "--profile" in args:
+            idx = args.index("--profile")
+            if idx + 1 < len(args):
+                profile = args[idx + 1]
+            else:
+                print("Error: --profile requires a profile name (read-only, athlete, coach, strength, admin)")
+                return 1
+        return cmd_serve(profile=profile)
+
     commands = {
         "auth-status": cmd_auth_status,
         "auth-clear": cmd_auth_clear,
         "config": cmd_config,
-        "serve": cmd_serve,
         "help": cmd_help,
         "--help": cmd_help,
         "-h": cmd_help,
@@ -1,32 +1,69 @@
-"""HTTP client module for TrainingPeaks API."""
+"""HTTP client module for TrainingPeaks API.
 
-from tp_mcp.client.http import (
-    APIError,
-    APIResponse,
-    AuthenticationError,
-    ErrorCode,
-    NotFoundError,
-    RateLimitError,
-    RawResponse,
-    TPClient,
-)
-from tp_mcp.client.models import (
-    AnalysisChannel,
-    AnalysisTotal,
-    PeakData,
-    PeaksResponse,
-    UserProfile,
-    WorkoutAnalysis,
-    WorkoutDetail,
-    WorkoutInterval,
-    WorkoutStructure,
-    WorkoutSummary,
-    parse_user_profile,
-    parse_workout_analysis,
-    parse_workout_detail,
-    parse_workout_list,
-    parse_workout_summary,
-)
+Names are resolved lazily, like ``tp_mcp.tools``: ``tp_mcp.client.context`` is
+imported by the server at startup and must not drag in httpx, the credential
+stores or the pydantic models with it.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tp_mcp.client.http import (
+        REFERENCE_TTL,
+        APIError,
+        APIResponse,
+        AuthenticationError,
+        ErrorCode,
+        NotFoundError,
+        RateLimitError,
+        RawResponse,
+        TPClient,
+    )
+    from tp_mcp.client.models import (
+        AnalysisChannel,
+        AnalysisTotal,
+        PeakData,
+        PeaksResponse,
+        UserProfile,
+        WorkoutAnalysis,
+        WorkoutDetail,
+        WorkoutInterval,
+        WorkoutStructure,
+        WorkoutSummary,
+        parse_user_profile,
+        parse_workout_analysis,
+        parse_workout_detail,
+        parse_workout_list,
+        parse_workout_summary,
+    )
+
+_EXPORTS: dict[str, str] = {
+    "APIError": "http",
+    "APIResponse": "http",
+    "AnalysisChannel": "models",
+    "AnalysisTotal": "models",
+    "AuthenticationError": "http",
+    "ErrorCode": "http",
+    "NotFoundError": "http",
+    "PeakData": "models",
+    "PeaksResponse": "models",
+    "REFERENCE_TTL": "http",
+    "RateLimitError": "http",
+    "RawResponse": "http",
+    "TPClient": "http",
+    "UserProfile": "models",
+    "WorkoutAnalysis": "models",
+    "WorkoutDetail": "models",
+    "WorkoutInterval": "models",
+    "WorkoutStructure": "models",
+    "WorkoutSummary": "models",
+    "parse_user_profile": "models",
+    "parse_workout_analysis": "models",
+    "parse_workout_detail": "models",
+    "parse_workout_list": "models",
+    "parse_workout_summary": "models",
+}
 
 __all__ = [
     "APIError",
@@ -38,6 +75,7 @@ __all__ = [
     "NotFoundError",
     "PeakData",
     "PeaksResponse",
+    "REFERENCE_TTL",
     "RateLimitError",
     "RawResponse",
     "TPClient",
@@ -53,3 +91,12 @@ __all__ = [
     "parse_workout_list",
     "parse_workout_summary",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
@@ -1,7 +1,70 @@
-"""Context variable for coach account athlete targeting."""
+"""Context variables scoped to one tool call: athlete targeting, progress and deadline."""
 
 import contextvars
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger("tp-mcp")
 
 athlete_override: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "athlete_override", default=None
 )
+
+# (progress, total, message) -> MCP notifications/progress. Set by the server
+# only when the caller passed a progressToken; unset everywhere else (tests, CLI).
+ProgressReporter = Callable[[float, float | None, str | None], Awaitable[None]]
+
+progress_reporter: contextvars.ContextVar[ProgressReporter | None] = contextvars.ContextVar(
+    "progress_reporter", default=None
+)
+
+
+async def report_progress(progress: float, total: float | None = None, message: str | None = None) -> None:
+    """Report progress for the current tool call; a no-op if nobody asked for it."""
+    reporter = progress_reporter.get()
+    if reporter is None:
+        return
+    try:
+        await reporter(progress, total, message)
+    except Exception:
+        # A dropped notification must never fail the operation it describes.
+        logger.debug("Progress notification failed", exc_info=True)
+
+
+# Deadline of the current tool call, on the ``time.monotonic()`` clock. Set by
+# the server per call; unset (no deadline) everywhere else.
+call_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "call_deadline", default=None
+)
+
+
+class DeadlineExceededError(TimeoutError):
+    """The current tool call ran out of time."""
+
+
+def time_remaining() -> float | None:
+    """Seconds left before the current call's deadline; None if it has none."""
+    deadline = call_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def request_timeout(default: float) -> float:
+    """HTTP timeout for one request: ``default``, capped by the call's remaining time."""
+    remaining = time_remaining()
+    if remaining is None:
+        return default
+    return max(0.0, min(default, remaining))
+
+
+def check_deadline() -> None:
+    """Raise ``DeadlineExceededError`` if the current call is out of time.
+
+    Multi-item tools call this between items so an expired call stops issuing
+    requests instead of letting each one time out in turn.
+    """
+    remaining = time_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError("Tool call deadline exceeded")
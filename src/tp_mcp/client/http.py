@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -10,6 +11,8 @@ from typing import Any
 import httpx
 
 from tp_mcp.auth import get_credential
+from tp_mcp.client.context import request_timeout
+from tp_mcp.client.roster import RosterIndex
 
 logger = logging.getLogger("tp-mcp")
 
@@ -18,6 +21,10 @@ DEFAULT_TIMEOUT = 30.0
 MIN_REQUEST_INTERVAL = 0.15  # 150ms between requests to avoid rate limiting
 TOKEN_ENDPOINT = "/users/v3/token"
 TOKEN_REFRESH_BUFFER = 60  # Refresh token 60s before expiry
+USER_DATA_TTL = 15 * 60  # Re-read /users/v3/user (roster) after 15 minutes
+ROSTER_MISS_REFRESH_INTERVAL = 60.0  # At most one forced roster refresh per minute on a name miss
+REFERENCE_TTL = 10 * 60  # Cached reference reads (settings, equipment, workout types)
+_ATHLETE_SCOPE = re.compile(r"/athletes/(\d+)/")
 
 
 class APIError(Exception):
@@ -55,6 +62,7 @@ class ErrorCode(Enum):
     VALIDATION_ERROR = "VALIDATION_ERROR"
     API_ERROR = "API_ERROR"
     NETWORK_ERROR = "NETWORK_ERROR"
+    TIMEOUT = "TIMEOUT"
     FORBIDDEN_ENDPOINT = "FORBIDDEN_ENDPOINT"
 
 
@@ -136,7 +144,36 @@ class TPClient:
     # Class-level caches: persist across instances within the MCP server process
     _cached_athlete_id: int | None = None
     _cached_user_data: dict | None = None
+    _cached_user_data_at: float = 0.0
+    _roster_index: RosterIndex | None = None
+    _last_roster_refresh: float = 0.0
     _shared_token_cache: TokenCache | None = None
+    # GET endpoint -> (monotonic fetch time, response); see get(cache_ttl=...)
+    _reference_cache: dict[str, tuple[float, APIResponse]] = {}
+    _reference_inflight: dict[str, asyncio.Future[APIResponse]] = {}
+
+    @classmethod
+    def invalidate_user_data(cls) -> None:
+        """Drop the cached user data, roster index and default athlete.
+
+        Called when the account behind the credential may have changed (e.g.
+        after tp_refresh_auth stores a new cookie); the next call refetches.
+        """
+        cls._cached_user_data = None
+        cls._cached_user_data_at = 0.0
+        cls._roster_index = None
+        cls._cached_athlete_id = None
+        cls._reference_cache.clear()
+
+    @classmethod
+    def _invalidate_reference(cls, endpoint: str) -> None:
+        """Drop cached reads for the athlete a write to ``endpoint`` touched."""
+        scope = _ATHLETE_SCOPE.search(endpoint)
+        if scope is None:
+            return
+        marker = scope.group(0)
+        for key in [k for k in cls._reference_cache if marker in k]:
+            del cls._reference_cache[key]
 
     @classmethod
     def _get_token_cache(cls) -> TokenCache:
@@ -145,6 +182,18 @@ class TPClient:
             cls._shared_token_cache = TokenCache()
         return cls._shared_token_cache
 
+    @classmethod
+    def seed_token(cls, access_token: str, expires_in: float) -> None:
+        """Cache an access token obtained outside the client (startup auth check).
+
+        A still-valid cached token is kept, so a seed never replaces a token a
+        tool call has just refreshed.
+        """
+        cache = cls._get_token_cache()
+        if not cache.is_valid():
+            cache.access_token = access_token
+            cache.expires_at = time.time() + expires_in
+
     def __init__(self, timeout: float = DEFAULT_TIMEOUT):
         """Initialize the client.
 
@@ -173,11 +222,18 @@ class TPClient:
             self._client = httpx.AsyncClient(timeout=self.timeout)
 
     async def _throttle(self) -> None:
-        """Enforce minimum interval between requests to avoid rate limiting."""
-        elapsed = time.monotonic() - self._last_request_time
-        if elapsed < MIN_REQUEST_INTERVAL:
-            await asyncio.sleep(MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request_time = time.monotonic()
+        """Enforce minimum interval between requests to avoid rate limiting.
+
+        Each caller reserves the next free send slot *before* sleeping, so
+        coroutines sharing one client (bulk tools fanning out with
+        asyncio.gather) are spaced MIN_REQUEST_INTERVAL apart instead of all
+        observing the same elapsed time and firing together.
+        """
+        now = time.monotonic()
+        slot = max(now, self._last_request_time + MIN_REQUEST_INTERVAL)
+        self._last_request_time = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -238,6 +294,7 @@ class TPClient:
                 method="GET",
                 url=url,
                 headers=headers,
+                timeout=request_timeout(self.timeout),
             )
 
             if response.status_code == 401:
@@ -338,6 +395,23 @@ class TPClient:
                          "Use the synthetic tp_apply_training_plan instead."),
             )
 
+        if method != "GET":
+            try:
+                return await self._send(method, endpoint, json, params, _retry_on_401)
+            finally:
+                # Any write may change the athlete's settings/equipment.
+                TPClient._invalidate_reference(endpoint)
+        return await self._send(method, endpoint, json, params, _retry_on_401)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | list[Any] | None,
+        params: dict[str, Any] | None,
+        _retry_on_401: bool,
+    ) -> APIResponse:
+        """Send one authenticated request (the body of ``_request``)."""
         await self._ensure_client()
         assert self._client is not None
 
@@ -348,6 +422,15 @@ class TPClient:
 
         await self._throttle()
 
+        # The tool call's deadline (if any) caps this request's timeout.
+        timeout = request_timeout(self.timeout)
+        if timeout <= 0:
+            return APIResponse(
+                success=False,
+                error_code=ErrorCode.TIMEOUT,
+                message="Tool call deadline exceeded before the request was sent.",
+            )
+
         url = f"{self.base_url}{endpoint}"
         headers = self._get_headers()
 
@@ -358,6 +441,7 @@ class TPClient:
                 headers=headers,
                 json=json,
                 params=params,
+                timeout=timeout,
             )
 
             # Handle 401 with retry logic
@@ -443,17 +527,51 @@ class TPClient:
             message=f"API error: {response.status_code}",
         )
 
-    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> APIResponse:
+    async def get(
+        self, endpoint: str, params: dict[str, Any] | None = None, *, cache_ttl: float | None = None,
+    ) -> APIResponse:
         """Make a GET request.
 
         Args:
             endpoint: API endpoint.
             params: Query parameters.
+            cache_ttl: Serve slow-changing reference data (settings, equipment,
+                workout types) from a process-wide cache for this many seconds.
+                Only successful responses are cached; concurrent callers share
+                one request; any write for the same athlete drops the entry.
+                Callers must not mutate the returned data.
 
         Returns:
             APIResponse.
         """
-        return await self._request("GET", endpoint, params=params)
+        if cache_ttl is None or params:
+            return await self._request("GET", endpoint, params=params)
+
+        hit = TPClient._reference_cache.get(endpoint)
+        if hit is not None and time.monotonic() - hit[0] < cache_ttl:
+            return hit[1]
+        pending = TPClient._reference_inflight.get(endpoint)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # this caller was cancelled, not the shared fetch
+                # The fetching caller went away (e.g. prefetch cancelled): fetch here.
+
+        future: asyncio.Future[APIResponse] = asyncio.get_running_loop().create_future()
+        TPClient._reference_inflight[endpoint] = future
+        try:
+            response = await self._request("GET", endpoint)
+            if response.success:
+                TPClient._reference_cache[endpoint] = (time.monotonic(), response)
+            future.set_result(response)
+            return response
+        finally:
+            if not future.done():
+                future.cancel()
+            if TPClient._reference_inflight.get(endpoint) is future:
+                del TPClient._reference_inflight[endpoint]
 
     async def post(self, endpoint: str, json: dict[str, Any] | list[Any] | None = None) -> APIResponse:
         """Make a POST request.
@@ -526,7 +644,9 @@ class TPClient:
         headers = {**self._get_headers(), "Accept": "*/*"}
 
         try:
-            response = await self._client.request("GET", url=url, headers=headers, params=params)
+            response = await self._client.request(
+                "GET", url=url, headers=headers, params=params, timeout=request_timeout(self.timeout)
+            )
 
             if response.status_code == 401:
                 self._token_cache.clear()
@@ -539,7 +659,9 @@ class TPClient:
                     )
                 await self._throttle()
                 headers = {**self._get_headers(), "Accept": "*/*"}
-                response = await self._client.request("GET", url=url, headers=headers, params=params)
+                response = await self._client.request(
+                    "GET", url=url, headers=headers, params=params, timeout=request_timeout(self.timeout)
+                )
 
         except httpx.TimeoutException:
             return RawResponse(
@@ -590,19 +712,73 @@ class TPClient:
         """Set the athlete ID."""
         self._athlete_id = value
 
-    async def _get_user_data(self) -> dict | None:
-        """Get user data, using class-level cache to avoid redundant API calls."""
-        if TPClient._cached_user_data is not None:
-            return TPClient._cached_user_data
+    async def _get_user_data(self, force_refresh: bool = False) -> dict | None:
+        """Get user data, using a class-level cache to avoid redundant API calls.
+
+        The cache expires after USER_DATA_TTL so athletes added to the roster
+        show up without a restart. If a refresh fails, the stale copy is kept.
+        """
+        cached = TPClient._cached_user_data
+        fresh = time.monotonic() - TPClient._cached_user_data_at < USER_DATA_TTL
+        if cached is not None and fresh and not force_refresh:
+            return cached
 
         response = await self.get("/users/v3/user")
         if not response.success or not response.data:
-            return None
+            return cached
 
         user_data = response.data.get("user", response.data)
         TPClient._cached_user_data = user_data
+        TPClient._cached_user_data_at = time.monotonic()
         return user_data
 
+    @staticmethod
+    def _roster(user_data: dict) -> RosterIndex:
+        """Roster index for ``user_data``, rebuilt only when the snapshot changes."""
+        index = TPClient._roster_index
+        if index is None or index.source is not user_data:
+            index = RosterIndex(user_data.get("athletes") or [], source=user_data)
+            TPClient._roster_index = index
+        return index
+
+    async def _refresh_roster_on_miss(self) -> dict | None:
+        """Re-read the roster after a lookup miss (a newly added athlete), at
+        most once per ROSTER_MISS_REFRESH_INTERVAL. None when throttled."""
+        now = time.monotonic()
+        if now - TPClient._last_roster_refresh < ROSTER_MISS_REFRESH_INTERVAL:
+            return None
+        TPClient._last_roster_refresh = now
+        return await self._get_user_data(force_refresh=True)
+
+    async def roster(self) -> RosterIndex | None:
+        """Indexed roster of the account; None if the user data cannot be read."""
+        user_data = await self._get_user_data()
+        return self._roster(user_data) if user_data else None
+
+    async def resolve_athletes(self, targets: list[str]) -> list[tuple[int | None, str | None]]:
+        """Resolve several athlete names or IDs against the roster in one pass.
+
+        Same matching rules as the ``athlete`` targeting parameter, but the
+        roster is read once for the whole list instead of once per target.
+
+        Returns:
+            One ``(athlete_id, error)`` pair per target, in input order.
+        """
+        user_data = await self._get_user_data()
+        if not user_data:
+            return [(None, "Could not load the account roster. Re-authenticate.")] * len(targets)
+
+        index = self._roster(user_data)
+        results = [index.lookup(target) for target in targets]
+        misses = [i for i, result in enumerate(results) if result.status == "missing"]
+        if misses:
+            refreshed = await self._refresh_roster_on_miss()
+            if refreshed:
+                index = self._roster(refreshed)
+                for i in misses:
+                    results[i] = index.lookup(targets[i])
+        return [(result.athlete_id, result.describe(target)) for target, result in zip(targets, results, strict=True)]
+
     async def ensure_athlete_id(self) -> int | None:
         """Get athlete ID, resolving coach athlete targeting via context var.
 
@@ -636,36 +812,12 @@ class TPClient:
         athlete_id = None
 
         if athlete is not None:
-            # Resolve by explicit athlete name or ID
-            try:
-                target_id = int(athlete)
-                for a in athletes:
-                    if a.get("athleteId") == target_id:
-                        athlete_id = target_id
-                        break
-            except ValueError:
-                # Search by name (case-insensitive), detecting ambiguity
-                search = athlete.lower()
-                matches = []
-                for a in athletes:
-                    first = (a.get("firstName") or "").lower()
-                    last = (a.get("lastName") or "").lower()
-                    full = f"{first} {last}"
-                    if search in (first, last, full):
-                        matches.append(a)
-
-                if len(matches) == 1:
-                    athlete_id = matches[0].get("athleteId")
-                elif len(matches) > 1:
-                    names = [
-                        f"{a.get('firstName', '')} {a.get('lastName', '')} (ID: {a.get('athleteId')})"
-                        for a in matches
-                    ]
-                    raise ValueError(
-                        f"Ambiguous athlete name '{athlete}' matches {len(matches)} athletes: "
-                        + ", ".join(names)
-                        + ". Use full name or athlete ID to disambiguate."
-                    ) from None
+            # Resolve by explicit athlete name or ID (indexed; raises on ambiguity)
+            athlete_id = self._roster(user_data).match(athlete)
+            if athlete_id is None:
+                refreshed = await self._refresh_roster_on_miss()
+                if refreshed:
+                    athlete_id = self._roster(refreshed).match(athlete)
         elif athletes:
             # Default: find the coach's own athlete entry
             for a in athletes:
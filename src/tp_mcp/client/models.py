@@ -114,6 +114,11 @@ class WorkoutSummary(BaseModel):
         """
         return _sport_from_type_value(self.workout_type)
 
+    @property
+    def is_planned(self) -> bool:
+        """Check if the workout was planned (any planned duration, TSS or distance)."""
+        return bool(self.duration_planned or self.tss_planned or self.distance_planned)
+
     @property
     def is_completed(self) -> bool:
         """Check if workout is completed."""
@@ -0,0 +1,108 @@
+"""Indexed coach roster for O(1) athlete resolution.
+
+``/users/v3/user`` returns the account's roster as a flat ``athletes`` list.
+Resolving an ``athlete`` argument used to scan and lowercase that list on every
+call; ``RosterIndex`` builds the lookup tables once per roster snapshot.
+
+Names are keyed by ``normalize_name``: accents stripped, case folded and
+whitespace collapsed, so "José  Núñez", "jose nunez" and "JOSE NUNEZ" all hit
+the same entry.
+"""
+
+import unicodedata
+from typing import Any, Literal, NamedTuple
+
+
+def normalize_name(value: str) -> str:
+    """Accent-, case- and whitespace-insensitive lookup key."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+def _display(athlete: dict[str, Any]) -> str:
+    return f"{athlete.get('firstName', '')} {athlete.get('lastName', '')} (ID: {athlete.get('athleteId')})"
+
+
+class RosterMatch(NamedTuple):
+    """Outcome of one roster lookup; ``candidates`` is set only when ambiguous."""
+
+    status: Literal["found", "missing", "ambiguous"]
+    athlete_id: int | None = None
+    candidates: tuple[dict[str, Any], ...] = ()
+
+    def describe(self, athlete: str) -> str | None:
+        """User-facing error for ``athlete``, or None when it was found."""
+        if self.status == "found":
+            return None
+        if self.status == "ambiguous":
+            return (
+                f"Ambiguous athlete name '{athlete}' matches {len(self.candidates)} athletes: "
+                + ", ".join(_display(a) for a in self.candidates)
+                + ". Use full name or athlete ID to disambiguate."
+            )
+        return f"Could not resolve athlete {athlete!r} in your roster."
+
+
+class RosterIndex:
+    """Lookup tables over one roster snapshot.
+
+    A name query matches an athlete whose full name, first name or last name
+    normalizes to the same key - the same rule the linear scan used, with
+    accent/whitespace folding on top.
+    """
+
+    def __init__(self, athletes: list[dict[str, Any]], source: object = None):
+        # ``source`` is the user-data dict this index was built from; TPClient
+        # rebuilds whenever its cached user data is a different object.
+        self.source = source
+        self.by_id: dict[int, dict[str, Any]] = {}
+        self.by_full_name: dict[str, list[dict[str, Any]]] = {}
+        self.by_name_token: dict[str, list[dict[str, Any]]] = {}
+        for athlete in athletes:
+            if not isinstance(athlete, dict):
+                continue
+            athlete_id = athlete.get("athleteId")
+            if isinstance(athlete_id, int):
+                self.by_id[athlete_id] = athlete
+            first = normalize_name(athlete.get("firstName") or "")
+            last = normalize_name(athlete.get("lastName") or "")
+            self.by_full_name.setdefault(f"{first} {last}".strip(), []).append(athlete)
+            for token in {first, last} - {""}:
+                self.by_name_token.setdefault(token, []).append(athlete)
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def lookup(self, athlete: str) -> RosterMatch:
+        """Resolve a name or ID against the roster."""
+        try:
+            target_id = int(athlete)
+        except ValueError:
+            pass
+        else:
+            return RosterMatch("found", target_id) if target_id in self.by_id else RosterMatch("missing")
+
+        key = normalize_name(athlete)
+        if not key:
+            return RosterMatch("missing")
+        matches: dict[Any, dict[str, Any]] = {}
+        for candidate in self.by_full_name.get(key, []) + self.by_name_token.get(key, []):
+            matches.setdefault(candidate.get("athleteId"), candidate)
+
+        if len(matches) == 1:
+            return RosterMatch("found", next(iter(matches.values())).get("athleteId"))
+        if len(matches) > 1:
+            return RosterMatch("ambiguous", candidates=tuple(matches.values()))
+        return RosterMatch("missing")
+
+    def match(self, athlete: str) -> int | None:
+        """Resolve a name or ID to an athleteId; None when nothing matches.
+
+        Raises:
+            ValueError: If a name matches more than one athlete.
+        """
+        result = self.lookup(athlete)
+        if result.status == "ambiguous":
+            raise ValueError(result.describe(athlete))
+        return result.athlete_id
@@ -0,0 +1,137 @@
+"""Wire encoding of tool results.
+
+Results used to go out as ``json.dumps(result, indent=2)`` text. For large
+results (daily PMC series, 90-day workout lists, metrics dumps) the indentation
+alone added 30-50% to the payload, which the host then re-parses and the model
+reads as tokens.
+
+``TP_MCP_OUTPUT`` picks the shape of a ``tools/call`` result:
+
+- ``text`` (default): compact JSON text;
+- ``pretty``: indented JSON text (the old format);
+- ``both``: compact JSON text plus MCP ``structuredContent``;
+- ``structured``: ``structuredContent`` only, for hosts that read it directly.
+
+JSON is encoded with orjson when it is installed (``pip install tp-mcp[fast]``),
+the stdlib otherwise; ``TP_MCP_JSON=stdlib`` forces the stdlib encoder.
+
+``to_columns`` is the opt-in ``format="columns"`` encoding of row lists (see
+``server._COLUMNAR_LISTS``): one array per key instead of one object per row,
+so a year of daily PMC data stops repeating its five key names 365 times.
+"""
+
+import functools
+import itertools
+import json
+import logging
+import os
+import re
+from datetime import date
+from types import ModuleType
+from typing import Any
+
+from mcp.types import CallToolResult, TextContent
+
+logger = logging.getLogger("tp-mcp")
+
+OUTPUT_ENV = "TP_MCP_OUTPUT"
+JSON_ENV = "TP_MCP_JSON"
+OUTPUT_MODES = ("text", "pretty", "both", "structured")
+DEFAULT_OUTPUT = "text"
+
+_ENCODE_FAILED = {
+    "isError": True,
+    "error_code": "API_ERROR",
+    "message": "An internal error occurred. Check server logs.",
+}
+
+
+def output_mode() -> str:
+    """The configured ``TP_MCP_OUTPUT`` mode (unknown values fall back to the default)."""
+    mode = os.environ.get(OUTPUT_ENV, DEFAULT_OUTPUT).strip().lower()
+    if mode not in OUTPUT_MODES:
+        logger.warning("Ignoring unknown %s=%r", OUTPUT_ENV, mode)
+        return DEFAULT_OUTPUT
+    return mode
+
+
+@functools.cache
+def _orjson() -> ModuleType | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def dumps(value: Any, *, pretty: bool = False) -> str:
+    """Serialise ``value`` to JSON text, compact unless ``pretty``.
+
+    Raises:
+        TypeError / ValueError: ``value`` is not JSON-serialisable.
+    """
+    fast = _orjson() if os.environ.get(JSON_ENV, "").strip().lower() != "stdlib" else None
+    if fast is not None:
+        option = fast.OPT_NON_STR_KEYS | (fast.OPT_INDENT_2 if pretty else 0)
+        try:
+            return fast.dumps(value, option=option).decode()
+        except TypeError:
+            pass  # e.g. an int beyond 64 bits - the stdlib encoder handles it
+    if pretty:
+        return json.dumps(value, indent=2)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _dumps_result(result: Any, pretty: bool) -> str:
+    try:
+        return dumps(result, pretty=pretty)
+    except (TypeError, ValueError):
+        logger.exception("Tool result is not JSON-serialisable")
+        return dumps(_ENCODE_FAILED, pretty=pretty)
+
+
+def text_content(result: Any) -> list[TextContent]:
+    """``result`` as one JSON ``TextContent`` (pretty in ``pretty`` mode)."""
+    return [TextContent(type="text", text=_dumps_result(result, output_mode() == "pretty"))]
+
+
+def call_result(result: Any) -> CallToolResult:
+    """The ``tools/call`` result for ``result`` in the configured output mode."""
+    mode = output_mode()
+    if mode in ("text", "pretty"):
+        return CallToolResult(content=list(text_content(result)))
+    # structuredContent must be a JSON object.
+    structured = result if isinstance(result, dict) else {"result": result}
+    content = [] if mode == "structured" else text_content(result)
+    return CallToolResult(content=list(content), structured_content=structured)
+
+
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _delta_dates(values: list[Any]) -> dict[str, Any] | None:
+    """``{"start", "deltas"}`` (day gaps) for a column of ISO dates, else None."""
+    if not values or not all(isinstance(v, str) and _ISO_DATE.match(v) for v in values):
+        return None
+    try:
+        days = [date.fromisoformat(v).toordinal() for v in values]
+    except ValueError:
+        return None
+    return {"start": values[0], "deltas": [b - a for a, b in itertools.pairwise(days)]}
+
+
+def to_columns(rows: list[Any]) -> dict[str, Any]:
+    """Rows of dicts -> ``{key: [value per row]}``.
+
+    Keys are the union over all rows in first-seen order; a row without a key
+    contributes null. A column holding only ISO dates is delta-encoded as
+    ``{"start": "YYYY-MM-DD", "deltas": [days since previous row, ...]}`` -
+    a daily series becomes a start date and a run of 1s.
+    """
+    keys = dict.fromkeys(k for row in rows for k in row)
+    columns: dict[str, Any] = {k: [row.get(k) for row in rows] for k in keys}
+    for key, values in columns.items():
+        encoded = _delta_dates(values)
+        if encoded is not None:
+            columns[key] = encoded
+    return columns
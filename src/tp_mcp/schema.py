@@ -0,0 +1,153 @@
+"""Tool-argument validation compiled from each tool's ``inputSchema``.
+
+SDK v2 dispatches ``tools/call`` without validating arguments, so a wrong type
+used to reach the tool and fail there - as a pydantic error, an internal error,
+or after the token exchange and the first API request. ``compile_schema`` turns
+a schema into a validator once, at import, so each call is checked in
+microseconds before anything else happens.
+
+Only the keywords the tool schemas use are supported: ``type`` (a name or a
+list of names), ``enum``, ``minimum``, ``maximum``, ``properties``,
+``required`` and ``items``. Annotations (``description``, ``default``) are
+ignored, and so are unknown properties, as in JSON Schema.
+
+An optional property may be ``null``, which the tools treat as omitted, and
+an integral float (``42.0``) is a valid ``integer``, as in JSON Schema; it is
+passed on as an int.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+# (value, path) -> value, converted where needed. Raises SchemaError.
+_Check = Callable[[Any, str], Any]
+
+
+class SchemaError(ValueError):
+    """An argument does not match its schema; the message names the argument."""
+
+
+def _describe(path: str) -> str:
+    return path or "arguments"
+
+
+def _fail(path: str, expected: str, value: Any) -> SchemaError:
+    got = "null" if value is None else type(value).__name__
+    return SchemaError(f"{_describe(path)}: expected {expected}, got {got}")
+
+
+def _number(value: Any, integer: bool) -> int | float | None:
+    """``value`` if it is a JSON number of the right kind (as an int for integers), else None."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    if integer and isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    return value
+
+
+def _type_check(types: list[str]) -> _Check:
+    names = " or ".join(types)
+    plain: tuple[type, ...] = tuple(
+        t for name, t in (("string", str), ("object", dict), ("array", list), ("boolean", bool)) if name in types
+    )
+    numeric = "integer" if "integer" in types else "number" if "number" in types else None
+    allows_null = "null" in types
+
+    def check(value: Any, path: str) -> Any:
+        if isinstance(value, plain) or (value is None and allows_null):
+            return value
+        if numeric is not None:
+            converted = _number(value, numeric == "integer")
+            if converted is not None:
+                return converted
+        raise _fail(path, names, value)
+
+    return check
+
+
+def _compile(schema: dict[str, Any]) -> _Check:
+    checks: list[_Check] = []
+
+    declared = schema.get("type")
+    if declared is not None:
+        checks.append(_type_check([declared] if isinstance(declared, str) else list(declared)))
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value: Any, path: str) -> Any:
+            if value not in allowed:
+                raise SchemaError(f"{_describe(path)}: must be one of {', '.join(map(str, allowed))}")
+            return value
+
+        checks.append(check_enum)
+
+    low, high = schema.get("minimum"), schema.get("maximum")
+    if low is not None or high is not None:
+
+        def check_range(value: Any, path: str) -> Any:
+            if isinstance(value, bool) or not isinstance(value, int | float):
+                return value
+            if (low is not None and value < low) or (high is not None and value > high):
+                bounds = f"from {low} to {high}" if low is not None and high is not None else (
+                    f"at least {low}" if low is not None else f"at most {high}")
+                raise SchemaError(f"{_describe(path)}: must be {bounds}, got {value}")
+            return value
+
+        checks.append(check_range)
+
+    properties = {name: _compile(sub) for name, sub in schema.get("properties", {}).items()}
+    required = list(schema.get("required", []))
+    if properties or required:
+
+        def check_object(value: Any, path: str) -> Any:
+            if not isinstance(value, dict):
+                return value
+            missing = [name for name in required if name not in value]
+            if missing:
+                prefix = f"{path}: " if path else ""
+                raise SchemaError(f"{prefix}missing required argument(s): {', '.join(missing)}")
+            checked = dict(value)
+            for name, item in value.items():
+                check = properties.get(name)
+                if check is None or (item is None and name not in required):
+                    continue
+                checked[name] = check(item, f"{path}.{name}" if path else name)
+            return checked
+
+        checks.append(check_object)
+
+    if "items" in schema:
+        check_item = _compile(schema["items"])
+
+        def check_array(value: Any, path: str) -> Any:
+            if not isinstance(value, list):
+                return value
+            return [check_item(item, f"{_describe(path)}[{i}]") for i, item in enumerate(value)]
+
+        checks.append(check_array)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str) -> Any:
+        for check in checks:
+            value = check(value, path)
+        return value
+
+    return check_all
+
+
+def compile_schema(schema: dict[str, Any]) -> Callable[[Any], Any]:
+    """Compile ``schema`` into ``validate(value) -> value``.
+
+    ``validate`` returns ``value`` with integral floats converted (objects
+    with ``properties`` and arrays with ``items`` come back as copies) and
+    raises ``SchemaError`` for the first mismatch.
+    """
+    check = _compile(schema)
+
+    def validate(value: Any) -> Any:
+        return check(value, "")
+
+    return validate
@@ -1,10 +1,15 @@
 """MCP Server implementation for TrainingPeaks."""
 
 import asyncio
+import base64
+import contextlib
+import functools
+import hashlib
 import json
 import logging
 import os
 import sys
+import time
 from typing import Any
 
 from mcp.server import Server, ServerRequestContext
@@ -24,98 +29,10 @@ from mcp.types import (
     ToolAnnotations,
 )
 
-from tp_mcp import __version__, apps
-from tp_mcp.auth import get_credential, validate_auth
-from tp_mcp.client.context import athlete_override
-from tp_mcp.tools import (
-    tp_add_athletes_to_group,
-    tp_add_note_comment,
-    tp_add_workout_comment,
-    tp_analyze_workout,
-    tp_apply_training_plan,
-    tp_auth_status,
-    tp_copy_workout,
-    tp_create_availability,
-    tp_create_equipment,
-    tp_create_event,
-    tp_create_group,
-    tp_create_library,
-    tp_create_library_item,
-    tp_create_note,
-    tp_create_strength_workout,
-    tp_create_workout,
-    tp_create_zones,
-    tp_delete_availability,
-    tp_delete_equipment,
-    tp_delete_event,
-    tp_delete_group,
-    tp_delete_library,
-    tp_delete_note,
-    tp_delete_strength_workout,
-    tp_delete_workout,
-    tp_delete_workout_file,
-    tp_download_workout_file,
-    tp_get_athlete_settings,
-    tp_get_atp,
-    tp_get_availability,
-    tp_get_equipment,
-    tp_get_events,
-    tp_get_fitness,
-    tp_get_focus_event,
-    tp_get_libraries,
-    tp_get_library_item,
-    tp_get_library_items,
-    tp_get_metrics,
-    tp_get_next_event,
-    tp_get_note,
-    tp_get_note_comments,
-    tp_get_nutrition,
-    tp_get_peaks,
-    tp_get_pool_length_settings,
-    tp_get_profile,
-    tp_get_strength_summary,
-    tp_get_strength_workout,
-    tp_get_strength_workouts,
-    tp_get_training_plan,
-    tp_get_training_plan_workouts,
-    tp_get_weekly_summary,
-    tp_get_workout,
-    tp_get_workout_comments,
-    tp_get_workout_note,
-    tp_get_workout_prs,
-    tp_get_workout_types,
-    tp_get_workouts,
-    tp_get_zone_methods,
-    tp_list_athletes,
-    tp_list_athletes_in_group,
-    tp_list_groups,
-    tp_list_notes,
-    tp_list_training_plans,
-    tp_log_metrics,
-    tp_pair_workout,
-    tp_refresh_auth,
-    tp_remove_athletes_from_group,
-    tp_rename_group,
-    tp_reorder_workouts,
-    tp_schedule_library_workout,
-    tp_search_exercises,
-    tp_set_workout_note,
-    tp_unpair_workout,
-    tp_update_equipment,
-    tp_update_event,
-    tp_update_ftp,
-    tp_update_hr_zones,
-    tp_update_library_item,
-    tp_update_note,
-    tp_update_nutrition,
-    tp_update_speed_zones,
-    tp_update_strength_workout,
-    tp_update_workout,
-    tp_upload_workout_file,
-    tp_validate_structure,
-)
-from tp_mcp.tools.events import EVENT_TYPES
-from tp_mcp.tools.workouts import SPORT_TYPE_MAP
+from tp_mcp import __version__, apps, output, tools
+from tp_mcp.client.context import DeadlineExceededError, athlete_override, call_deadline, progress_reporter
+from tp_mcp.schema import SchemaError, compile_schema
+from tp_mcp.tools._constants import EVENT_TYPES, SPORT_TYPE_MAP
 
 # Configure logging to stderr (stdout is used for MCP protocol)
 logging.basicConfig(
@@ -353,6 +270,88 @@ TOOLS = [
                     "items": {"type": "integer"},
                     "description": "Workout IDs in desired display order",
                 },
+                "date": {
+                    "type": "string",
+                    "description": (
+                        "Day the workouts are on (YYYY-MM-DD). Optional - read from the first workout if omitted."
+                    ),
+                },
+            },
+            "required": ["workout_ids"],
+        },
+    ),
+    Tool(
+        name="tp_bulk_create_workouts",
+        description=(
+            "Create many planned workouts in one call (max 100). Each entry takes the same fields as "
+            "tp_create_workout. All entries are validated first - one invalid entry rejects the batch and "
+            "nothing is written. Returns created (with workout IDs) and per-item failed lists."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "workouts": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "description": "Same fields as tp_create_workout",
+                        "required": ["date", "sport", "title"],
+                    },
+                    "description": "Workout definitions to create",
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "Validate and preview without creating anything (default false)",
+                },
+            },
+            "required": ["workouts"],
+        },
+    ),
+    Tool(
+        name="tp_bulk_update_workouts",
+        description=(
+            "Update many workouts in one call (max 100). Each entry takes the same fields as "
+            "tp_update_workout (workout_id plus fields to change). All entries are validated first - one "
+            "invalid entry rejects the batch. Returns updated and per-item failed lists."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "updates": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "description": "Same fields as tp_update_workout",
+                        "required": ["workout_id"],
+                    },
+                    "description": "Updates to apply, one entry per workout",
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "Validate and preview without writing anything (default false)",
+                },
+            },
+            "required": ["updates"],
+        },
+    ),
+    Tool(
+        name="tp_bulk_delete_workouts",
+        description=(
+            "Delete many workouts in one call (max 100). Permanent. A malformed or repeated ID rejects the "
+            "batch. Returns deleted and per-item failed lists; use dry_run to preview."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "workout_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Workout IDs to delete",
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "Validate and preview without deleting anything (default false)",
+                },
             },
             "required": ["workout_ids"],
         },
@@ -551,7 +550,10 @@ TOOLS = [
     # --- Fitness & Summary ---
     Tool(
         name="tp_get_fitness",
-        description="Get fitness/fatigue trend (CTL/ATL/TSB). Supports historical date ranges.",
+        description=(
+            "Get fitness/fatigue trend (CTL/ATL/TSB). Supports historical and multi-year (career) ranges. "
+            "Daily TSS is cached and the chart computed locally, so custom constants/seeds are cheap."
+        ),
         input_schema={
             "type": "object",
             "properties": {
@@ -561,6 +563,19 @@ TOOLS = [
                 },
                 "start_date": {"type": "string", "description": "YYYY-MM-DD"},
                 "end_date": {"type": "string", "description": "YYYY-MM-DD"},
+                "atl_constant": {"type": "integer", "default": 7, "description": "ATL time constant (days)"},
+                "ctl_constant": {"type": "integer", "default": 42, "description": "CTL time constant (days)"},
+                "atl_start": {"type": "number", "description": "ATL seed before the range; turns off history seeding"},
+                "ctl_start": {"type": "number", "description": "CTL seed before the range; turns off history seeding"},
+                "years": {
+                    "type": "integer", "minimum": 1, "maximum": 20,
+                    "description": "Multi-year history ending today; overrides days. Ignored if dates provided.",
+                },
+                "seed_from_history": {
+                    "type": "boolean",
+                    "description": "Seed CTL/ATL from prior TSS (default, unless atl_start/ctl_start given); "
+                                   "false starts the range at 0",
+                },
             },
             "required": [],
         },
@@ -579,6 +594,89 @@ TOOLS = [
             "required": [],
         },
     ),
+    Tool(
+        name="tp_get_training_summary",
+        description=(
+            "Hours, TSS and distance per week or month (optionally per sport) with end-of-period CTL/ATL/TSB, "
+            "from one range fetch. Use instead of calling tp_get_weekly_summary once per week."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "weeks": {
+                    "type": "integer", "minimum": 1, "maximum": 104,
+                    "description": "Weeks ending with the current one (default 12). Omit when giving dates.",
+                },
+                "start_date": {"type": "string", "description": "YYYY-MM-DD (with end_date, up to 731 days)"},
+                "end_date": {"type": "string", "description": "YYYY-MM-DD"},
+                "group_by": {"type": "string", "enum": ["week", "month"], "default": "week"},
+                "by_sport": {
+                    "type": "boolean", "default": True,
+                    "description": "Break each period down per sport",
+                },
+            },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="tp_get_compliance",
+        description=(
+            "Planned-vs-completed compliance for a date range (up to 366 days). Returns session counts "
+            "(planned/completed/missed/unplanned) and duration/TSS/distance planned vs actual with compliance %, "
+            "as totals, per sport and per Monday-based week. Computed server-side from one bulk fetch."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "start_date": {"type": "string", "description": "YYYY-MM-DD"},
+                "end_date": {"type": "string", "description": "YYYY-MM-DD"},
+                "include_days": {
+                    "type": "boolean",
+                    "description": "Also return the per-day, per-sport breakdown (default false)",
+                },
+            },
+            "required": ["start_date", "end_date"],
+        },
+    ),
+    Tool(
+        name="tp_project_fitness",
+        description=(
+            "Project CTL/ATL/TSB day by day from today to a target date (default: the focus event) using "
+            "planned workouts, then ATP weekly volumes for unplanned weeks. Evaluates several taper "
+            "scenarios in one call and returns each one's fitness/fatigue/form on the target date."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "until_date": {
+                    "type": "string",
+                    "description": "Target date YYYY-MM-DD (up to 366 days ahead). Defaults to the focus event.",
+                },
+                "scenarios": {
+                    "type": "array",
+                    "description": (
+                        "Up to 10 taper scenarios. Each scales the projected load to load_pct over the last "
+                        "taper_days days. Default: as planned, 7d@50%, 10d@60%, 14d@70%."
+                    ),
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "taper_days": {"type": "integer", "minimum": 0},
+                            "load_pct": {"type": "number", "minimum": 0, "maximum": 200},
+                        },
+                    },
+                },
+                "atl_constant": {"type": "integer", "default": 7, "description": "ATL time constant (days)"},
+                "ctl_constant": {"type": "integer", "default": 42, "description": "CTL time constant (days)"},
+                "include_daily": {
+                    "type": "boolean",
+                    "description": "Also return each scenario's daily series (default false)",
+                },
+            },
+            "required": [],
+        },
+    ),
     Tool(
         name="tp_get_atp",
         description="Get Annual Training Plan - weekly TSS targets, training periods, races. Max 90 days.",
@@ -591,6 +689,21 @@ TOOLS = [
             "required": ["start_date", "end_date"],
         },
     ),
+    Tool(
+        name="tp_get_atp_compliance",
+        description=(
+            "Season review: ATP weekly TSS volume vs actual TSS and hours, joined by ISO week, with "
+            "deviation per week, per ATP period (Base/Build/Peak...) and for the season. Up to 366 days."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "start_date": {"type": "string", "description": "YYYY-MM-DD"},
+                "end_date": {"type": "string", "description": "YYYY-MM-DD"},
+            },
+            "required": ["start_date", "end_date"],
+        },
+    ),
     # --- Training Plans (multi-week Plan Store / "My Plans" — distinct from
     #     workout libraries and the ATP) ---
     Tool(
@@ -627,13 +740,28 @@ TOOLS = [
         name="tp_apply_training_plan",
         description="Apply a training plan to an athlete's calendar from a start date "
                     "by copying each plan workout (with structure) to start_date + its "
-                    "relative day. Targets the athlete given via the athlete parameter.",
+                    "relative day. Targets the athlete given via the athlete parameter. "
+                    "Resumable: rerunning the same plan/athlete/start_date only creates "
+                    "workouts that are not already on the calendar. Pass athletes or "
+                    "group_id to apply to many athletes in one call.",
         input_schema={
             "type": "object",
             "properties": {
                 "plan_id": {"type": "integer", "description": "Plan id"},
                 "start_date": {"type": "string", "description": "Calendar date for plan day 1 (YYYY-MM-DD)"},
                 "athlete": {"type": "string", "description": "Target athlete name or ID (coach accounts)"},
+                "athletes": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Bulk mode (coach accounts): athlete names or IDs to apply the plan to. "
+                        "Returns per-athlete results. Mutually exclusive with 'athlete' and 'group_id'."
+                    ),
+                },
+                "group_id": {
+                    "type": "string",
+                    "description": "Bulk mode: apply to every athlete in this group (from tp_list_groups)",
+                },
             },
             "required": ["plan_id", "start_date"],
         },
@@ -1244,7 +1372,10 @@ TOOLS = [
         input_schema={
             "type": "object",
             "properties": {
-                "query": {"type": "string", "description": "Exercise name substring (case-insensitive)."},
+                "query": {
+                    "type": "string",
+                    "description": "Exercise name or part of it (case-insensitive, typo-tolerant; DB/KB/BB/RDL ok).",
+                },
                 "limit": {"type": "integer", "description": "Max results, 1-100 (default 20)."},
                 "muscle_group": {
                     "type": "string",
@@ -1403,6 +1534,28 @@ TOOLS = [
             "required": ["group_id"],
         },
     ),
+    Tool(
+        name="tp_get_group_dashboard",
+        description=(
+            "Squad dashboard for one athlete group: one row per athlete with CTL/ATL/TSB, "
+            "trailing 7-day TSS and planned-vs-completed compliance % over the last N days. "
+            "Fetched concurrently for the whole group in one call. Use tp_list_groups to get group_id."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "group_id": {
+                    "type": "string",
+                    "description": "Group (tag) ID from tp_list_groups.",
+                },
+                "days": {
+                    "type": "integer",
+                    "description": "Compliance window ending today, 1-90 (default 7).",
+                },
+            },
+            "required": ["group_id"],
+        },
+    ),
     Tool(
         name="tp_create_group",
         description="Create a new athlete group.",
@@ -1471,6 +1624,41 @@ TOOLS = [
             "required": ["group_id", "athlete_ids"],
         },
     ),
+    # --- Batching ---
+    Tool(
+        name="tp_batch",
+        description=(
+            "Run several independent read-only tool calls in one request (max 20). Entries run concurrently "
+            "and results come back in input order, each as {name, result}; a failing entry does not fail the "
+            "batch. Use it to gather information in one step instead of many sequential calls. Write tools "
+            "cannot be batched. Per-entry 'athlete' targets that entry; otherwise the batch's athlete applies."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Read-only tool name"},
+                            "arguments": {"type": "object", "description": "That tool's arguments"},
+                            "athlete": {"type": "string", "description": "Target athlete for this entry"},
+                        },
+                        "required": ["name"],
+                    },
+                    "description": "Tool calls to run",
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 8,
+                    "description": "Calls in flight at once (default 4)",
+                },
+            },
+            "required": ["calls"],
+        },
+    ),
 ]
 
 # ---------------------------------------------------------------------------
@@ -1484,7 +1672,7 @@ _ATHLETE_EXEMPT_TOOLS = {
     # Offline exercise-library search — not athlete-scoped.
     "tp_search_exercises",
     # Coach-scoped (groups belong to the coach, not a targeted athlete).
-    "tp_list_groups", "tp_list_athletes_in_group",
+    "tp_list_groups", "tp_list_athletes_in_group", "tp_get_group_dashboard",
     "tp_create_group", "tp_rename_group", "tp_delete_group",
     "tp_add_athletes_to_group", "tp_remove_athletes_from_group",
 }
@@ -1499,6 +1687,67 @@ for _tool in TOOLS:
         _tool.input_schema["properties"]["athlete"] = _ATHLETE_PARAM
 
 
+# ---------------------------------------------------------------------------
+# Result shaping: field projection + pagination for large list results
+#
+# Tools listed here return {<list key>: [...], "count": n, ...}. They accept
+# three extra arguments, handled in _run_tool rather than by each tool:
+# ``fields`` keeps only those keys of each item, ``limit`` caps the page size
+# and ``cursor`` (the previous page's ``next_cursor``) resumes after it. A page
+# re-runs the query; the cursor records the offset plus a fingerprint of the
+# query, so it cannot be replayed against different arguments.
+# ---------------------------------------------------------------------------
+_SHAPED_LISTS = {
+    "tp_get_workouts": "workouts",
+    "tp_get_metrics": "metrics",
+    "tp_get_events": "events",
+    "tp_list_notes": "notes",
+    "tp_get_training_plan_workouts": "workouts",
+}
+MAX_PAGE_SIZE = 500
+
+_SHAPING_PARAMS = {
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Return only these keys of each item (e.g. [\"date\", \"title\", \"tss\"]). Omit for all.",
+    },
+    "limit": {
+        "type": "integer",
+        "minimum": 1,
+        "maximum": MAX_PAGE_SIZE,
+        "description": "Page size. When more items remain the result includes next_cursor.",
+    },
+    "cursor": {"type": "string", "description": "next_cursor from the previous page of the same query"},
+}
+
+for _tool in TOOLS:
+    if _tool.name in _SHAPED_LISTS:
+        _tool.input_schema["properties"].update(_SHAPING_PARAMS)
+
+# Time-series tools that can return their rows column-wise (format="columns",
+# see output.to_columns). Applied after fields/limit/cursor.
+_COLUMNAR_LISTS = {
+    "tp_get_fitness": "daily_data",
+    "tp_get_metrics": "metrics",
+    "tp_get_nutrition": "nutrition",
+    "tp_get_workouts": "workouts",
+}
+
+_FORMAT_PARAM = {
+    "type": "string",
+    "enum": ["rows", "columns"],
+    "description": (
+        "rows (default): a list of objects. columns: one array per field, far smaller for long ranges; "
+        "all-date columns become {start, deltas} with deltas in days."
+    ),
+}
+
+for _tool in TOOLS:
+    if _tool.name in _COLUMNAR_LISTS:
+        _tool.input_schema["properties"]["format"] = _FORMAT_PARAM
+
+
 # ---------------------------------------------------------------------------
 # Tool metadata: display titles + behaviour annotations
 #
@@ -1510,11 +1759,12 @@ for _tool in TOOLS:
 # ---------------------------------------------------------------------------
 
 _READ_ONLY_PREFIXES = ("tp_get_", "tp_list_", "tp_download_", "tp_search_", "tp_validate_", "tp_analyze_")
-_READ_ONLY_EXTRA = {"tp_auth_status"}
+_READ_ONLY_EXTRA = {"tp_auth_status", "tp_batch", "tp_project_fitness"}
 
 # Irrecoverable data removal. Everything else that writes is recoverable by a
 # follow-up call (update/re-add), so destructiveHint stays False there.
 _DESTRUCTIVE_TOOLS = {
+    "tp_bulk_delete_workouts",
     "tp_delete_availability",
     "tp_delete_equipment",
     "tp_delete_event",
@@ -1534,6 +1784,7 @@ _NON_IDEMPOTENT_WRITES = {
     "tp_add_note_comment",
     "tp_add_workout_comment",
     "tp_apply_training_plan",
+    "tp_bulk_create_workouts",
     "tp_copy_workout",
     "tp_create_availability",
     "tp_create_equipment",
@@ -1573,10 +1824,76 @@ for _tool in TOOLS:
         open_world_hint=True,  # every tool talks to the external TrainingPeaks API
     )
 
+# tp_batch runs only read-only tools (see tools/batch.py), and never itself.
+_BATCHABLE_TOOLS = frozenset(
+    _tool.name for _tool in TOOLS if _tool.annotations.read_only_hint and _tool.name != "tp_batch"
+)
+
+
+# ---------------------------------------------------------------------------
+# Tool profiles: serve a subset of TOOLS to keep tools/list (and the model's
+# context) small. Selected with TP_MCP_PROFILE or `tp-mcp serve --profile`;
+# tools outside the active profile are neither listed nor callable.
+# ---------------------------------------------------------------------------
+PROFILE_ENV = "TP_MCP_PROFILE"
+DEFAULT_PROFILE = "admin"
+
+_AUTH_TOOLS = {"tp_auth_status", "tp_refresh_auth"}
+# Coach-account tools: roster, groups and authored training plans.
+_COACH_TOOLS = {
+    "tp_list_athletes",
+    "tp_list_groups", "tp_list_athletes_in_group", "tp_get_group_dashboard", "tp_create_group",
+    "tp_rename_group", "tp_delete_group", "tp_add_athletes_to_group", "tp_remove_athletes_from_group",
+    "tp_list_training_plans", "tp_get_training_plan", "tp_get_training_plan_workouts", "tp_apply_training_plan",
+}
+# Account set-up that is rarely part of day-to-day training conversations.
+_ACCOUNT_TOOLS = {
+    "tp_create_zones", "tp_update_nutrition",
+    "tp_create_equipment", "tp_update_equipment", "tp_delete_equipment",
+    "tp_create_library", "tp_delete_library",
+}
+_STRENGTH_TOOLS = {
+    "tp_search_exercises", "tp_create_strength_workout", "tp_get_strength_summary", "tp_get_strength_workouts",
+    "tp_get_strength_workout", "tp_update_strength_workout", "tp_delete_strength_workout",
+    "tp_get_profile", "tp_get_workouts", "tp_get_workout",
+}
+
+_ALL_TOOLS = frozenset(_tool.name for _tool in TOOLS)
+TOOL_PROFILES: dict[str, frozenset[str]] = {
+    "read-only": frozenset(_tool.name for _tool in TOOLS if _tool.annotations.read_only_hint),
+    "athlete": _ALL_TOOLS - _COACH_TOOLS - _ACCOUNT_TOOLS,
+    "coach": _ALL_TOOLS - _ACCOUNT_TOOLS,
+    "strength": frozenset(_STRENGTH_TOOLS | _AUTH_TOOLS),
+    "admin": _ALL_TOOLS,
+}
+
+_profile = DEFAULT_PROFILE
+
+
+def set_profile(name: str | None = None) -> str:
+    """Select the tool profile to serve (``None``: ``TP_MCP_PROFILE``, else the default).
+
+    Raises:
+        ValueError: Unknown profile name.
+    """
+    global _profile
+    choice = (name or os.environ.get(PROFILE_ENV) or DEFAULT_PROFILE).strip().lower()
+    if choice not in TOOL_PROFILES:
+        raise ValueError(f"Unknown tool profile {choice!r}; choose from {', '.join(TOOL_PROFILES)}.")
+    _profile = choice
+    return choice
+
+
+@functools.cache
+def _profile_tools(profile: str) -> list[Tool]:
+    if TOOL_PROFILES[profile] == _ALL_TOOLS:
+        return TOOLS
+    return [_tool for _tool in TOOLS if _tool.name in TOOL_PROFILES[profile]]
+
 
 async def list_tools() -> list[Tool]:
-    """List available tools (plain function - tests call it directly)."""
-    return TOOLS
+    """List the active profile's tools (plain function - tests call it directly)."""
+    return _profile_tools(_profile)
 
 
 # ---------------------------------------------------------------------------
@@ -1597,58 +1914,62 @@ def _handler(name: str):
 
 # --- Auth & Profile ---
 @_handler("tp_auth_status")
-async def _h_auth_status(args): return await tp_auth_status()
+async def _h_auth_status(args): return await tools.tp_auth_status()
 
 @_handler("tp_get_profile")
-async def _h_get_profile(args): return await tp_get_profile()
+async def _h_get_profile(args): return await tools.tp_get_profile()
 
 @_handler("tp_list_athletes")
-async def _h_list_athletes(args): return await tp_list_athletes()
+async def _h_list_athletes(args): return await tools.tp_list_athletes()
 
 @_handler("tp_list_groups")
-async def _h_list_groups(args): return await tp_list_groups()
+async def _h_list_groups(args): return await tools.tp_list_groups()
 
 @_handler("tp_list_athletes_in_group")
-async def _h_list_athletes_in_group(args): return await tp_list_athletes_in_group(group_id=args["group_id"])
+async def _h_list_athletes_in_group(args): return await tools.tp_list_athletes_in_group(group_id=args["group_id"])
+
+@_handler("tp_get_group_dashboard")
+async def _h_group_dashboard(args):
+    return await tools.tp_get_group_dashboard(group_id=args["group_id"], days=args.get("days", 7))
 
 @_handler("tp_create_group")
-async def _h_create_group(args): return await tp_create_group(name=args["name"])
+async def _h_create_group(args): return await tools.tp_create_group(name=args["name"])
 
 @_handler("tp_rename_group")
-async def _h_rename_group(args): return await tp_rename_group(group_id=args["group_id"], name=args["name"])
+async def _h_rename_group(args): return await tools.tp_rename_group(group_id=args["group_id"], name=args["name"])
 
 @_handler("tp_delete_group")
-async def _h_delete_group(args): return await tp_delete_group(group_id=args["group_id"])
+async def _h_delete_group(args): return await tools.tp_delete_group(group_id=args["group_id"])
 
 @_handler("tp_add_athletes_to_group")
 async def _h_add_athletes_to_group(args):
-    return await tp_add_athletes_to_group(
+    return await tools.tp_add_athletes_to_group(
         group_id=args["group_id"], athlete_ids=args["athlete_ids"]
     )
 
 @_handler("tp_remove_athletes_from_group")
 async def _h_remove_athletes_from_group(args):
-    return await tp_remove_athletes_from_group(
+    return await tools.tp_remove_athletes_from_group(
         group_id=args["group_id"], athlete_ids=args["athlete_ids"]
     )
 
 @_handler("tp_refresh_auth")
-async def _h_refresh_auth(args): return await tp_refresh_auth(browser=args.get("browser", "auto"))
+async def _h_refresh_auth(args): return await tools.tp_refresh_auth(browser=args.get("browser", "auto"))
 
 # --- Workouts ---
 @_handler("tp_get_workouts")
 async def _h_get_workouts(args):
-    return await tp_get_workouts(
+    return await tools.tp_get_workouts(
         start_date=args["start_date"], end_date=args["end_date"],
         workout_filter=args.get("type", "all"),
     )
 
 @_handler("tp_get_workout")
-async def _h_get_workout(args): return await tp_get_workout(workout_id=args["workout_id"])
+async def _h_get_workout(args): return await tools.tp_get_workout(workout_id=args["workout_id"])
 
 @_handler("tp_create_workout")
 async def _h_create_workout(args):
-    return await tp_create_workout(
+    return await tools.tp_create_workout(
         date_str=args["date"], sport=args["sport"], title=args["title"],
         duration_minutes=args.get("duration_minutes"),
         description=args.get("description"), distance_km=args.get("distance_km"),
@@ -1661,7 +1982,7 @@ async def _h_create_workout(args):
 
 @_handler("tp_update_workout")
 async def _h_update_workout(args):
-    return await tp_update_workout(
+    return await tools.tp_update_workout(
         workout_id=args["workout_id"], sport=args.get("sport"),
         subtype_id=args.get("subtype_id"), title=args.get("title"),
         description=args.get("description"), date=args.get("date"),
@@ -1675,46 +1996,59 @@ async def _h_update_workout(args):
     )
 
 @_handler("tp_delete_workout")
-async def _h_delete_workout(args): return await tp_delete_workout(workout_id=args["workout_id"])
+async def _h_delete_workout(args): return await tools.tp_delete_workout(workout_id=args["workout_id"])
 
 @_handler("tp_copy_workout")
 async def _h_copy_workout(args):
-    return await tp_copy_workout(
+    return await tools.tp_copy_workout(
         workout_id=args["workout_id"], target_date=args["target_date"],
         title=args.get("title"),
     )
 
 @_handler("tp_reorder_workouts")
-async def _h_reorder(args): return await tp_reorder_workouts(workout_ids=args["workout_ids"])
+async def _h_reorder(args):
+    return await tools.tp_reorder_workouts(workout_ids=args["workout_ids"], date=args.get("date"))
+
+@_handler("tp_bulk_create_workouts")
+async def _h_bulk_create(args):
+    return await tools.tp_bulk_create_workouts(workouts=args["workouts"], dry_run=args.get("dry_run", False))
+
+@_handler("tp_bulk_update_workouts")
+async def _h_bulk_update(args):
+    return await tools.tp_bulk_update_workouts(updates=args["updates"], dry_run=args.get("dry_run", False))
+
+@_handler("tp_bulk_delete_workouts")
+async def _h_bulk_delete(args):
+    return await tools.tp_bulk_delete_workouts(workout_ids=args["workout_ids"], dry_run=args.get("dry_run", False))
 
 @_handler("tp_unpair_workout")
-async def _h_unpair(args): return await tp_unpair_workout(workout_id=args["workout_id"])
+async def _h_unpair(args): return await tools.tp_unpair_workout(workout_id=args["workout_id"])
 
 @_handler("tp_pair_workout")
 async def _h_pair(args):
-    return await tp_pair_workout(
+    return await tools.tp_pair_workout(
         completed_workout_id=args["completed_workout_id"],
         planned_workout_id=args["planned_workout_id"],
     )
 
 @_handler("tp_get_workout_comments")
-async def _h_get_comments(args): return await tp_get_workout_comments(workout_id=args["workout_id"])
+async def _h_get_comments(args): return await tools.tp_get_workout_comments(workout_id=args["workout_id"])
 
 @_handler("tp_add_workout_comment")
 async def _h_add_comment(args):
-    return await tp_add_workout_comment(workout_id=args["workout_id"], comment=args["comment"])
+    return await tools.tp_add_workout_comment(workout_id=args["workout_id"], comment=args["comment"])
 
 @_handler("tp_get_workout_note")
 async def _h_get_workout_note(args):
-    return await tp_get_workout_note(workout_id=args["workout_id"])
+    return await tools.tp_get_workout_note(workout_id=args["workout_id"])
 
 @_handler("tp_set_workout_note")
 async def _h_set_workout_note(args):
-    return await tp_set_workout_note(workout_id=args["workout_id"], note=args["note"])
+    return await tools.tp_set_workout_note(workout_id=args["workout_id"], note=args["note"])
 
 @_handler("tp_upload_workout_file")
 async def _h_upload_workout_file(args):
-    return await tp_upload_workout_file(
+    return await tools.tp_upload_workout_file(
         workout_id=args["workout_id"],
         file_path=args.get("file_path"),
         file_data_base64=args.get("file_data_base64"),
@@ -1723,7 +2057,7 @@ async def _h_upload_workout_file(args):
 
 @_handler("tp_download_workout_file")
 async def _h_download_workout_file(args):
-    return await tp_download_workout_file(
+    return await tools.tp_download_workout_file(
         workout_id=args["workout_id"],
         file_id=args["file_id"],
         output_path=args.get("output_path"),
@@ -1731,54 +2065,54 @@ async def _h_download_workout_file(args):
 
 @_handler("tp_delete_workout_file")
 async def _h_delete_workout_file(args):
-    return await tp_delete_workout_file(
+    return await tools.tp_delete_workout_file(
         workout_id=args["workout_id"],
         file_id=args["file_id"],
     )
 
 @_handler("tp_validate_structure")
-async def _h_validate_structure(args): return await tp_validate_structure(structure=args["structure"])
+async def _h_validate_structure(args): return await tools.tp_validate_structure(structure=args["structure"])
 
 # --- Analysis & Peaks ---
 @_handler("tp_get_workout_prs")
-async def _h_get_prs(args): return await tp_get_workout_prs(workout_id=args["workout_id"])
+async def _h_get_prs(args): return await tools.tp_get_workout_prs(workout_id=args["workout_id"])
 
 @_handler("tp_get_peaks")
 async def _h_get_peaks(args):
-    return await tp_get_peaks(sport=args["sport"], pr_type=args["pr_type"], days=args.get("days", 3650))
+    return await tools.tp_get_peaks(sport=args["sport"], pr_type=args["pr_type"], days=args.get("days", 3650))
 
 @_handler("tp_analyze_workout")
-async def _h_analyze(args): return await tp_analyze_workout(workout_id=args["workout_id"])
+async def _h_analyze(args): return await tools.tp_analyze_workout(workout_id=args["workout_id"])
 
 # --- Structured strength / gym ---
 @_handler("tp_search_exercises")
 async def _h_search_exercises(args):
-    return await tp_search_exercises(
+    return await tools.tp_search_exercises(
         query=args.get("query", ""), limit=args.get("limit", 20),
         muscle_group=args.get("muscle_group"))
 
 @_handler("tp_create_strength_workout")
 async def _h_create_strength(args):
-    return await tp_create_strength_workout(
+    return await tools.tp_create_strength_workout(
         date=args["date"], title=args["title"],
         blocks=args.get("blocks") or [], instructions=args.get("instructions"))
 
 @_handler("tp_get_strength_summary")
 async def _h_get_strength_summary(args):
-    return await tp_get_strength_summary(workout_id=args["workout_id"])
+    return await tools.tp_get_strength_summary(workout_id=args["workout_id"])
 
 @_handler("tp_get_strength_workouts")
 async def _h_get_strength_workouts(args):
-    return await tp_get_strength_workouts(
+    return await tools.tp_get_strength_workouts(
         start_date=args["start_date"], end_date=args["end_date"])
 
 @_handler("tp_get_strength_workout")
 async def _h_get_strength_workout(args):
-    return await tp_get_strength_workout(workout_id=args["workout_id"])
+    return await tools.tp_get_strength_workout(workout_id=args["workout_id"])
 
 @_handler("tp_update_strength_workout")
 async def _h_update_strength(args):
-    return await tp_update_strength_workout(
+    return await tools.tp_update_strength_workout(
         workout_id=args["workout_id"], blocks=args.get("blocks"),
         title=args.get("title"), instructions=args.get("instructions"),
         mode=args.get("mode", "replace"),
@@ -1787,60 +2121,92 @@ async def _h_update_strength(args):
 
 @_handler("tp_delete_strength_workout")
 async def _h_delete_strength(args):
-    return await tp_delete_strength_workout(workout_id=args["workout_id"])
+    return await tools.tp_delete_strength_workout(workout_id=args["workout_id"])
 
 # --- Fitness & Summary ---
 @_handler("tp_get_fitness")
 async def _h_get_fitness(args):
-    return await tp_get_fitness(
+    return await tools.tp_get_fitness(
         days=args.get("days", 90), start_date=args.get("start_date"),
         end_date=args.get("end_date"),
+        atl_constant=args.get("atl_constant", 7), ctl_constant=args.get("ctl_constant", 42),
+        atl_start=args.get("atl_start"), ctl_start=args.get("ctl_start"),
+        years=args.get("years"), seed_from_history=args.get("seed_from_history"),
     )
 
 @_handler("tp_get_weekly_summary")
-async def _h_weekly_summary(args): return await tp_get_weekly_summary(week_of=args.get("week_of"))
+async def _h_weekly_summary(args): return await tools.tp_get_weekly_summary(week_of=args.get("week_of"))
+
+@_handler("tp_get_training_summary")
+async def _h_training_summary(args):
+    return await tools.tp_get_training_summary(
+        weeks=args.get("weeks"), start_date=args.get("start_date"), end_date=args.get("end_date"),
+        group_by=args.get("group_by", "week"), by_sport=args.get("by_sport", True),
+    )
+
+@_handler("tp_get_compliance")
+async def _h_compliance(args):
+    return await tools.tp_get_compliance(
+        start_date=args["start_date"], end_date=args["end_date"],
+        include_days=args.get("include_days", False),
+    )
+
+@_handler("tp_project_fitness")
+async def _h_project_fitness(args):
+    return await tools.tp_project_fitness(
+        until_date=args.get("until_date"), scenarios=args.get("scenarios"),
+        atl_constant=args.get("atl_constant", 7), ctl_constant=args.get("ctl_constant", 42),
+        include_daily=args.get("include_daily", False),
+    )
 
 @_handler("tp_get_atp")
-async def _h_get_atp(args): return await tp_get_atp(start_date=args["start_date"], end_date=args["end_date"])
+async def _h_get_atp(args): return await tools.tp_get_atp(start_date=args["start_date"], end_date=args["end_date"])
+
+@_handler("tp_get_atp_compliance")
+async def _h_atp_compliance(args):
+    return await tools.tp_get_atp_compliance(start_date=args["start_date"], end_date=args["end_date"])
 
 @_handler("tp_list_training_plans")
-async def _h_list_training_plans(args): return await tp_list_training_plans()
+async def _h_list_training_plans(args): return await tools.tp_list_training_plans()
 
 @_handler("tp_get_training_plan")
-async def _h_get_training_plan(args): return await tp_get_training_plan(plan_id=args["plan_id"])
+async def _h_get_training_plan(args): return await tools.tp_get_training_plan(plan_id=args["plan_id"])
 
 @_handler("tp_get_training_plan_workouts")
-async def _h_get_training_plan_workouts(args): return await tp_get_training_plan_workouts(plan_id=args["plan_id"])
+async def _h_get_training_plan_workouts(args): return await tools.tp_get_training_plan_workouts(plan_id=args["plan_id"])
 
 @_handler("tp_apply_training_plan")
 async def _h_apply_training_plan(args):
-    return await tp_apply_training_plan(plan_id=args["plan_id"], start_date=args["start_date"])
+    return await tools.tp_apply_training_plan(
+        plan_id=args["plan_id"], start_date=args["start_date"],
+        athletes=args.get("athletes"), group_id=args.get("group_id"),
+    )
 
 # --- Athlete Settings ---
 @_handler("tp_get_athlete_settings")
-async def _h_get_settings(args): return await tp_get_athlete_settings()
+async def _h_get_settings(args): return await tools.tp_get_athlete_settings()
 
 @_handler("tp_update_ftp")
 async def _h_update_ftp(args):
-    return await tp_update_ftp(ftp=args["ftp"], workout_type=args.get("workout_type", "bike"))
+    return await tools.tp_update_ftp(ftp=args["ftp"], workout_type=args.get("workout_type", "bike"))
 
 @_handler("tp_update_hr_zones")
 async def _h_update_hr(args):
-    return await tp_update_hr_zones(
+    return await tools.tp_update_hr_zones(
         threshold_hr=args.get("threshold_hr"), max_hr=args.get("max_hr"),
         resting_hr=args.get("resting_hr"), workout_type=args.get("workout_type", "general"),
     )
 
 @_handler("tp_update_speed_zones")
 async def _h_update_speed(args):
-    return await tp_update_speed_zones(
+    return await tools.tp_update_speed_zones(
         run_threshold_pace=args.get("run_threshold_pace"),
         swim_threshold_pace=args.get("swim_threshold_pace"),
     )
 
 @_handler("tp_create_zones")
 async def _h_create_zones(args):
-    return await tp_create_zones(
+    return await tools.tp_create_zones(
         metric=args["metric"], workout_type=args["workout_type"],
         calculation_method=args["calculation_method"],
         threshold=args.get("threshold"), pace=args.get("pace"),
@@ -1849,15 +2215,15 @@ async def _h_create_zones(args):
     )
 
 @_handler("tp_update_nutrition")
-async def _h_update_nutrition(args): return await tp_update_nutrition(planned_calories=args["planned_calories"])
+async def _h_update_nutrition(args): return await tools.tp_update_nutrition(planned_calories=args["planned_calories"])
 
 @_handler("tp_get_pool_length_settings")
-async def _h_pool(args): return await tp_get_pool_length_settings()
+async def _h_pool(args): return await tools.tp_get_pool_length_settings()
 
 # --- Health Metrics ---
 @_handler("tp_log_metrics")
 async def _h_log_metrics(args):
-    return await tp_log_metrics(
+    return await tools.tp_log_metrics(
         date=args["date"], weight_kg=args.get("weight_kg"), pulse=args.get("pulse"),
         hrv=args.get("hrv"), sleep_hours=args.get("sleep_hours"), spo2=args.get("spo2"),
         steps=args.get("steps"), rmr=args.get("rmr"), injury=args.get("injury"),
@@ -1865,19 +2231,19 @@ async def _h_log_metrics(args):
 
 @_handler("tp_get_metrics")
 async def _h_get_metrics(args):
-    return await tp_get_metrics(start_date=args["start_date"], end_date=args["end_date"])
+    return await tools.tp_get_metrics(start_date=args["start_date"], end_date=args["end_date"])
 
 @_handler("tp_get_nutrition")
 async def _h_get_nutrition(args):
-    return await tp_get_nutrition(start_date=args["start_date"], end_date=args["end_date"])
+    return await tools.tp_get_nutrition(start_date=args["start_date"], end_date=args["end_date"])
 
 # --- Equipment ---
 @_handler("tp_get_equipment")
-async def _h_get_equipment(args): return await tp_get_equipment(type=args.get("type", "all"))
+async def _h_get_equipment(args): return await tools.tp_get_equipment(type=args.get("type", "all"))
 
 @_handler("tp_create_equipment")
 async def _h_create_equipment(args):
-    return await tp_create_equipment(
+    return await tools.tp_create_equipment(
         name=args["name"], type=args["type"], brand=args.get("brand"),
         model=args.get("model"), notes=args.get("notes"),
         date_of_purchase=args.get("date_of_purchase"),
@@ -1889,7 +2255,7 @@ async def _h_create_equipment(args):
 
 @_handler("tp_update_equipment")
 async def _h_update_equipment(args):
-    return await tp_update_equipment(
+    return await tools.tp_update_equipment(
         equipment_id=args["equipment_id"], name=args.get("name"),
         brand=args.get("brand"), model=args.get("model"), notes=args.get("notes"),
         retired=args.get("retired"), is_default=args.get("is_default"),
@@ -1898,22 +2264,22 @@ async def _h_update_equipment(args):
     )
 
 @_handler("tp_delete_equipment")
-async def _h_delete_equipment(args): return await tp_delete_equipment(equipment_id=args["equipment_id"])
+async def _h_delete_equipment(args): return await tools.tp_delete_equipment(equipment_id=args["equipment_id"])
 
 # --- Events & Calendar ---
 @_handler("tp_get_focus_event")
-async def _h_focus_event(args): return await tp_get_focus_event()
+async def _h_focus_event(args): return await tools.tp_get_focus_event()
 
 @_handler("tp_get_next_event")
-async def _h_next_event(args): return await tp_get_next_event()
+async def _h_next_event(args): return await tools.tp_get_next_event()
 
 @_handler("tp_get_events")
 async def _h_get_events(args):
-    return await tp_get_events(start_date=args["start_date"], end_date=args["end_date"])
+    return await tools.tp_get_events(start_date=args["start_date"], end_date=args["end_date"])
 
 @_handler("tp_create_event")
 async def _h_create_event(args):
-    return await tp_create_event(
+    return await tools.tp_create_event(
         name=args["name"], date=args["date"], event_type=args.get("event_type"),
         priority=args.get("priority"), distance_km=args.get("distance_km"),
         ctl_target=args.get("ctl_target"), description=args.get("description"),
@@ -1921,7 +2287,7 @@ async def _h_create_event(args):
 
 @_handler("tp_update_event")
 async def _h_update_event(args):
-    return await tp_update_event(
+    return await tools.tp_update_event(
         event_id=args["event_id"], name=args.get("name"), date=args.get("date"),
         event_type=args.get("event_type"), priority=args.get("priority"),
         distance_km=args.get("distance_km"), ctl_target=args.get("ctl_target"),
@@ -1929,23 +2295,23 @@ async def _h_update_event(args):
     )
 
 @_handler("tp_delete_event")
-async def _h_delete_event(args): return await tp_delete_event(event_id=args["event_id"])
+async def _h_delete_event(args): return await tools.tp_delete_event(event_id=args["event_id"])
 
 @_handler("tp_create_note")
 async def _h_create_note(args):
-    return await tp_create_note(
+    return await tools.tp_create_note(
         date=args["date"], title=args["title"], description=args.get("description"),
     )
 
 @_handler("tp_delete_note")
-async def _h_delete_note(args): return await tp_delete_note(note_id=args["note_id"])
+async def _h_delete_note(args): return await tools.tp_delete_note(note_id=args["note_id"])
 
 @_handler("tp_get_note")
-async def _h_get_note(args): return await tp_get_note(note_id=args["note_id"])
+async def _h_get_note(args): return await tools.tp_get_note(note_id=args["note_id"])
 
 @_handler("tp_update_note")
 async def _h_update_note(args):
-    return await tp_update_note(
+    return await tools.tp_update_note(
         note_id=args["note_id"],
         title=args.get("title"),
         description=args.get("description"),
@@ -1954,58 +2320,58 @@ async def _h_update_note(args):
     )
 
 @_handler("tp_get_note_comments")
-async def _h_get_note_comments(args): return await tp_get_note_comments(note_id=args["note_id"])
+async def _h_get_note_comments(args): return await tools.tp_get_note_comments(note_id=args["note_id"])
 
 @_handler("tp_add_note_comment")
 async def _h_add_note_comment(args):
-    return await tp_add_note_comment(note_id=args["note_id"], comment=args["comment"])
+    return await tools.tp_add_note_comment(note_id=args["note_id"], comment=args["comment"])
 
 @_handler("tp_list_notes")
 async def _h_list_notes(args):
-    return await tp_list_notes(start_date=args["start_date"], end_date=args["end_date"])
+    return await tools.tp_list_notes(start_date=args["start_date"], end_date=args["end_date"])
 
 @_handler("tp_get_availability")
 async def _h_get_avail(args):
-    return await tp_get_availability(start_date=args["start_date"], end_date=args["end_date"])
+    return await tools.tp_get_availability(start_date=args["start_date"], end_date=args["end_date"])
 
 @_handler("tp_create_availability")
 async def _h_create_avail(args):
-    return await tp_create_availability(
+    return await tools.tp_create_availability(
         start_date=args["start_date"], end_date=args["end_date"],
         limited=args.get("limited", False), sport_types=args.get("sport_types"),
         description=args.get("description"),
     )
 
 @_handler("tp_delete_availability")
-async def _h_delete_avail(args): return await tp_delete_availability(availability_id=args["availability_id"])
+async def _h_delete_avail(args): return await tools.tp_delete_availability(availability_id=args["availability_id"])
 
 # --- Workout Types ---
 @_handler("tp_get_workout_types")
-async def _h_workout_types(args): return await tp_get_workout_types()
+async def _h_workout_types(args): return await tools.tp_get_workout_types()
 
 @_handler("tp_get_zone_methods")
-async def _h_zone_methods(args): return await tp_get_zone_methods(metric=args.get("metric"))
+async def _h_zone_methods(args): return await tools.tp_get_zone_methods(metric=args.get("metric"))
 
 # --- Workout Library ---
 @_handler("tp_get_libraries")
-async def _h_get_libs(args): return await tp_get_libraries()
+async def _h_get_libs(args): return await tools.tp_get_libraries()
 
 @_handler("tp_get_library_items")
-async def _h_get_lib_items(args): return await tp_get_library_items(library_id=args["library_id"])
+async def _h_get_lib_items(args): return await tools.tp_get_library_items(library_id=args["library_id"])
 
 @_handler("tp_get_library_item")
 async def _h_get_lib_item(args):
-    return await tp_get_library_item(library_id=args["library_id"], item_id=args["item_id"])
+    return await tools.tp_get_library_item(library_id=args["library_id"], item_id=args["item_id"])
 
 @_handler("tp_create_library")
-async def _h_create_lib(args): return await tp_create_library(name=args["name"])
+async def _h_create_lib(args): return await tools.tp_create_library(name=args["name"])
 
 @_handler("tp_delete_library")
-async def _h_delete_lib(args): return await tp_delete_library(library_id=args["library_id"])
+async def _h_delete_lib(args): return await tools.tp_delete_library(library_id=args["library_id"])
 
 @_handler("tp_create_library_item")
 async def _h_create_lib_item(args):
-    return await tp_create_library_item(
+    return await tools.tp_create_library_item(
         library_id=args["library_id"], name=args["name"],
         sport_family_id=args["sport_family_id"], sport_type_id=args["sport_type_id"],
         duration_hours=args.get("duration_hours"), tss=args.get("tss"),
@@ -2014,7 +2380,7 @@ async def _h_create_lib_item(args):
 
 @_handler("tp_update_library_item")
 async def _h_update_lib_item(args):
-    return await tp_update_library_item(
+    return await tools.tp_update_library_item(
         library_id=args["library_id"], item_id=args["item_id"],
         name=args.get("name"), duration_hours=args.get("duration_hours"),
         tss=args.get("tss"), description=args.get("description"),
@@ -2025,60 +2391,219 @@ async def _h_update_lib_item(args):
 
 @_handler("tp_schedule_library_workout")
 async def _h_schedule_lib(args):
-    return await tp_schedule_library_workout(
+    return await tools.tp_schedule_library_workout(
         library_id=args["library_id"], item_id=args["item_id"], date=args["date"],
         athletes=args.get("athletes"),
     )
 
+# --- Batching ---
+@_handler("tp_batch")
+async def _h_batch(args):
+    options = {"max_concurrency": args["max_concurrency"]} if args.get("max_concurrency") is not None else {}
+    return await tools.tp_batch(calls=args["calls"], dispatch=_run_tool, allowed=_BATCHABLE_TOOLS, **options)
+
 
 _TOOLS_BY_NAME = {_tool.name: _tool for _tool in TOOLS}
 
+# Argument validators, compiled once from the final schemas (the athlete,
+# shaping and format parameters are injected above) and run before dispatch.
+_VALIDATORS = {_tool.name: compile_schema(_tool.input_schema) for _tool in TOOLS}
+
+# Per-call time budget. Each call gets a deadline of ``TP_MCP_TOOL_TIMEOUT``
+# seconds (0 disables it), shortened by the client's ``_meta.timeoutMs`` hint.
+# The deadline caps every HTTP timeout inside the call and stops bulk tools
+# between items, which then return their partial result (items never started
+# are listed as TIMEOUT). The hard stop below fires only if a tool ignores both.
+TOOL_TIMEOUT_ENV = "TP_MCP_TOOL_TIMEOUT"
+DEFAULT_TOOL_TIMEOUT = 300.0
+_DEADLINE_GRACE = 1.0  # seconds for a tool to report its own partial result
+
+
+def _tool_timeout(hint: float | None = None) -> float | None:
+    """Seconds the next call may run: the configured budget, capped by ``hint``."""
+    raw = os.environ.get(TOOL_TIMEOUT_ENV)
+    budget: float | None = DEFAULT_TOOL_TIMEOUT
+    if raw is not None:
+        try:
+            budget = float(raw)
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", TOOL_TIMEOUT_ENV, raw)
+        else:
+            budget = budget if budget > 0 else None
+    if hint is not None and hint > 0:
+        budget = hint if budget is None else min(budget, hint)
+    return budget
+
 
-async def call_tool(name: str, arguments: dict[str, Any] | None = None) -> list[TextContent]:
+def _timeout_hint(meta: Any) -> float | None:
+    """The client's ``_meta.timeoutMs`` in seconds, if it sent a usable one."""
+    value = (meta or {}).get("timeoutMs")
+    if isinstance(value, int | float) and not isinstance(value, bool) and value > 0:
+        return value / 1000
+    return None
+
+
+async def call_tool(
+    name: str, arguments: dict[str, Any] | None = None, *, timeout: float | None = None
+) -> list[TextContent]:
     """Handle tool calls (plain function - tests call it directly).
 
     SDK v2 applies no argument validation of its own (v1's decorator validated
-    against inputSchema), so required keys are checked here to keep missing-arg
-    errors readable for the model instead of surfacing as internal errors.
+    against inputSchema), so arguments are checked here against each tool's
+    compiled schema (see ``schema.py``) before anything runs, and a bad call
+    gets a readable INVALID_ARGS error instead of an internal one.
+
+    Calls run concurrently - the SDK dispatches each request in its own task -
+    and each carries its own deadline (see ``_tool_timeout``; ``timeout`` is the
+    client's hint). Cancelling the call cancels its in-flight HTTP requests.
+    """
+    return output.text_content(await _run_tool(name, arguments, timeout=timeout))
+
+
+def _query_fingerprint(name: str, args: dict[str, Any], athlete: str | None) -> str:
+    query = json.dumps([name, athlete, args], sort_keys=True, default=str)
+    return hashlib.blake2b(query.encode(), digest_size=6).hexdigest()
+
+
+def _pop_shaping(name: str, args: dict[str, Any], athlete: str | None) -> dict[str, Any]:
+    """Remove the shaping arguments from ``args``; return them parsed, or an error."""
+    fields = args.pop("fields", None)
+    limit = args.pop("limit", None)
+    cursor = args.pop("cursor", None)
+
+    def invalid(message: str) -> dict[str, Any]:
+        return {"isError": True, "error_code": "INVALID_ARGS", "message": message}
+
+    if fields is not None and not fields:  # type and items checked by the schema
+        return invalid("fields must be a non-empty list of key names.")
+    fingerprint = _query_fingerprint(name, args, athlete)
+    offset = 0
+    if cursor is not None:
+        try:
+            offset_text, cursor_fingerprint = base64.urlsafe_b64decode(str(cursor).encode()).decode().split(":")
+            offset = int(offset_text)
+        except (ValueError, UnicodeDecodeError):
+            return invalid("cursor is not valid; pass next_cursor from the previous page unchanged.")
+        if cursor_fingerprint != fingerprint or offset < 0:
+            return invalid("cursor belongs to a different query; repeat the original arguments with it.")
+    return {"fields": fields, "limit": limit, "offset": offset, "fingerprint": fingerprint}
+
+
+def _shape(
+    result: Any, key: str, *, fields: list[str] | None, limit: int | None, offset: int, fingerprint: str
+) -> Any:
+    """Page and project ``result[key]``; error results pass through untouched."""
+    if fields is None and limit is None and not offset:
+        return result
+    if not isinstance(result, dict) or result.get("isError") or not isinstance(result.get(key), list):
+        return result
+    items = result[key]
+    if limit is not None or offset:
+        end = len(items) if limit is None else offset + limit
+        page = items[offset:end]
+        result["total"] = len(items)
+        if end < len(items):
+            result["next_cursor"] = base64.urlsafe_b64encode(f"{end}:{fingerprint}".encode()).decode()
+    else:
+        page = items
+    if fields is not None:
+        wanted = set(fields)
+        page = [{k: v for k, v in item.items() if k in wanted} if isinstance(item, dict) else item
+                for item in page]
+    result[key] = page
+    result["count"] = len(page)
+    return result
+
+
+def _columnize(result: Any, key: str) -> Any:
+    """Re-encode ``result[key]`` column-wise; anything else passes through untouched."""
+    if not isinstance(result, dict) or result.get("isError"):
+        return result
+    rows = result.get(key)
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        return result
+    result[key] = output.to_columns(rows)
+    result["format"] = "columns"
+    return result
+
+
+async def _run_tool(name: str, arguments: dict[str, Any] | None, *, timeout: float | None = None) -> Any:
+    """Dispatch one call and return its result object (``call_tool`` minus encoding).
+
+    Also used by tp_batch for each entry: an entry without its own ``athlete``
+    inherits the batch's target, and its deadline never outlives the batch's.
     """
     logger.info("Tool call: %s", name)
 
     # A client may legally omit arguments entirely for no-arg tools.
     args = dict(arguments or {})
     # Extract athlete targeting for coach accounts and set context var
-    athlete_target = args.pop("athlete", None)
+    athlete_target = args.pop("athlete") if "athlete" in args else athlete_override.get()
     token = athlete_override.set(athlete_target)
+    budget = _tool_timeout(timeout)
+    deadline = None if budget is None else time.monotonic() + budget
+    outer = call_deadline.get()
+    if outer is not None and (deadline is None or outer < deadline):
+        deadline = outer  # a nested call never outlives its caller
+    deadline_token = call_deadline.set(deadline)
     try:
         handler = _TOOL_HANDLERS.get(name)
         tool = _TOOLS_BY_NAME.get(name)
         if not handler or tool is None:
-            result = {
+            return {
                 "isError": True,
                 "error_code": "UNKNOWN_TOOL",
                 "message": f"Unknown tool: {name}",
             }
+        if name not in TOOL_PROFILES[_profile]:
+            return {
+                "isError": True,
+                "error_code": "UNKNOWN_TOOL",
+                "message": f"{name} is not enabled in the '{_profile}' tool profile.",
+            }
+        try:
+            args = dict(_VALIDATORS[name](arguments or {}))
+        except SchemaError as exc:
+            return {
+                "isError": True,
+                "error_code": "INVALID_ARGS",
+                "message": f"Invalid arguments for {name}: {exc}",
+            }
+        args.pop("athlete", None)
+        shaping = None
+        if name in _SHAPED_LISTS:
+            shaping = _pop_shaping(name, args, athlete_target)
+            if "isError" in shaping:
+                return shaping
+        columns = False
+        if name in _COLUMNAR_LISTS:
+            columns = args.pop("format", "rows") == "columns"
+        if deadline is None:
+            result = await handler(args)
         else:
-            missing = [k for k in tool.input_schema.get("required", []) if k not in args]
-            if missing:
-                result = {
-                    "isError": True,
-                    "error_code": "INVALID_ARGS",
-                    "message": f"Missing required argument(s) for {name}: {', '.join(missing)}",
-                }
-            else:
-                result = await handler(args)
-
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
+            hard_stop = deadline - time.monotonic() + _DEADLINE_GRACE
+            result = await asyncio.wait_for(handler(args), max(0.0, hard_stop))
+        if shaping is not None:
+            result = _shape(result, _SHAPED_LISTS[name], **shaping)
+        return _columnize(result, _COLUMNAR_LISTS[name]) if columns else result
+
+    except (DeadlineExceededError, asyncio.TimeoutError):
+        logger.warning("Tool %s exceeded its deadline", name)
+        return {
+            "isError": True,
+            "error_code": "TIMEOUT",
+            "message": (f"{name} did not finish within its time limit. Writes issued before "
+                        "the limit may have been applied; check before retrying."),
+        }
     except Exception:
         logger.exception("Error in tool %s", name)
-        error_result = {
+        return {
             "isError": True,
             "error_code": "API_ERROR",
             "message": "An internal error occurred. Check server logs.",
         }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
     finally:
+        call_deadline.reset(deadline_token)
         athlete_override.reset(token)
 
 
@@ -2094,13 +2619,34 @@ apps.stamp_tools(TOOLS)
 _TOOLS_LIST_TTL_MS = 3600000  # TOOLS is a module-level constant; 1h freshness hint
 
 
+@functools.cache
+def _list_tools_result(profile: str) -> ListToolsResult:
+    # Built once per profile: TOOLS is constant after import (apps stamped above).
+    return ListToolsResult(tools=_profile_tools(profile), ttl_ms=_TOOLS_LIST_TTL_MS)
+
+
 async def _on_list_tools(ctx: ServerRequestContext, params: PaginatedRequestParams | None) -> ListToolsResult:
-    return ListToolsResult(tools=await list_tools(), ttl_ms=_TOOLS_LIST_TTL_MS)
+    return _list_tools_result(_profile)
 
 
 async def _on_call_tool(ctx: ServerRequestContext, params: CallToolRequestParams) -> CallToolResult:
-    contents = await call_tool(params.name, params.arguments)
-    return CallToolResult(content=list(contents))
+    progress_token = (ctx.meta or {}).get("progress_token")
+    token = None
+    if progress_token is not None:
+        related = str(ctx.request_id) if ctx.request_id is not None else None
+
+        async def _send_progress(progress: float, total: float | None, message: str | None) -> None:
+            await ctx.session.send_progress_notification(
+                progress_token, progress, total, message, related_request_id=related
+            )
+
+        token = progress_reporter.set(_send_progress)
+    try:
+        result = await _run_tool(params.name, params.arguments, timeout=_timeout_hint(ctx.meta))
+    finally:
+        if token is not None:
+            progress_reporter.reset(token)
+    return output.call_result(result)
 
 
 async def _on_list_resources(
@@ -2132,14 +2678,31 @@ server.extensions[apps.EXTENSION_ID] = {}
 
 
 async def _validate_auth_on_startup() -> bool:
-    """Validate authentication on server startup."""
-    cred = get_credential()
-    if not cred.success or not cred.cookie:
-        logger.warning("No credential stored. Run 'tp-mcp auth' to authenticate.")
+    """Validate authentication on server startup.
+
+    Runs in the background once the transport is up, so a slow or offline
+    network never delays the handshake. The token obtained while validating
+    seeds the client's shared token cache; the first tool call reuses it
+    instead of exchanging the cookie again.
+    """
+    # Imported here: the credential stores pull in cryptography and keyring.
+    from tp_mcp.auth import get_credential, validate_auth
+    from tp_mcp.client import TPClient
+
+    try:
+        cred = get_credential()
+        if not cred.success or not cred.cookie:
+            logger.warning("No credential stored. Run 'tp-mcp auth' to authenticate.")
+            return False
+
+        result = await validate_auth(cred.cookie)
+    except Exception:
+        logger.exception("Startup authentication check failed")
         return False
 
-    result = await validate_auth(cred.cookie)
     if result.is_valid:
+        if result.access_token and result.expires_in:
+            TPClient.seed_token(result.access_token, result.expires_in)
         logger.info("Authentication valid (athlete_id: %s)", result.athlete_id)
         return True
     else:
@@ -2147,22 +2710,55 @@ async def _validate_auth_on_startup() -> bool:
         return False
 
 
+async def _startup_warm_up() -> None:
+    """Background startup work: the auth check, then (if it passed) the
+    reference-data prefetch configured by ``TP_MCP_PREFETCH``."""
+    if not await _validate_auth_on_startup():
+        return
+    from tp_mcp.tools._prefetch import configured_items, prefetch
+
+    items = configured_items()
+    if not items:
+        return
+    try:
+        await prefetch(items)
+    except Exception:
+        logger.exception("Startup prefetch failed")
+
+
 async def run_server_async() -> None:
     """Run the MCP server (async)."""
     logger.info("Starting TrainingPeaks MCP Server")
-    if os.environ.get("TP_MCP_SKIP_STARTUP_VALIDATION") != "1":
-        await _validate_auth_on_startup()
 
     async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
-
-
-def run_server() -> int:
-    """Run the MCP server (entry point)."""
+        warm_up = None
+        if os.environ.get("TP_MCP_SKIP_STARTUP_VALIDATION") != "1":
+            warm_up = asyncio.create_task(_startup_warm_up())
+        try:
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+        finally:
+            if warm_up is not None:
+                warm_up.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await warm_up
+
+
+def run_server(profile: str | None = None) -> int:
+    """Run the MCP server (entry point).
+
+    Args:
+        profile: Tool profile to serve; defaults to ``TP_MCP_PROFILE``, then "admin" (all tools).
+    """
+    try:
+        set_profile(profile)
+    except ValueError as e:
+        logger.error("%s", e)
+        return 1
+    logger.info("Serving the '%s' tool profile (%d tools)", _profile, len(TOOL_PROFILES[_profile]))
     try:
         asyncio.run(run_server_async())
         return 0
@@ -1,110 +1,227 @@
-"""MCP tools for TrainingPeaks."""
+"""MCP tools for TrainingPeaks.
 
-from tp_mcp.tools.analyze import tp_analyze_workout
-from tp_mcp.tools.atp import tp_get_atp
-from tp_mcp.tools.auth_status import tp_auth_status
-from tp_mcp.tools.equipment import (
-    tp_create_equipment,
-    tp_delete_equipment,
-    tp_get_equipment,
-    tp_update_equipment,
-)
-from tp_mcp.tools.events import (
-    tp_add_note_comment,
-    tp_create_availability,
-    tp_create_event,
-    tp_create_note,
-    tp_delete_availability,
-    tp_delete_event,
-    tp_delete_note,
-    tp_get_availability,
-    tp_get_events,
-    tp_get_focus_event,
-    tp_get_next_event,
-    tp_get_note,
-    tp_get_note_comments,
-    tp_list_notes,
-    tp_update_event,
-    tp_update_note,
-)
-from tp_mcp.tools.fitness import tp_get_fitness
-from tp_mcp.tools.groups import (
-    tp_add_athletes_to_group,
-    tp_create_group,
-    tp_delete_group,
-    tp_list_athletes_in_group,
-    tp_list_groups,
-    tp_remove_athletes_from_group,
-    tp_rename_group,
-)
-from tp_mcp.tools.library import (
-    tp_create_library,
-    tp_create_library_item,
-    tp_delete_library,
-    tp_get_libraries,
-    tp_get_library_item,
-    tp_get_library_items,
-    tp_schedule_library_workout,
-    tp_update_library_item,
-)
-from tp_mcp.tools.metrics import tp_get_metrics, tp_get_nutrition, tp_log_metrics
-from tp_mcp.tools.peaks import tp_get_peaks, tp_get_workout_prs
-from tp_mcp.tools.plans import (
-    tp_apply_training_plan,
-    tp_get_training_plan,
-    tp_get_training_plan_workouts,
-    tp_list_training_plans,
-)
-from tp_mcp.tools.profile import tp_get_profile, tp_list_athletes
-from tp_mcp.tools.refresh_auth import tp_refresh_auth
-from tp_mcp.tools.settings import (
-    tp_create_zones,
-    tp_get_athlete_settings,
-    tp_get_pool_length_settings,
-    tp_update_ftp,
-    tp_update_hr_zones,
-    tp_update_nutrition,
-    tp_update_speed_zones,
-)
-from tp_mcp.tools.strength import (
-    tp_create_strength_workout,
-    tp_delete_strength_workout,
-    tp_get_strength_summary,
-    tp_get_strength_workout,
-    tp_get_strength_workouts,
-    tp_search_exercises,
-    tp_update_strength_workout,
-)
-from tp_mcp.tools.structure import tp_validate_structure
-from tp_mcp.tools.weekly_summary import tp_get_weekly_summary
-from tp_mcp.tools.workout_files import (
-    tp_delete_workout_file,
-    tp_download_workout_file,
-    tp_upload_workout_file,
-)
-from tp_mcp.tools.workout_types import tp_get_workout_types
-from tp_mcp.tools.workouts import (
-    tp_add_workout_comment,
-    tp_copy_workout,
-    tp_create_workout,
-    tp_delete_workout,
-    tp_get_workout,
-    tp_get_workout_comments,
-    tp_get_workout_note,
-    tp_get_workouts,
-    tp_pair_workout,
-    tp_reorder_workouts,
-    tp_set_workout_note,
-    tp_unpair_workout,
-    tp_update_workout,
-)
-from tp_mcp.tools.zone_methods import tp_get_zone_methods
+Tool functions are resolved lazily (PEP 562 ``__getattr__``): importing this
+package is cheap, and a tool module - with its pydantic models and the HTTP
+client - is imported the first time one of its tools is looked up. The server
+relies on this so the stdio handshake and ``tools/list`` import no tool code.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tp_mcp.tools.analyze import tp_analyze_workout
+    from tp_mcp.tools.atp import tp_get_atp, tp_get_atp_compliance
+    from tp_mcp.tools.auth_status import tp_auth_status
+    from tp_mcp.tools.batch import tp_batch
+    from tp_mcp.tools.compliance import tp_get_compliance
+    from tp_mcp.tools.dashboard import tp_get_group_dashboard
+    from tp_mcp.tools.equipment import (
+        tp_create_equipment,
+        tp_delete_equipment,
+        tp_get_equipment,
+        tp_update_equipment,
+    )
+    from tp_mcp.tools.events import (
+        tp_add_note_comment,
+        tp_create_availability,
+        tp_create_event,
+        tp_create_note,
+        tp_delete_availability,
+        tp_delete_event,
+        tp_delete_note,
+        tp_get_availability,
+        tp_get_events,
+        tp_get_focus_event,
+        tp_get_next_event,
+        tp_get_note,
+        tp_get_note_comments,
+        tp_list_notes,
+        tp_update_event,
+        tp_update_note,
+    )
+    from tp_mcp.tools.fitness import tp_get_fitness
+    from tp_mcp.tools.groups import (
+        tp_add_athletes_to_group,
+        tp_create_group,
+        tp_delete_group,
+        tp_list_athletes_in_group,
+        tp_list_groups,
+        tp_remove_athletes_from_group,
+        tp_rename_group,
+    )
+    from tp_mcp.tools.library import (
+        tp_create_library,
+        tp_create_library_item,
+        tp_delete_library,
+        tp_get_libraries,
+        tp_get_library_item,
+        tp_get_library_items,
+        tp_schedule_library_workout,
+        tp_update_library_item,
+    )
+    from tp_mcp.tools.metrics import tp_get_metrics, tp_get_nutrition, tp_log_metrics
+    from tp_mcp.tools.peaks import tp_get_peaks, tp_get_workout_prs
+    from tp_mcp.tools.plans import (
+        tp_apply_training_plan,
+        tp_get_training_plan,
+        tp_get_training_plan_workouts,
+        tp_list_training_plans,
+    )
+    from tp_mcp.tools.profile import tp_get_profile, tp_list_athletes
+    from tp_mcp.tools.projection import tp_project_fitness
+    from tp_mcp.tools.refresh_auth import tp_refresh_auth
+    from tp_mcp.tools.settings import (
+        tp_create_zones,
+        tp_get_athlete_settings,
+        tp_get_pool_length_settings,
+        tp_update_ftp,
+        tp_update_hr_zones,
+        tp_update_nutrition,
+        tp_update_speed_zones,
+    )
+    from tp_mcp.tools.strength import (
+        tp_create_strength_workout,
+        tp_delete_strength_workout,
+        tp_get_strength_summary,
+        tp_get_strength_workout,
+        tp_get_strength_workouts,
+        tp_search_exercises,
+        tp_update_strength_workout,
+    )
+    from tp_mcp.tools.structure import tp_validate_structure
+    from tp_mcp.tools.training_summary import tp_get_training_summary
+    from tp_mcp.tools.weekly_summary import tp_get_weekly_summary
+    from tp_mcp.tools.workout_files import (
+        tp_delete_workout_file,
+        tp_download_workout_file,
+        tp_upload_workout_file,
+    )
+    from tp_mcp.tools.workout_types import tp_get_workout_types
+    from tp_mcp.tools.workouts import (
+        tp_add_workout_comment,
+        tp_bulk_create_workouts,
+        tp_bulk_delete_workouts,
+        tp_bulk_update_workouts,
+        tp_copy_workout,
+        tp_create_workout,
+        tp_delete_workout,
+        tp_get_workout,
+        tp_get_workout_comments,
+        tp_get_workout_note,
+        tp_get_workouts,
+        tp_pair_workout,
+        tp_reorder_workouts,
+        tp_set_workout_note,
+        tp_unpair_workout,
+        tp_update_workout,
+    )
+    from tp_mcp.tools.zone_methods import tp_get_zone_methods
+
+# Tool function -> defining module (relative to this package).
+_TOOL_MODULES: dict[str, str] = {
+    "tp_add_athletes_to_group": "groups",
+    "tp_add_note_comment": "events",
+    "tp_add_workout_comment": "workouts",
+    "tp_analyze_workout": "analyze",
+    "tp_apply_training_plan": "plans",
+    "tp_auth_status": "auth_status",
+    "tp_batch": "batch",
+    "tp_bulk_create_workouts": "workouts",
+    "tp_bulk_delete_workouts": "workouts",
+    "tp_bulk_update_workouts": "workouts",
+    "tp_copy_workout": "workouts",
+    "tp_create_availability": "events",
+    "tp_create_equipment": "equipment",
+    "tp_create_event": "events",
+    "tp_create_group": "groups",
+    "tp_create_library": "library",
+    "tp_create_library_item": "library",
+    "tp_create_note": "events",
+    "tp_create_strength_workout": "strength",
+    "tp_create_workout": "workouts",
+    "tp_create_zones": "settings",
+    "tp_delete_availability": "events",
+    "tp_delete_equipment": "equipment",
+    "tp_delete_event": "events",
+    "tp_delete_group": "groups",
+    "tp_delete_library": "library",
+    "tp_delete_note": "events",
+    "tp_delete_strength_workout": "strength",
+    "tp_delete_workout": "workouts",
+    "tp_delete_workout_file": "workout_files",
+    "tp_download_workout_file": "workout_files",
+    "tp_get_athlete_settings": "settings",
+    "tp_get_atp": "atp",
+    "tp_get_atp_compliance": "atp",
+    "tp_get_availability": "events",
+    "tp_get_compliance": "compliance",
+    "tp_get_equipment": "equipment",
+    "tp_get_events": "events",
+    "tp_get_fitness": "fitness",
+    "tp_get_focus_event": "events",
+    "tp_get_group_dashboard": "dashboard",
+    "tp_get_libraries": "library",
+    "tp_get_library_item": "library",
+    "tp_get_library_items": "library",
+    "tp_get_metrics": "metrics",
+    "tp_get_next_event": "events",
+    "tp_get_note": "events",
+    "tp_get_note_comments": "events",
+    "tp_get_nutrition": "metrics",
+    "tp_get_peaks": "peaks",
+    "tp_get_pool_length_settings": "settings",
+    "tp_get_profile": "profile",
+    "tp_get_strength_summary": "strength",
+    "tp_get_strength_workout": "strength",
+    "tp_get_strength_workouts": "strength",
+    "tp_get_training_plan": "plans",
+    "tp_get_training_plan_workouts": "plans",
+    "tp_get_training_summary": "training_summary",
+    "tp_get_weekly_summary": "weekly_summary",
+    "tp_get_workout": "workouts",
+    "tp_get_workout_comments": "workouts",
+    "tp_get_workout_note": "workouts",
+    "tp_get_workout_prs": "peaks",
+    "tp_get_workout_types": "workout_types",
+    "tp_get_workouts": "workouts",
+    "tp_get_zone_methods": "zone_methods",
+    "tp_list_athletes": "profile",
+    "tp_list_athletes_in_group": "groups",
+    "tp_list_groups": "groups",
+    "tp_list_notes": "events",
+    "tp_list_training_plans": "plans",
+    "tp_log_metrics": "metrics",
+    "tp_pair_workout": "workouts",
+    "tp_project_fitness": "projection",
+    "tp_refresh_auth": "refresh_auth",
+    "tp_remove_athletes_from_group": "groups",
+    "tp_rename_group": "groups",
+    "tp_reorder_workouts": "workouts",
+    "tp_schedule_library_workout": "library",
+    "tp_search_exercises": "strength",
+    "tp_set_workout_note": "workouts",
+    "tp_unpair_workout": "workouts",
+    "tp_update_equipment": "equipment",
+    "tp_update_event": "events",
+    "tp_update_ftp": "settings",
+    "tp_update_hr_zones": "settings",
+    "tp_update_library_item": "library",
+    "tp_update_note": "events",
+    "tp_update_nutrition": "settings",
+    "tp_update_speed_zones": "settings",
+    "tp_update_strength_workout": "strength",
+    "tp_update_workout": "workouts",
+    "tp_upload_workout_file": "workout_files",
+    "tp_validate_structure": "structure",
+}
 
 __all__ = [
     "tp_add_note_comment",
     "tp_add_workout_comment",
     "tp_analyze_workout",
     "tp_auth_status",
+    "tp_batch",
     "tp_copy_workout",
     "tp_create_availability",
     "tp_create_equipment",
@@ -145,6 +262,10 @@ __all__ = [
     "tp_get_pool_length_settings",
     "tp_get_profile",
     "tp_get_weekly_summary",
+    "tp_get_training_summary",
+    "tp_get_compliance",
+    "tp_get_atp_compliance",
+    "tp_project_fitness",
     "tp_get_workout",
     "tp_get_workout_comments",
     "tp_get_workout_note",
@@ -154,6 +275,7 @@ __all__ = [
     "tp_list_athletes",
     "tp_list_groups",
     "tp_list_athletes_in_group",
+    "tp_get_group_dashboard",
     "tp_create_group",
     "tp_rename_group",
     "tp_delete_group",
@@ -164,6 +286,9 @@ __all__ = [
     "tp_pair_workout",
     "tp_refresh_auth",
     "tp_reorder_workouts",
+    "tp_bulk_create_workouts",
+    "tp_bulk_update_workouts",
+    "tp_bulk_delete_workouts",
     "tp_schedule_library_workout",
     "tp_set_workout_note",
     "tp_unpair_workout",
@@ -187,3 +312,12 @@ __all__ = [
     "tp_delete_strength_workout",
     "tp_update_strength_workout",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _TOOL_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
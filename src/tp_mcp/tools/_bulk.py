@@ -0,0 +1,115 @@
+"""Bounded-concurrency helpers for tools that issue many API calls at once.
+
+Multi-item tools (reorder, bulk writes, plan apply, multi-athlete scheduling)
+fan out one request per item. An unbounded ``asyncio.gather`` bursts straight
+into HTTP 429s, so these helpers cap the number of in-flight requests and retry
+rate-limited calls with exponential backoff. Request spacing itself is enforced
+by ``TPClient._throttle``, which every coroutine sharing the client goes through.
+
+Both helpers respect the tool call's deadline (``tp_mcp.client.context``):
+``bounded_gather`` starts no new item once it has passed, and ``with_retries``
+never sleeps past it. Items already in flight run to completion - their HTTP
+timeouts are capped by the deadline - so a bulk tool can still report what it
+did, listing the items it never started next to the ones that succeeded.
+Cancellation of the call (MCP ``notifications/cancelled``) cancels every
+in-flight item along with its HTTP request.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+from tp_mcp.client import APIResponse, ErrorCode
+from tp_mcp.client.context import DeadlineExceededError, check_deadline, time_remaining
+
+logger = logging.getLogger("tp-mcp")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 4   # in-flight requests per bulk operation
+MAX_ATTEMPTS = 3          # first try + 2 retries
+RETRY_BASE_DELAY = 0.5    # seconds; doubles on each retry
+
+NOT_STARTED_MESSAGE = "Not started: the call's time limit was reached first. Safe to retry."
+
+
+def not_started_response(item: object = None) -> APIResponse:
+    """``bounded_gather`` outcome for an API call skipped at the deadline.
+
+    Carries ``ErrorCode.TIMEOUT``, which (unlike a timed-out request's
+    ``NETWORK_ERROR``) means nothing was sent.
+    """
+    return APIResponse(success=False, error_code=ErrorCode.TIMEOUT, message=NOT_STARTED_MESSAGE)
+
+
+async def with_retries(
+    call: Callable[[], Awaitable[APIResponse]],
+    *,
+    idempotent: bool = False,
+    attempts: int = MAX_ATTEMPTS,
+) -> APIResponse:
+    """Run ``call`` and retry it while it fails transiently.
+
+    A 429 is always safe to retry - TP rejected the request outright. A network
+    error is only retried for ``idempotent`` calls (GET/PUT/DELETE): a timed-out
+    POST may already have created the resource, and repeating it would duplicate.
+    """
+    retryable = {ErrorCode.RATE_LIMITED}
+    if idempotent:
+        retryable.add(ErrorCode.NETWORK_ERROR)
+
+    response = await call()
+    for attempt in range(1, attempts):
+        if response.success or response.error_code not in retryable:
+            break
+        delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
+        remaining = time_remaining()
+        if remaining is not None and remaining <= delay:
+            break  # the retry could not finish before the call's deadline
+        logger.info("Retrying after %s (attempt %d/%d, %.1fs)",
+                    response.error_code.value if response.error_code else "error",
+                    attempt + 1, attempts, delay)
+        await asyncio.sleep(delay)
+        response = await call()
+    return response
+
+
+async def bounded_gather(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int = DEFAULT_CONCURRENCY,
+    semaphore: asyncio.Semaphore | None = None,
+    *,
+    not_started: Callable[[T], R],
+) -> list[R]:
+    """Apply ``fn`` to every item with at most ``limit`` running at once.
+
+    Pass a ``semaphore`` instead to share one cap across several concurrent
+    pipelines (e.g. one per athlete) so their sum stays bounded.
+
+    Results are returned in input order, like ``asyncio.gather``. An item not
+    yet started when the call's deadline passes is not run; its result is
+    ``not_started(item)`` (``not_started_response`` for pipelines of API calls).
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            try:
+                check_deadline()
+            except DeadlineExceededError:
+                return not_started(item)
+            return await fn(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # gather leaves the siblings of a failed item running; stop them with it.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,38 @@
+"""Enum tables shared by tool modules and the server's input schemas.
+
+Kept free of pydantic and the HTTP client so ``tp_mcp.server`` can build its
+static tool list without importing any tool module.
+"""
+
+# Maps sport name to (workoutTypeFamilyId, workoutTypeValueId)
+# IDs confirmed from GET /fitness/v6/workouttypes
+SPORT_TYPE_MAP: dict[str, tuple[int, int]] = {
+    "Swim": (1, 1),
+    "Bike": (2, 2),
+    "Run": (3, 3),
+    "Brick": (4, 4),
+    "Crosstrain": (5, 5),
+    "Race": (6, 6),
+    "DayOff": (7, 7),
+    "MtnBike": (8, 8),
+    "Strength": (9, 9),
+    "Custom": (10, 10),
+    "XCSki": (11, 11),
+    "Rowing": (12, 12),
+    "Walk": (13, 13),
+    "Other": (100, 100),
+}
+
+
+# Known event types from the TrainingPeaks event UI (web-form enum values).
+# Not exhaustive and not enforced — the API may accept unlisted values.
+EVENT_TYPES = [
+    "RunningRoad", "RunningTrail", "RunningTrack", "RunningCrossCountry", "RunningOther",
+    "CyclingRoad", "CyclingMountain", "CyclingCyclocross", "CyclingTrack", "CyclingOther",
+    "SwimOpenWater", "SwimPool",
+    "MultisportTriathlon", "MultisportXterra", "MultisportDuathlon",
+    "MultisportAquabike", "MultisportAquathon", "MultisportOther",
+    "RowingRegatta", "RowingOther",
+    "SnowAlpine", "SnowNordic", "SnowSkiMountaineering", "SnowSnowshoe", "SnowOther",
+    "OtherAdventure", "OtherObstacle", "OtherSpeedSkate", "OtherOther",
+]
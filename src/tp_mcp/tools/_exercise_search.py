@@ -0,0 +1,157 @@
+"""Ranked, typo-tolerant search over the baked exercise catalogue.
+
+``tp_search_exercises`` used to lowercase every title and re-join every
+exercise's muscle groups on each call. ``ExerciseIndex`` does that work once
+per catalogue snapshot:
+
+- ``titles``: lowercased titles for substring / prefix / exact tiers;
+- ``token_postings``: normalised title token -> exercise positions, with
+  alias expansions ("db" -> "dumbbell") in ``alias_postings``. Query tokens
+  are expanded the same way, so "rdl" finds "Romanian Deadlift";
+- ``trigram_postings``: trigram -> vocabulary tokens containing it, so a
+  misspelt query token ("romainian") finds its nearest real tokens without a
+  scan;
+- ``muscle_postings``: muscle group -> exercise positions.
+
+Ranking, best first: exact title, title prefix, title substring, then every
+query token matched by an exact/prefix/fuzzy title token (scored by match
+quality). Ties go to the shorter title, then catalogue order.
+"""
+
+import bisect
+import re
+
+from tp_mcp.tools._exercises import Exercise
+
+# Abbreviations used in catalogue titles, and common names users type for them.
+_ALIASES: dict[str, tuple[str, ...]] = {
+    "db": ("dumbbell",),
+    "kb": ("kettlebell",),
+    "bb": ("barbell",),
+    "rdl": ("romanian", "deadlift"),
+    "sl": ("single", "leg"),
+    "ohp": ("overhead", "press"),
+}
+_WORD = re.compile(r"[0-9a-z]+")
+
+FUZZY_THRESHOLD = 0.5   # Dice coefficient over trigrams
+_EXACT, _PREFIX = 1.0, 0.8
+_FUZZY_WEIGHT = 0.7
+_ALIAS_WEIGHT = 0.9     # a title that spells the word out beats one abbreviating it
+
+
+def _tokens(text: str) -> list[str]:
+    return _WORD.findall(text.casefold())
+
+
+def _trigrams(token: str) -> set[str]:
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ExerciseIndex:
+    """Lookup tables over one catalogue snapshot (see module docstring)."""
+
+    def __init__(self, catalogue: dict[str, Exercise]):
+        # ``source`` is the catalogue dict this index was built from; rebuilt
+        # whenever ``_catalogue()`` hands back a different object.
+        self.source = catalogue
+        self.exercises: list[Exercise] = list(catalogue.values())
+        self.titles: list[str] = [ex.title.casefold() for ex in self.exercises]
+        self.token_postings: dict[str, set[int]] = {}
+        self.alias_postings: dict[str, set[int]] = {}
+        self.muscle_postings: dict[str, set[int]] = {}
+        for pos, ex in enumerate(self.exercises):
+            tokens = _tokens(ex.title)
+            for token in tokens:
+                self.token_postings.setdefault(token, set()).add(pos)
+            for token in tokens:
+                for expansion in _ALIASES.get(token, ()):
+                    self.alias_postings.setdefault(expansion, set()).add(pos)
+            for group in ex.primary_muscles + ex.secondary_muscles:
+                self.muscle_postings.setdefault(group.casefold(), set()).add(pos)
+        self.vocabulary: list[str] = sorted(self.token_postings.keys() | self.alias_postings.keys())
+        self.trigram_postings: dict[str, set[str]] = {}
+        for token in self.vocabulary:
+            for gram in _trigrams(token):
+                self.trigram_postings.setdefault(gram, set()).add(token)
+
+    def _prefixed(self, token: str) -> list[str]:
+        i = bisect.bisect_left(self.vocabulary, token)
+        out = []
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(token):
+            out.append(self.vocabulary[i])
+            i += 1
+        return out
+
+    def _token_matches(self, token: str) -> dict[int, float]:
+        """Exercise position -> best match weight for one query token."""
+        weights: dict[int, float] = {}
+
+        def credit(vocab_token: str, weight: float) -> None:
+            for postings, w in (
+                (self.token_postings, weight), (self.alias_postings, weight * _ALIAS_WEIGHT),
+            ):
+                for pos in postings.get(vocab_token, ()):
+                    if weights.get(pos, 0.0) < w:
+                        weights[pos] = w
+
+        for vocab_token in self._prefixed(token):
+            credit(vocab_token, _EXACT if vocab_token == token else _PREFIX)
+        if len(token) >= 3:
+            grams = _trigrams(token)
+            shared: dict[str, int] = {}
+            for gram in grams:
+                for vocab_token in self.trigram_postings.get(gram, ()):
+                    shared[vocab_token] = shared.get(vocab_token, 0) + 1
+            for vocab_token, n in shared.items():
+                dice = 2 * n / (len(grams) + len(_trigrams(vocab_token)))
+                if dice >= FUZZY_THRESHOLD:
+                    credit(vocab_token, dice * _FUZZY_WEIGHT)
+        return weights
+
+    def _query_token_matches(self, token: str) -> dict[int, float]:
+        """Like ``_token_matches``, also crediting titles that spell out an alias."""
+        weights = self._token_matches(token)
+        expansion = _ALIASES.get(token)
+        if expansion:
+            parts = [self._token_matches(t) for t in expansion]
+            for pos in set(parts[0]).intersection(*parts[1:]):
+                w = sum(p[pos] for p in parts) / len(parts)
+                if weights.get(pos, 0.0) < w:
+                    weights[pos] = w
+        return weights
+
+    def muscle(self, query: str) -> set[int]:
+        """Positions whose primary/secondary groups contain ``query`` (substring)."""
+        q = query.casefold()
+        out: set[int] = set()
+        for group, positions in self.muscle_postings.items():
+            if q in group:
+                out |= positions
+        return out
+
+    def search(self, query: str, muscle_group: str = "") -> list[Exercise]:
+        """Ranked exercises matching ``query`` and/or ``muscle_group``."""
+        allowed = self.muscle(muscle_group) if muscle_group else None
+        q = query.strip().casefold()
+        if not q:
+            return [self.exercises[p] for p in sorted(allowed or ())]
+
+        ranked: dict[int, tuple[int, float]] = {}  # position -> (tier, -score)
+        for pos, title in enumerate(self.titles):
+            if q in title:
+                tier = 0 if title == q else 1 if title.startswith(q) else 2
+                ranked[pos] = (tier, 0.0)
+
+        query_tokens = _tokens(q)
+        if query_tokens:
+            per_token = [self._query_token_matches(t) for t in query_tokens]
+            common = set(per_token[0]).intersection(*per_token[1:])
+            for pos in common - ranked.keys():
+                ranked[pos] = (3, -sum(m[pos] for m in per_token))
+
+        if allowed is not None:
+            ranked = {p: r for p, r in ranked.items() if p in allowed}
+        order = sorted(ranked, key=lambda p: (*ranked[p], len(self.titles[p]), p))
+        return [self.exercises[p] for p in order]
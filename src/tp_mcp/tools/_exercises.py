@@ -0,0 +1,128 @@
+"""Compact, precompiled form of the baked exercise catalogue.
+
+``data/exercises.json`` is 354 KB of nested dicts; parsing it cost ~7 ms on
+the first strength tool call and kept ~1.4 MB of objects resident, most of it
+fields no tool reads (per-parameter category/unit/id). The first load projects
+each exercise to the fields the tools use, interns the repeated strings (muscle
+groups, parameter names) and writes the rows with ``marshal`` to a cache file.
+Later processes memory-map that file and ``marshal.loads`` it directly; each
+row becomes an ``Exercise`` tuple without any further parsing.
+
+The cache file name carries the interpreter's cache tag (marshal's format is
+version-specific) and is invalidated whenever the JSON's size or mtime changes.
+Any cache problem falls back to the JSON - the cache is an optimisation only.
+"""
+
+import contextlib
+import json
+import logging
+import marshal
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from tp_mcp.auth.encrypted import CONFIG_DIR
+
+logger = logging.getLogger("tp-mcp")
+
+CACHE_DIR = CONFIG_DIR / "cache"
+_FORMAT = 1
+
+
+class Exercise(NamedTuple):
+    """One library exercise - only the fields the strength tools read."""
+
+    id: str
+    title: str
+    video_url: str | None
+    primary_muscles: tuple[str, ...]
+    secondary_muscles: tuple[str, ...]
+    parameters: tuple[str, ...]  # parameter names the exercise natively prescribes
+
+
+# marshal stores plain tuples; same field order as ``Exercise``.
+Row = tuple[str, str, str | None, tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+
+
+def _source() -> Path:
+    try:
+        from importlib.resources import files
+
+        path = Path(str(files("tp_mcp").joinpath("data/exercises.json")))
+        if path.is_file():
+            return path
+    except Exception:
+        pass
+    # dev / editable install fallback
+    return Path(__file__).resolve().parent.parent / "data" / "exercises.json"
+
+
+def _fingerprint(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _cache_file() -> Path:
+    return CACHE_DIR / f"exercises-{sys.implementation.cache_tag}.marshal"
+
+
+def compile_rows(raw: dict[str, dict[str, Any]]) -> list[Row]:
+    """Project parsed JSON to compact rows with interned repeated strings."""
+    intern = sys.intern
+    rows: list[Row] = []
+    for ex in raw.values():
+        rows.append((
+            str(ex["id"]),
+            ex["title"],
+            ex.get("videoUrl"),
+            tuple(intern(g) for g in ex.get("primaryMuscleGroups", [])),
+            tuple(intern(g) for g in ex.get("secondaryMuscleGroups", [])),
+            tuple(intern(p["parameter"]) for p in ex.get("parameters", [])),
+        ))
+    return rows
+
+
+def _read_cache(path: Path, fingerprint: tuple[int, int]) -> list[Row] | None:
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            fmt, stored, rows = marshal.loads(m)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, EOFError, TypeError) as e:
+        logger.debug("Ignoring unreadable exercise cache %s: %s", path, e)
+        return None
+    if fmt != _FORMAT or tuple(stored) != fingerprint:
+        return None
+    return rows
+
+
+def _write_cache(path: Path, fingerprint: tuple[int, int], rows: list[Row]) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(marshal.dumps((_FORMAT, fingerprint, rows)))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug("Could not write exercise cache %s: %s", path, e)
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+
+def load_rows() -> list[Row]:
+    """Compact catalogue rows, from the compiled cache when it is current."""
+    source = _source()
+    fingerprint = _fingerprint(source)
+    cache = _cache_file()
+    rows = _read_cache(cache, fingerprint)
+    if rows is None:
+        rows = compile_rows(json.loads(source.read_text(encoding="utf-8")))
+        _write_cache(cache, fingerprint, rows)
+    return rows
+
+
+def load_catalogue() -> dict[str, Exercise]:
+    """The catalogue keyed by string id."""
+    make = Exercise._make
+    return {row[0]: make(row) for row in load_rows()}
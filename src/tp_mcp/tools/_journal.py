@@ -0,0 +1,129 @@
+"""Local journal of plan workouts already materialised on a calendar.
+
+``tp_apply_training_plan`` creates one workout per plan entry. If a run dies
+halfway (network drop, 429 storm, client restart) the calendar is left
+half-populated, and a naive rerun would duplicate everything that did land.
+The journal records ``(plan, athlete, start date, relative day, title)`` ->
+created workout id as each POST succeeds, so a rerun skips those entries.
+
+Stored as JSON next to the encrypted credentials (owner-only permissions).
+Writes go to a temp file and are swapped in with ``os.replace`` so a crash
+mid-write never leaves a truncated journal behind. Each record is on disk
+before ``record`` returns - a workout the rerun does not know about would be
+created twice. The write runs on a worker thread, and records that arrive
+while one is in flight are coalesced into the next write, so a concurrent
+apply does not rewrite the file once per workout on the event loop.
+Runs not written to for ``RUN_MAX_AGE_DAYS`` are dropped on the next save.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from tp_mcp.auth.encrypted import CONFIG_DIR
+
+logger = logging.getLogger("tp-mcp")
+
+JOURNAL_FILE = CONFIG_DIR / "plan_journal.json"
+_VERSION = 2
+RUN_MAX_AGE_DAYS = 90   # runs untouched this long are pruned
+
+# Journals of concurrent runs (a group apply) read-modify-write the same file.
+_file_lock = threading.Lock()
+
+
+def _load(path: Path) -> dict[str, dict[str, Any]]:
+    """Runs in the journal: ``run -> {"updated": epoch seconds, "entries": {...}}``."""
+    try:
+        raw = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable plan journal %s: %s", path, e)
+        return {}
+    runs = raw.get("runs") if isinstance(raw, dict) else None
+    if not isinstance(runs, dict):
+        return {}
+    loaded: dict[str, dict[str, Any]] = {}
+    for name, run in runs.items():
+        if not isinstance(run, dict):
+            continue
+        if isinstance(run.get("entries"), dict):
+            updated = run.get("updated")
+            loaded[name] = {
+                "updated": updated if isinstance(updated, int | float) else time.time(),
+                "entries": run["entries"],
+            }
+        else:  # version 1: the run was its entries; start its age now
+            loaded[name] = {"updated": time.time(), "entries": run}
+    return loaded
+
+
+class PlanJournal:
+    """Entries of one apply run: ``entry key -> workout id``.
+
+    A run is one (plan, athlete, start date) triple - applying the same plan
+    again from a different start date is a separate, legitimate run.
+    """
+
+    def __init__(self, plan_id: int, athlete_id: int, start_date: str, path: Path | None = None):
+        self._path = path or JOURNAL_FILE
+        self._run = f"{plan_id}:{athlete_id}:{start_date}"
+        self._lock = asyncio.Lock()
+        self._unsaved = 0
+        self.entries: dict[str, int] = dict(_load(self._path).get(self._run, {}).get("entries", {}))
+
+    @staticmethod
+    def entry_key(rel_day: int, title: str, occurrence: int) -> str:
+        """Key for one plan workout; ``occurrence`` disambiguates same-day twins."""
+        return f"{rel_day}|{title}|{occurrence}"
+
+    async def record(self, key: str, workout_id: int) -> None:
+        """Note a created workout and write it out before returning."""
+        self.entries[key] = workout_id
+        self._unsaved += 1
+        await self.flush()
+
+    async def forget(self, keys: list[str]) -> None:
+        """Drop entries whose workouts no longer exist on the calendar."""
+        if not keys:
+            return
+        for key in keys:
+            self.entries.pop(key, None)
+        self._unsaved += len(keys)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write unsaved records. Call when the run ends, including on failure."""
+        async with self._lock:
+            if not self._unsaved:
+                return  # an earlier write, queued ahead of us, already saved them
+            self._unsaved = 0
+            await asyncio.to_thread(self._save, dict(self.entries))
+
+    def _save(self, entries: dict[str, int]) -> None:
+        with _file_lock:
+            now = time.time()
+            max_age = RUN_MAX_AGE_DAYS * 86400
+            runs = {name: run for name, run in _load(self._path).items() if now - run["updated"] < max_age}
+            runs[self._run] = {"updated": now, "entries": entries}
+            self._write({"version": _VERSION, "runs": runs})
+
+    def _write(self, payload: dict[str, Any]) -> None:
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload))
+            with contextlib.suppress(OSError):
+                os.chmod(tmp, stat.S_IRUSR | stat.S_IWUSR)
+            os.replace(tmp, self._path)
+        except OSError as e:
+            # Journaling is best-effort: a read-only home must not fail the apply.
+            logger.warning("Could not write plan journal %s: %s", self._path, e)
@@ -0,0 +1,217 @@
+"""In-process Performance Management Chart (CTL/ATL/TSB) engine.
+
+The ``performancedata`` endpoint recomputes the whole chart server-side for one
+pair of time constants, so every "what if CTL used 28 days" question - and
+every repeat view of the PMC app - used to be another round-trip. The only
+input the chart really needs is the daily ``tssActual`` series, which is
+immutable once a day is well in the past.
+
+``TSSCache`` keeps that series per athlete for the life of the process and
+fetches only the days it does not hold yet (or holds stale copies of: today
+and yesterday change as workouts sync, so they expire after a few minutes).
+``compute_pmc`` then derives CTL/ATL/TSB for any constants, seeds and range in
+one linear pass - exponential smoothing is a first-order recurrence, so there
+is nothing to vectorise beyond a tight loop.
+
+Recurrence (the one TrainingPeaks documents for the PMC)::
+
+    ctl[d] = ctl[d-1] + (tss[d] - ctl[d-1]) / ctl_constant
+    atl[d] = atl[d-1] + (tss[d] - atl[d-1]) / atl_constant
+    tsb[d] = ctl[d-1] - atl[d-1]        # form is yesterday's fitness - fatigue
+
+seeded with ``ctl_start``/``atl_start`` on the day before the range, which is
+exactly what the endpoint does with ``ctlStart``/``atlStart``.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, NamedTuple
+
+from tp_mcp.client import APIResponse, TPClient
+from tp_mcp.tools._bulk import bounded_gather, not_started_response, with_retries
+
+logger = logging.getLogger("tp-mcp")
+
+DEFAULT_ATL_CONSTANT = 7
+DEFAULT_CTL_CONSTANT = 42
+
+TSS_FETCH_WINDOW_DAYS = 365   # one performancedata request per year of history
+RECENT_DAYS = 2               # today + yesterday still change as workouts sync
+RECENT_TTL = 5 * 60           # seconds a recent day is trusted
+HISTORY_TTL = 6 * 60 * 60     # seconds an older day is trusted (late uploads/edits)
+SEED_CONSTANTS = 3            # history warm-up, in CTL time constants
+
+
+class PMCPoint(NamedTuple):
+    """One day of the chart."""
+
+    day: date
+    tss: float
+    ctl: float
+    atl: float
+    tsb: float
+
+
+def compute_pmc(
+    tss: list[float],
+    start: date,
+    ctl_constant: float = DEFAULT_CTL_CONSTANT,
+    atl_constant: float = DEFAULT_ATL_CONSTANT,
+    ctl_start: float = 0.0,
+    atl_start: float = 0.0,
+) -> list[PMCPoint]:
+    """CTL/ATL/TSB for a contiguous daily TSS series beginning on ``start``."""
+    ctl_k = 1.0 / ctl_constant
+    atl_k = 1.0 / atl_constant
+    ctl, atl = float(ctl_start), float(atl_start)
+    points: list[PMCPoint] = []
+    day = start
+    one_day = timedelta(days=1)
+    for value in tss:
+        tsb = ctl - atl
+        ctl += (value - ctl) * ctl_k
+        atl += (value - atl) * atl_k
+        points.append(PMCPoint(day, value, ctl, atl, tsb))
+        day += one_day
+    return points
+
+
+def seed_start(start: date, ctl_constant: float = DEFAULT_CTL_CONSTANT) -> date:
+    """First day to smooth from so CTL/ATL on ``start`` reflect the training before it."""
+    return start - timedelta(days=round(SEED_CONSTANTS * ctl_constant))
+
+
+def _days(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def _runs(days: list[date], max_len: int) -> list[tuple[date, date]]:
+    """Group sorted days into contiguous (start, end) spans of at most ``max_len`` days."""
+    spans: list[tuple[date, date]] = []
+    for day in days:
+        if spans:
+            first, last = spans[-1]
+            if day == last + timedelta(days=1) and (day - first).days < max_len:
+                spans[-1] = (first, day)
+                continue
+        spans.append((day, day))
+    return spans
+
+
+@dataclass
+class TSSSeries:
+    """Cached daily actual TSS for one athlete.
+
+    ``tss`` holds only days the API reported; ``fetched_at`` records every day
+    that was covered by a fetch, so a gap in ``tss`` inside a covered span is a
+    genuine rest day rather than a cache miss.
+    """
+
+    tss: dict[date, float]
+    fetched_at: dict[date, float]
+
+
+class TSSCache:
+    """Process-wide per-athlete daily TSS, filled on demand."""
+
+    def __init__(self) -> None:
+        self._series: dict[int, TSSSeries] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    def clear(self, athlete_id: int | None = None) -> None:
+        """Forget one athlete's series, or everything."""
+        if athlete_id is None:
+            self._series.clear()
+            self._locks.clear()
+        else:
+            self._series.pop(athlete_id, None)
+
+    def _stale_days(self, series: TSSSeries, days: list[date], today: date) -> list[date]:
+        now = time.monotonic()
+        recent_from = today - timedelta(days=RECENT_DAYS - 1)
+        stale = []
+        for day in days:
+            at = series.fetched_at.get(day)
+            ttl = RECENT_TTL if day >= recent_from else HISTORY_TTL
+            if at is None or now - at > ttl:
+                stale.append(day)
+        return stale
+
+    async def load(
+        self, client: TPClient, athlete_id: int, start: date, end: date,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> tuple[TSSSeries | None, APIResponse | None]:
+        """Ensure [start, end] is cached, fetching only missing or stale days.
+
+        Pass a ``semaphore`` to count the reads against a caller's shared cap.
+
+        Returns:
+            ``(series, None)`` or ``(None, failing_response)``.
+        """
+        lock = self._locks.setdefault(athlete_id, asyncio.Lock())
+        async with lock:
+            series = self._series.setdefault(athlete_id, TSSSeries({}, {}))
+            spans = _runs(
+                self._stale_days(series, _days(start, end), date.today()), TSS_FETCH_WINDOW_DAYS,
+            )
+            if not spans:
+                return series, None
+
+            base = f"/fitness/v1/athletes/{athlete_id}/reporting/performancedata"
+            body = {
+                "atlConstant": DEFAULT_ATL_CONSTANT,
+                "atlStart": 0,
+                "ctlConstant": DEFAULT_CTL_CONSTANT,
+                "ctlStart": 0,
+                "workoutTypes": [],
+            }
+
+            async def read(span: tuple[date, date]) -> APIResponse:
+                endpoint = f"{base}/{span[0]}/{span[1]}"
+                return await with_retries(lambda: client.post(endpoint, json=body), idempotent=True)
+
+            responses = await bounded_gather(read, spans, semaphore=semaphore, not_started=not_started_response)
+            now = time.monotonic()
+            for (a, b), response in zip(spans, responses, strict=True):
+                if response.is_error:
+                    return None, response
+                for day in _days(a, b):
+                    series.tss.pop(day, None)
+                    series.fetched_at[day] = now
+                for entry in response.data if isinstance(response.data, list) else []:
+                    if not isinstance(entry, dict):
+                        continue
+                    try:
+                        day = date.fromisoformat((entry.get("workoutDay") or "")[:10])
+                    except ValueError:
+                        continue
+                    series.tss[day] = entry.get("tssActual") or 0
+            logger.debug("PMC cache: fetched %d span(s) for athlete %s", len(spans), athlete_id)
+            return series, None
+
+
+tss_cache = TSSCache()
+
+
+def reported_days(series: TSSSeries, start: date, end: date) -> list[date]:
+    """Days in [start, end] the API returned an entry for, in order."""
+    return [d for d in _days(start, end) if d in series.tss]
+
+
+def daily_tss(series: TSSSeries, start: date, end: date) -> list[float]:
+    """Contiguous TSS list for [start, end]; unreported days count as rest."""
+    return [series.tss.get(d, 0.0) for d in _days(start, end)]
+
+
+def point_dict(point: PMCPoint) -> dict[str, Any]:
+    """The ``daily_data`` row shape shared by the fitness tools."""
+    return {
+        "date": point.day.isoformat(),
+        "tss": point.tss,
+        "ctl": round(point.ctl, 1),
+        "atl": round(point.atl, 1),
+        "tsb": round(point.tsb, 1),
+    }
@@ -0,0 +1,98 @@
+"""Background warm-up of session reference data.
+
+Once the startup auth check passes, the server fetches in the background the
+data most tool calls read first: the roster (``/users/v3/user``, behind every
+``ensure_athlete_id``), athlete settings, workout types and equipment. The
+first real calls then skip one or two dependent round-trips each.
+
+``zone_methods`` (the zone-method fingerprints) is opt-in: it costs ~50
+zone-calculator POSTs, too many to spend on every launch by default.
+
+Configured with ``TP_MCP_PREFETCH``: unset for the defaults, ``off`` to
+disable, ``all``, or a comma-separated list of item names.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Sequence
+
+from tp_mcp.client import REFERENCE_TTL, TPClient
+
+logger = logging.getLogger("tp-mcp")
+
+PREFETCH_ENV = "TP_MCP_PREFETCH"
+ITEMS = ("roster", "settings", "workout_types", "equipment", "zone_methods")
+DEFAULT_ITEMS = ("roster", "settings", "workout_types", "equipment")
+_OFF = {"off", "none", "0", "false", "no"}
+
+
+def configured_items(value: str | None = None) -> tuple[str, ...]:
+    """Items to prefetch, from ``value`` or the ``TP_MCP_PREFETCH`` env var."""
+    if value is None:
+        value = os.environ.get(PREFETCH_ENV)
+    if value is None:
+        return DEFAULT_ITEMS
+    names = {v.strip().lower() for v in value.split(",") if v.strip()}
+    if not names or names & _OFF:
+        return ()
+    if "all" in names:
+        return ITEMS
+    unknown = sorted(names - set(ITEMS))
+    if unknown:
+        logger.warning("Ignoring unknown %s item(s): %s", PREFETCH_ENV, ", ".join(unknown))
+    return tuple(item for item in ITEMS if item in names)
+
+
+async def _zone_methods(client: TPClient) -> bool:
+    from tp_mcp.tools.zone_methods import METRICS, probe_metric_cached
+
+    user_id = ((await client._get_user_data()) or {}).get("userId")
+    if not isinstance(user_id, int):
+        return False
+    found = await asyncio.gather(*(probe_metric_cached(client, user_id, m) for m in METRICS))
+    return all(found)
+
+
+async def _cached_get(client: TPClient, endpoint: str) -> bool:
+    return (await client.get(endpoint, cache_ttl=REFERENCE_TTL)).success
+
+
+async def prefetch(items: Sequence[str]) -> dict[str, bool]:
+    """Warm the caches behind ``items`` concurrently.
+
+    Returns:
+        Item -> whether it was fetched. Failures are logged, never raised;
+        cancellation (server shutdown) propagates.
+    """
+    if not items:
+        return {}
+    from tp_mcp.tools.equipment import EQUIPMENT_ENDPOINT
+    from tp_mcp.tools.settings import SETTINGS_ENDPOINT
+    from tp_mcp.tools.workout_types import WORKOUT_TYPES_ENDPOINT
+
+    async with TPClient() as client:
+        # Every other item is keyed by athlete, so the roster always comes first.
+        athlete_id = await client.ensure_athlete_id()
+        if not athlete_id:
+            logger.info("Prefetch skipped: could not resolve the athlete")
+            return dict.fromkeys(items, False)
+
+        jobs: dict[str, Awaitable[bool]] = {}
+        if "settings" in items:
+            jobs["settings"] = _cached_get(client, SETTINGS_ENDPOINT.format(athlete_id=athlete_id))
+        if "workout_types" in items:
+            jobs["workout_types"] = _cached_get(client, WORKOUT_TYPES_ENDPOINT)
+        if "equipment" in items:
+            jobs["equipment"] = _cached_get(client, EQUIPMENT_ENDPOINT.format(athlete_id=athlete_id))
+        if "zone_methods" in items:
+            jobs["zone_methods"] = _zone_methods(client)
+        outcomes = await asyncio.gather(*jobs.values(), return_exceptions=True)
+
+    done = {"roster": True} if "roster" in items else {}
+    for item, outcome in zip(jobs, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            logger.warning("Prefetch of %s failed: %s", item, outcome)
+        done[item] = outcome is True
+    logger.info("Prefetched %s", ", ".join(item for item, ok in done.items() if ok) or "nothing")
+    return done
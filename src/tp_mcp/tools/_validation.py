@@ -6,6 +6,8 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 
+from tp_mcp.tools._constants import SPORT_TYPE_MAP
+
 
 def format_validation_error(exc: ValidationError) -> str:
     """Convert ValidationError to a clean user-facing message."""
@@ -81,8 +83,6 @@ class CreateWorkoutInput(BaseModel):
     @field_validator("sport")
     @classmethod
     def check_sport(cls, v: str) -> str:
-        from tp_mcp.tools.workouts import SPORT_TYPE_MAP
-
         if v not in SPORT_TYPE_MAP:
             valid = ", ".join(SPORT_TYPE_MAP.keys())
             raise ValueError(f"Invalid sport '{v}'. Valid: {valid}")
@@ -147,8 +147,6 @@ class UpdateWorkoutInput(BaseModel):
     def check_sport(cls, v: str | None) -> str | None:
         if v is None:
             return v
-        from tp_mcp.tools.workouts import SPORT_TYPE_MAP
-
         if v not in SPORT_TYPE_MAP:
             valid = ", ".join(SPORT_TYPE_MAP.keys())
             raise ValueError(f"Invalid sport '{v}'. Valid: {valid}")
@@ -174,10 +172,14 @@ class SingleDateInput(BaseModel):
         return v
 
 
+MAX_FITNESS_YEARS = 20
+
+
 class FitnessInput(BaseModel):
     """Validates input for fitness queries."""
 
     days: int = Field(default=90, ge=1, le=365)
+    years: int | None = Field(default=None, ge=1, le=MAX_FITNESS_YEARS)
     start_date: date_type | None = None
     end_date: date_type | None = None
 
@@ -195,6 +197,8 @@ class FitnessInput(BaseModel):
         if self.start_date and self.end_date:
             if self.start_date > self.end_date:
                 raise ValueError("start_date must be before end_date")
+            if (self.end_date - self.start_date).days > MAX_FITNESS_YEARS * 366:
+                raise ValueError(f"Date range too large. Maximum {MAX_FITNESS_YEARS} years.")
         elif self.start_date or self.end_date:
             raise ValueError("Provide both start_date and end_date, or neither")
         return self
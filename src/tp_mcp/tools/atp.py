@@ -1,15 +1,53 @@
-"""Annual Training Plan tool."""
+"""Annual Training Plan tools: weekly targets and season compliance."""
 
+import asyncio
 import logging
+from datetime import date, timedelta
 from typing import Any
 
 from pydantic import ValidationError
 
-from tp_mcp.client import TPClient
+from tp_mcp.client import APIResponse, TPClient, parse_workout_list
+from tp_mcp.tools._bulk import bounded_gather, not_started_response, with_retries
 from tp_mcp.tools._validation import DateRangeInput, format_validation_error
+from tp_mcp.tools.workouts import fetch_workouts_range
 
 logger = logging.getLogger("tp-mcp")
 
+ATP_RANGE_WINDOW_DAYS = 90
+
+
+async def fetch_atp_range(
+    client: TPClient, athlete_id: int, start: date, end: date,
+) -> tuple[list[dict[str, Any]] | None, APIResponse | None]:
+    """Raw ATP weeks in [start, end], reading 90-day windows concurrently.
+
+    Returns:
+        ``(weeks, None)`` in date order, de-duplicated by week, or
+        ``(None, failing_response)``.
+    """
+    windows: list[tuple[date, date]] = []
+    cursor = start
+    while cursor <= end:
+        window_end = min(end, cursor + timedelta(days=ATP_RANGE_WINDOW_DAYS - 1))
+        windows.append((cursor, window_end))
+        cursor = window_end + timedelta(days=1)
+
+    async def read(window: tuple[date, date]) -> APIResponse:
+        endpoint = f"/fitness/v1/athletes/{athlete_id}/atp/{window[0].isoformat()}/{window[1].isoformat()}"
+        return await with_retries(lambda: client.get(endpoint), idempotent=True)
+
+    weeks: dict[str, dict[str, Any]] = {}
+    for response in await bounded_gather(read, windows, not_started=not_started_response):
+        if response.is_error:
+            return None, response
+        if isinstance(response.data, list):
+            for w in response.data:
+                # A week straddling a window boundary comes back from both reads.
+                if isinstance(w, dict):
+                    weeks.setdefault(str(w.get("week", ""))[:10], w)
+    return [weeks[k] for k in sorted(weeks)], None
+
 
 async def tp_get_atp(start_date: str, end_date: str) -> dict[str, Any]:
     """Get Annual Training Plan - weekly TSS targets, training periods, races.
@@ -77,3 +115,155 @@ async def tp_get_atp(start_date: str, end_date: str) -> dict[str, Any]:
             "count": len(weeks),
             "date_range": {"start": start_date, "end": end_date},
         }
+
+
+MAX_ATP_COMPLIANCE_DAYS = 366
+
+
+def _phase(period: str) -> str:
+    """Phase name of an ATP period label, e.g. "Base 1" for "Base 1 - Week 2"."""
+    return period.split(" - ")[0].strip() or "Unassigned"
+
+
+def _deviation(actual: float, planned: float) -> dict[str, Any]:
+    return {
+        "deviation": round(actual - planned, 1),
+        "pct": round(100 * actual / planned) if planned else None,
+    }
+
+
+async def tp_get_atp_compliance(start_date: str, end_date: str) -> dict[str, Any]:
+    """Compare ATP weekly volume against actual load over a season.
+
+    Args:
+        start_date: Start date (YYYY-MM-DD).
+        end_date: End date (YYYY-MM-DD), up to 366 days after start.
+
+    Returns:
+        Dict with one ``weeks`` row per ISO week (ATP volume vs actual TSS and
+        hours), ``by_period`` rollups per ATP phase and season ``totals``.
+    """
+    try:
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+    except (TypeError, ValueError) as e:
+        return {"isError": True, "error_code": "VALIDATION_ERROR", "message": f"Invalid date: {e}"}
+    if start > end:
+        return {
+            "isError": True,
+            "error_code": "VALIDATION_ERROR",
+            "message": "start_date must be before or equal to end_date",
+        }
+    if (end - start).days >= MAX_ATP_COMPLIANCE_DAYS:
+        return {
+            "isError": True,
+            "error_code": "VALIDATION_ERROR",
+            "message": f"Date range too large. Maximum {MAX_ATP_COMPLIANCE_DAYS} days.",
+        }
+
+    async with TPClient() as client:
+        athlete_id = await client.ensure_athlete_id()
+        if not athlete_id:
+            return {
+                "isError": True,
+                "error_code": "AUTH_INVALID",
+                "message": "Could not get athlete ID. Re-authenticate.",
+            }
+        # Read workouts from the Monday of start's week through the Sunday of
+        # end's week (but not past today), so the weeks straddling either end
+        # are compared against all of their actuals, not a truncated part.
+        week_of_start = start - timedelta(days=start.weekday())
+        end_of_week = max(end, min(end + timedelta(days=6 - end.weekday()), date.today()))
+        (atp, atp_failed), (raw, workouts_failed) = await asyncio.gather(
+            fetch_atp_range(client, athlete_id, start, end),
+            fetch_workouts_range(client, athlete_id, week_of_start, end_of_week),
+        )
+
+    if atp is None or raw is None:
+        failed = atp_failed or workouts_failed
+        return {
+            "isError": True,
+            "error_code": failed.error_code.value if failed and failed.error_code else "API_ERROR",
+            "message": failed.message if failed else "Could not read the ATP.",
+        }
+
+    try:
+        workouts = parse_workout_list(raw)
+    except ValidationError as e:
+        logger.exception("Failed to parse workouts")
+        return {"isError": True, "error_code": "API_ERROR", "message": format_validation_error(e)}
+
+    # Week index: ISO (year, week) -> row, built once from the ATP and then
+    # filled by a single pass over the workouts.
+    index: dict[tuple[int, int], dict[str, Any]] = {}
+    for w in atp:
+        try:
+            week_start = date.fromisoformat(str(w.get("week", ""))[:10])
+        except ValueError:
+            continue
+        iso = week_start.isocalendar()
+        index[(iso.year, iso.week)] = {
+            "week_start": (week_start - timedelta(days=week_start.weekday())).isoformat(),
+            "iso_week": f"{iso.year}-W{iso.week:02d}",
+            "period": w.get("period", ""),
+            "race_name": w.get("raceName", ""),
+            "tss_planned": float(w.get("volume") or 0),
+            "tss_actual": 0.0,
+            "hours_planned": 0.0,
+            "hours_actual": 0.0,
+        }
+    unmatched_tss = 0.0
+    for wo in workouts:
+        iso = wo.workout_date.isocalendar()
+        row = index.get((iso.year, iso.week))
+        if row is None:
+            unmatched_tss += wo.tss_actual or 0
+            continue
+        row["tss_actual"] += wo.tss_actual or 0
+        row["hours_planned"] += wo.duration_planned or 0
+        row["hours_actual"] += wo.duration_actual or 0
+
+    weeks = []
+    phases: dict[str, dict[str, Any]] = {}
+    for row in sorted(index.values(), key=lambda r: r["week_start"]):
+        phase = phases.setdefault(_phase(row["period"]), {
+            "period": _phase(row["period"]), "weeks": 0,
+            "tss_planned": 0.0, "tss_actual": 0.0, "hours_planned": 0.0, "hours_actual": 0.0,
+        })
+        phase["weeks"] += 1
+        for k in ("tss_planned", "tss_actual", "hours_planned", "hours_actual"):
+            phase[k] += row[k]
+        weeks.append({
+            **row,
+            "tss_actual": round(row["tss_actual"], 1),
+            "hours_planned": round(row["hours_planned"], 2),
+            "hours_actual": round(row["hours_actual"], 2),
+            **_deviation(row["tss_actual"], row["tss_planned"]),
+        })
+
+    def rollup(r: dict[str, Any]) -> dict[str, Any]:
+        return {
+            **r,
+            "tss_planned": round(r["tss_planned"], 1),
+            "tss_actual": round(r["tss_actual"], 1),
+            "hours_planned": round(r["hours_planned"], 2),
+            "hours_actual": round(r["hours_actual"], 2),
+            **_deviation(r["tss_actual"], r["tss_planned"]),
+        }
+
+    totals = {
+        k: sum(p[k] for p in phases.values())
+        for k in ("weeks", "tss_planned", "tss_actual", "hours_planned", "hours_actual")
+    }
+    result: dict[str, Any] = {
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "weeks": weeks,
+        "by_period": [rollup(p) for p in phases.values()],
+        "totals": rollup(totals),
+    }
+    if not weeks:
+        result["message"] = "No ATP data for this date range."
+    if unmatched_tss:
+        result["tss_outside_atp"] = round(unmatched_tss, 1)
+    return result
@@ -0,0 +1,106 @@
+"""tp_batch - run several independent read-only tool calls in one request.
+
+Information-gathering phases often issue 5-15 independent reads back to back,
+each paying a full model -> host -> server round-trip. ``tp_batch`` takes the
+whole list at once, dispatches the entries concurrently through the server's
+normal tool dispatch (so argument checks, athlete targeting and deadlines
+behave exactly as for a direct call) and returns the results in input order.
+
+Only read-only tools may be batched: hosts that auto-approve read-only tools
+would otherwise let a write slip through behind ``tp_batch``'s own annotation.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Collection
+from typing import Any
+
+from tp_mcp.client.context import progress_reporter, report_progress, time_remaining
+from tp_mcp.tools._bulk import DEFAULT_CONCURRENCY
+
+MAX_BATCH_CALLS = 20
+MAX_BATCH_CONCURRENCY = 8
+
+# (tool name, arguments) -> that tool's result object.
+Dispatch = Callable[[str, dict[str, Any]], Awaitable[Any]]
+
+
+def _entry_error(error_code: str, message: str) -> dict[str, Any]:
+    return {"isError": True, "error_code": error_code, "message": message}
+
+
+def _prepare(entry: Any, allowed: Collection[str]) -> tuple[str, dict[str, Any]] | dict[str, Any]:
+    """(name, arguments) for a well-formed entry, else its error result."""
+    if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+        return _entry_error("INVALID_ARGS", "Each call must be an object with a string 'name'.")
+    name = entry["name"]
+    arguments = entry.get("arguments") or {}
+    if not isinstance(arguments, dict):
+        return _entry_error("INVALID_ARGS", f"arguments for {name} must be an object.")
+    if name not in allowed:
+        return _entry_error("INVALID_ARGS", f"{name} cannot be batched: only read-only tools are allowed.")
+    arguments = dict(arguments)
+    if "athlete" in entry:
+        arguments["athlete"] = entry["athlete"]
+    return name, arguments
+
+
+async def tp_batch(
+    calls: list[dict[str, Any]],
+    dispatch: Dispatch,
+    allowed: Collection[str],
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, Any]:
+    """Run independent read-only tool calls concurrently.
+
+    Args:
+        calls: Entries of ``{"name", "arguments", "athlete"?}``. An entry's
+            ``athlete`` (or ``arguments.athlete``) targets that entry only;
+            entries without one use the batch's athlete.
+        dispatch: The server's per-call dispatcher.
+        allowed: Tool names that may be batched.
+        max_concurrency: Entries in flight at once (1-8).
+
+    Returns:
+        Dict with one ``{"name", "result"}`` per call, in input order, plus
+        ``succeeded``/``failed`` counts. A failing entry never fails the batch.
+    """
+    if not isinstance(calls, list) or not calls:
+        return _entry_error("VALIDATION_ERROR", "calls must be a non-empty list.")
+    if len(calls) > MAX_BATCH_CALLS:
+        return _entry_error(
+            "VALIDATION_ERROR", f"calls has {len(calls)} entries; the maximum per batch is {MAX_BATCH_CALLS}."
+        )
+    if not isinstance(max_concurrency, int) or not 1 <= max_concurrency <= MAX_BATCH_CONCURRENCY:
+        return _entry_error("VALIDATION_ERROR", f"max_concurrency must be 1-{MAX_BATCH_CONCURRENCY}.")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    done = 0
+
+    async def run(entry: Any) -> Any:
+        nonlocal done
+        prepared = _prepare(entry, allowed)
+        if isinstance(prepared, dict):
+            return prepared
+        name, arguments = prepared
+        async with semaphore:
+            remaining = time_remaining()
+            if remaining is not None and remaining <= 0:
+                result = _entry_error("TIMEOUT", f"{name} was not started: the batch ran out of time.")
+            else:
+                # Entries' own progress would interleave with the batch's.
+                token = progress_reporter.set(None)
+                try:
+                    result = await dispatch(name, arguments)
+                finally:
+                    progress_reporter.reset(token)
+        done += 1
+        await report_progress(done, len(calls), f"{done}/{len(calls)} calls finished")
+        return result
+
+    results = await asyncio.gather(*(run(entry) for entry in calls))
+    out = [
+        {"name": entry.get("name") if isinstance(entry, dict) else None, "result": result}
+        for entry, result in zip(calls, results, strict=True)
+    ]
+    failed = sum(1 for r in results if isinstance(r, dict) and r.get("isError"))
+    return {"results": out, "succeeded": len(out) - failed, "failed": failed}
@@ -0,0 +1,186 @@
+"""Planned-vs-completed compliance over an arbitrary date range.
+
+Computed in-process from one bulk workout fetch (chunked past the 90-day API
+cap) so an agent gets ratios and rollups instead of reasoning over raw lists.
+
+TP stores a completed planned session as ONE workout carrying both planned and
+actual fields; unplanned sessions carry actuals only, and missed sessions
+planned fields only. Workouts are bucketed by (day, sport) in a single pass,
+and every rollup is a sum of those buckets, so the whole computation is linear
+in the number of workouts.
+"""
+
+import logging
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from typing import Any
+
+from pydantic import ValidationError
+
+from tp_mcp.client import TPClient, WorkoutSummary, parse_workout_list
+from tp_mcp.tools._validation import format_validation_error
+from tp_mcp.tools.workouts import fetch_workouts_range
+
+logger = logging.getLogger("tp-mcp")
+
+MAX_COMPLIANCE_DAYS = 366
+
+
+def _pct(actual: float, planned: float) -> int | None:
+    return round(100 * actual / planned) if planned else None
+
+
+@dataclass(slots=True)
+class ComplianceTally:
+    """Running planned/actual totals for one bucket (day+sport, sport, week, all)."""
+
+    planned_sessions: int = 0
+    completed_sessions: int = 0   # planned AND completed
+    missed_sessions: int = 0      # planned, not completed, day already past
+    unplanned_sessions: int = 0   # completed with nothing planned
+    duration_planned: float = 0.0  # hours
+    duration_actual: float = 0.0
+    tss_planned: float = 0.0
+    tss_actual: float = 0.0
+    distance_planned: float = 0.0  # metres
+    distance_actual: float = 0.0
+
+    def add_workout(self, w: WorkoutSummary, today: date) -> None:
+        if w.is_planned:
+            self.planned_sessions += 1
+            if w.is_completed:
+                self.completed_sessions += 1
+            elif w.workout_date < today:
+                self.missed_sessions += 1
+        elif w.is_completed:
+            self.unplanned_sessions += 1
+        self.duration_planned += w.duration_planned or 0
+        self.duration_actual += w.duration_actual or 0
+        self.tss_planned += w.tss_planned or 0
+        self.tss_actual += w.tss_actual or 0
+        self.distance_planned += w.distance_planned or 0
+        self.distance_actual += w.distance_actual or 0
+
+    def merge(self, other: "ComplianceTally") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "planned_sessions": self.planned_sessions,
+            "completed_sessions": self.completed_sessions,
+            "missed_sessions": self.missed_sessions,
+            "unplanned_sessions": self.unplanned_sessions,
+            "session_pct": _pct(self.completed_sessions, self.planned_sessions),
+            "duration_planned_h": round(self.duration_planned, 2),
+            "duration_actual_h": round(self.duration_actual, 2),
+            "duration_pct": _pct(self.duration_actual, self.duration_planned),
+            "tss_planned": round(self.tss_planned, 1),
+            "tss_actual": round(self.tss_actual, 1),
+            "tss_pct": _pct(self.tss_actual, self.tss_planned),
+            "distance_planned_km": round(self.distance_planned / 1000, 2),
+            "distance_actual_km": round(self.distance_actual / 1000, 2),
+            "distance_pct": _pct(self.distance_actual, self.distance_planned),
+        }
+
+
+def compute_compliance(
+    workouts: list[WorkoutSummary], today: date | None = None,
+) -> dict[tuple[date, str], ComplianceTally]:
+    """Bucket workouts by (day, sport) in one pass."""
+    today = today or date.today()
+    buckets: dict[tuple[date, str], ComplianceTally] = {}
+    for w in workouts:
+        key = (w.workout_date, w.sport or "Other")
+        tally = buckets.get(key)
+        if tally is None:
+            tally = buckets[key] = ComplianceTally()
+        tally.add_workout(w, today)
+    return buckets
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+async def tp_get_compliance(
+    start_date: str,
+    end_date: str,
+    include_days: bool = False,
+) -> dict[str, Any]:
+    """Planned-vs-completed compliance for a date range (up to a year).
+
+    Args:
+        start_date: Start date (YYYY-MM-DD).
+        end_date: End date (YYYY-MM-DD).
+        include_days: Also return the per-day, per-sport breakdown.
+
+    Returns:
+        Dict with ``totals``, ``by_sport`` and Monday-based ``weeks`` rollups;
+        each carries session counts plus duration/TSS/distance planned, actual
+        and compliance %.
+    """
+    try:
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+    except (TypeError, ValueError) as e:
+        return {"isError": True, "error_code": "VALIDATION_ERROR", "message": f"Invalid date: {e}"}
+    if start > end:
+        return {
+            "isError": True,
+            "error_code": "VALIDATION_ERROR",
+            "message": "start_date must be before or equal to end_date",
+        }
+    if (end - start).days >= MAX_COMPLIANCE_DAYS:
+        return {
+            "isError": True,
+            "error_code": "VALIDATION_ERROR",
+            "message": f"Date range too large. Maximum {MAX_COMPLIANCE_DAYS} days.",
+        }
+
+    async with TPClient() as client:
+        athlete_id = await client.ensure_athlete_id()
+        if not athlete_id:
+            return {
+                "isError": True,
+                "error_code": "AUTH_INVALID",
+                "message": "Could not get athlete ID. Re-authenticate.",
+            }
+        raw, failed = await fetch_workouts_range(client, athlete_id, start, end)
+
+    if raw is None:
+        return {
+            "isError": True,
+            "error_code": failed.error_code.value if failed and failed.error_code else "API_ERROR",
+            "message": failed.message if failed else "Could not read workouts.",
+        }
+
+    try:
+        workouts = parse_workout_list(raw)
+    except ValidationError as e:
+        logger.exception("Failed to parse workouts")
+        return {"isError": True, "error_code": "API_ERROR", "message": format_validation_error(e)}
+
+    buckets = compute_compliance(workouts)
+    totals = ComplianceTally()
+    by_sport: dict[str, ComplianceTally] = {}
+    weeks: dict[date, ComplianceTally] = {}
+    for (day, sport), tally in buckets.items():
+        totals.merge(tally)
+        by_sport.setdefault(sport, ComplianceTally()).merge(tally)
+        weeks.setdefault(_week_start(day), ComplianceTally()).merge(tally)
+
+    result: dict[str, Any] = {
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "workout_count": len(workouts),
+        "totals": totals.to_dict(),
+        "by_sport": {sport: by_sport[sport].to_dict() for sport in sorted(by_sport)},
+        "weeks": [{"week_start": wk.isoformat(), **weeks[wk].to_dict()} for wk in sorted(weeks)],
+    }
+    if include_days:
+        result["days"] = [
+            {"date": day.isoformat(), "sport": sport, **buckets[(day, sport)].to_dict()}
+            for day, sport in sorted(buckets)
+        ]
+    return result
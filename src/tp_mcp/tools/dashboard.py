@@ -0,0 +1,155 @@
+"""Coach squad dashboard: fitness + compliance for every athlete in a group.
+
+One call replaces ``tp_get_fitness`` + ``tp_get_workouts`` per athlete. All
+athletes share one TPClient (one token, one throttle) and one request cap, so a
+50-athlete group costs ~100 requests spread over a bounded pipeline rather
+than 100 separate tool calls.
+"""
+
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Any
+
+from tp_mcp.client import APIResponse, TPClient, parse_workout_list
+from tp_mcp.tools._bulk import DEFAULT_CONCURRENCY, NOT_STARTED_MESSAGE, bounded_gather
+from tp_mcp.tools._pmc import (
+    TSSSeries,
+    compute_pmc,
+    daily_tss,
+    point_dict,
+    reported_days,
+    seed_start,
+    tss_cache,
+)
+from tp_mcp.tools.groups import group_athlete_ids
+from tp_mcp.tools.workouts import fetch_workouts_range
+
+logger = logging.getLogger("tp-mcp")
+
+# Fitness is read the way tp_get_fitness reads it by default (90 days, seeded
+# from prior history) so both tools report the same CTL/ATL/TSB for a day.
+_PMC_LOOKBACK_DAYS = 90
+_MAX_DAYS = 90  # athlete workout range reads are capped at 90 days
+_TSS_WINDOW_DAYS = 7
+
+
+def _pmc_row(series: TSSSeries, load_start: date, today: date) -> dict[str, Any]:
+    """Latest CTL/ATL/TSB and trailing 7-day actual TSS from the cached series."""
+    tss_7d = sum(daily_tss(series, today - timedelta(days=_TSS_WINDOW_DAYS - 1), today))
+    reported = reported_days(series, today - timedelta(days=_PMC_LOOKBACK_DAYS), today)
+    if not reported:
+        return {"ctl": None, "atl": None, "tsb": None, "tss_7d": round(tss_7d, 1)}
+    points = compute_pmc(daily_tss(series, load_start, today), load_start)
+    latest = point_dict(points[(reported[-1] - load_start).days])
+    return {"ctl": latest["ctl"], "atl": latest["atl"], "tsb": latest["tsb"], "tss_7d": round(tss_7d, 1)}
+
+
+def _compliance_row(data: list[dict[str, Any]]) -> dict[str, Any]:
+    """Planned sessions in the window and how many of them were completed."""
+    planned = [w for w in parse_workout_list(data) if w.is_planned]
+    completed = sum(1 for w in planned if w.is_completed)
+    return {
+        "planned": len(planned),
+        "completed": completed,
+        "compliance_pct": round(100 * completed / len(planned)) if planned else None,
+    }
+
+
+def _failure(athlete_id: int, name: str | None, response: APIResponse | None) -> dict[str, Any]:
+    return {
+        "athlete_id": athlete_id,
+        "name": name,
+        "error_code": response.error_code.value if response and response.error_code else "API_ERROR",
+        "message": response.message if response else "Could not read fitness/workout data.",
+    }
+
+
+async def tp_get_group_dashboard(group_id: str, days: int = 7) -> dict[str, Any]:
+    """Squad snapshot for one athlete group.
+
+    Args:
+        group_id: The group (tag) ID from tp_list_groups.
+        days: Compliance window ending today (1-90, default 7).
+
+    Returns:
+        Dict with one ``athletes`` row per member - ``ctl``, ``atl``, ``tsb``,
+        ``tss_7d``, ``planned``, ``completed``, ``compliance_pct`` - plus
+        per-athlete ``errors``. ``isError`` only when EVERY athlete failed.
+    """
+    if not isinstance(days, int) or isinstance(days, bool) or not 1 <= days <= _MAX_DAYS:
+        return {
+            "isError": True,
+            "error_code": "VALIDATION_ERROR",
+            "message": f"days must be an integer between 1 and {_MAX_DAYS}.",
+        }
+
+    today = date.today()
+    pmc_start = seed_start(today - timedelta(days=_PMC_LOOKBACK_DAYS))
+    window_start = today - timedelta(days=days - 1)
+
+    async with TPClient() as client:
+        athlete_ids, error = await group_athlete_ids(client, group_id)
+        if athlete_ids is None:
+            return error or {"isError": True, "error_code": "API_ERROR", "message": "Could not read the group."}
+
+        roster = await client.roster()
+        by_id = roster.by_id if roster else {}
+        # Caps the PMC and workout reads of every athlete together.
+        requests = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+
+        def athlete_name(athlete_id: int) -> str | None:
+            a = by_id.get(athlete_id)
+            return f"{a.get('firstName', '')} {a.get('lastName', '')}".strip() if a else None
+
+        async def athlete_row(athlete_id: int) -> dict[str, Any]:
+            name = athlete_name(athlete_id)
+            try:
+                (series, pmc_failed), (workouts, workouts_failed) = await asyncio.gather(
+                    tss_cache.load(client, athlete_id, pmc_start, today, semaphore=requests),
+                    fetch_workouts_range(client, athlete_id, window_start, today, semaphore=requests),
+                )
+                if series is None or workouts is None:
+                    return _failure(athlete_id, name, pmc_failed or workouts_failed)
+                return {
+                    "athlete_id": athlete_id,
+                    "name": name,
+                    **_pmc_row(series, pmc_start, today),
+                    **_compliance_row(workouts),
+                }
+            except Exception:
+                logger.exception("Failed to summarise athlete %s", athlete_id)
+                return {
+                    "athlete_id": athlete_id,
+                    "name": name,
+                    "error_code": "API_ERROR",
+                    "message": "Failed to read fitness/workout data.",
+                }
+
+        def not_started(athlete_id: int) -> dict[str, Any]:
+            return {
+                "athlete_id": athlete_id,
+                "name": athlete_name(athlete_id),
+                "error_code": "TIMEOUT",
+                "message": NOT_STARTED_MESSAGE,
+            }
+
+        outcomes = await bounded_gather(athlete_row, athlete_ids, not_started=not_started)
+
+    rows = sorted((o for o in outcomes if "error_code" not in o), key=lambda r: (r["name"] or "").lower())
+    errors = [o for o in outcomes if "error_code" in o]
+    result: dict[str, Any] = {
+        "group_id": str(group_id),
+        "as_of": today.isoformat(),
+        "days": days,
+        "athletes": rows,
+        "errors": errors,
+        "count": len(rows),
+    }
+    if errors and not rows:
+        result["isError"] = True
+        result["error_code"] = "API_ERROR"
+        result["message"] = (
+            f"No data for any of the {len(errors)} athlete(s); see errors for per-athlete detail."
+        )
+    return result
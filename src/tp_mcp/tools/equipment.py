@@ -6,11 +6,12 @@ from typing import Any
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
-from tp_mcp.client import TPClient
+from tp_mcp.client import REFERENCE_TTL, TPClient
 from tp_mcp.tools._validation import format_validation_error
 
 logger = logging.getLogger("tp-mcp")
 
+EQUIPMENT_ENDPOINT = "/fitness/v1/athletes/{athlete_id}/equipment"
 EQUIPMENT_TYPES = {"bike": 1, "shoe": 2}
 BIKE_ONLY_FIELDS = {"wheels", "crank_length_mm"}
 
@@ -93,8 +94,7 @@ async def tp_get_equipment(type: str = "all") -> dict[str, Any]:
                 "message": "Could not get athlete ID. Re-authenticate.",
             }
 
-        endpoint = f"/fitness/v1/athletes/{athlete_id}/equipment"
-        response = await client.get(endpoint)
+        response = await client.get(EQUIPMENT_ENDPOINT.format(athlete_id=athlete_id), cache_ttl=REFERENCE_TTL)
 
         if response.is_error:
             return {
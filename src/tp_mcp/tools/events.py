@@ -56,20 +56,6 @@ def _default_create_event_payload(
     return payload
 
 
-# Known event types from the TrainingPeaks event UI (web-form enum values).
-# Not exhaustive and not enforced — the API may accept unlisted values.
-EVENT_TYPES = [
-    "RunningRoad", "RunningTrail", "RunningTrack", "RunningCrossCountry", "RunningOther",
-    "CyclingRoad", "CyclingMountain", "CyclingCyclocross", "CyclingTrack", "CyclingOther",
-    "SwimOpenWater", "SwimPool",
-    "MultisportTriathlon", "MultisportXterra", "MultisportDuathlon",
-    "MultisportAquabike", "MultisportAquathon", "MultisportOther",
-    "RowingRegatta", "RowingOther",
-    "SnowAlpine", "SnowNordic", "SnowSkiMountaineering", "SnowSnowshoe", "SnowOther",
-    "OtherAdventure", "OtherObstacle", "OtherSpeedSkate", "OtherOther",
-]
-
-
 class CreateEventInput(BaseModel):
     """Validates input for event creation."""
 
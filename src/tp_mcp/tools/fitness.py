@@ -7,6 +7,16 @@ from typing import Any
 from pydantic import ValidationError
 
 from tp_mcp.client import TPClient
+from tp_mcp.tools._pmc import (
+    DEFAULT_ATL_CONSTANT,
+    DEFAULT_CTL_CONSTANT,
+    compute_pmc,
+    daily_tss,
+    point_dict,
+    reported_days,
+    seed_start,
+    tss_cache,
+)
 from tp_mcp.tools._validation import FitnessInput, format_validation_error
 
 logger = logging.getLogger("tp-mcp")
@@ -16,23 +26,42 @@ async def tp_get_fitness(
     days: int = 90,
     start_date: str | None = None,
     end_date: str | None = None,
-    atl_constant: int = 7,
-    ctl_constant: int = 42,
+    atl_constant: int = DEFAULT_ATL_CONSTANT,
+    ctl_constant: int = DEFAULT_CTL_CONSTANT,
+    atl_start: float | None = None,
+    ctl_start: float | None = None,
+    years: int | None = None,
+    seed_from_history: bool | None = None,
 ) -> dict[str, Any]:
     """Get fitness/fatigue/form data (CTL/ATL/TSB).
 
+    Daily TSS is cached per athlete and the chart is computed locally, so
+    repeat views and different constants/seeds only fetch uncached days.
+    Multi-year ranges are read in concurrent one-year windows and smoothed as
+    one continuous series - no per-window restart from zero. The API's own
+    ctl/atl/tsb fields are not used; every value is recomputed from tssActual.
+
     Args:
         days: Days of history (default 90). Ignored if start_date/end_date provided.
         start_date: Optional start date (YYYY-MM-DD) for historical queries.
         end_date: Optional end date (YYYY-MM-DD) for historical queries.
         atl_constant: ATL decay constant in days (default 7)
         ctl_constant: CTL decay constant in days (default 42)
+        atl_start: ATL on the day before the range (default 0 when not
+            seeding from history)
+        ctl_start: CTL on the day before the range (default 0 when not
+            seeding from history)
+        years: Years of history ending today (1-20). Overrides days; ignored
+            if start_date/end_date provided.
+        seed_from_history: Seed CTL/ATL from the TSS before the range (three
+            CTL time constants of lookback) instead of atl_start/ctl_start.
+            Defaults to True unless atl_start or ctl_start is given.
 
     Returns:
         Dict with daily CTL, ATL, TSB values and current fitness summary.
     """
     try:
-        params = FitnessInput(days=days, start_date=start_date, end_date=end_date)
+        params = FitnessInput(days=days, years=years, start_date=start_date, end_date=end_date)
     except (ValidationError, ValueError) as e:
         msg = format_validation_error(e) if isinstance(e, ValidationError) else str(e)
         return {
@@ -40,11 +69,29 @@ async def tp_get_fitness(
             "error_code": "VALIDATION_ERROR",
             "message": msg,
         }
+    if seed_from_history is None:
+        seed_from_history = atl_start is None and ctl_start is None
+    atl_start = atl_start or 0
+    ctl_start = ctl_start or 0
+    for name, value, minimum in (
+        ("atl_constant", atl_constant, 1), ("ctl_constant", ctl_constant, 1),
+        ("atl_start", atl_start, 0), ("ctl_start", ctl_start, 0),
+    ):
+        if isinstance(value, bool) or not isinstance(value, int | float) or value < minimum:
+            return {
+                "isError": True,
+                "error_code": "VALIDATION_ERROR",
+                "message": f"{name} must be a number >= {minimum}.",
+            }
 
     if params.start_date and params.end_date:
         query_start = params.start_date
         query_end = params.end_date
         query_days = (query_end - query_start).days
+    elif params.years:
+        query_end = date.today()
+        query_start = query_end - timedelta(days=round(params.years * 365.25))
+        query_days = (query_end - query_start).days
     else:
         query_end = date.today()
         query_start = query_end - timedelta(days=params.days)
@@ -59,76 +106,51 @@ async def tp_get_fitness(
                 "message": "Could not get athlete ID. Re-authenticate.",
             }
 
-        base = f"/fitness/v1/athletes/{athlete_id}/reporting/performancedata"
-        endpoint = f"{base}/{query_start}/{query_end}"
-        body = {
-            "atlConstant": atl_constant,
-            "atlStart": 0,
-            "ctlConstant": ctl_constant,
-            "ctlStart": 0,
-            "workoutTypes": [],
-        }
+        # Seeding from history just extends the smoothed span backwards; the
+        # warm-up days are computed but not returned.
+        load_start = seed_start(query_start, ctl_constant) if seed_from_history else query_start
+        series, failed = await tss_cache.load(client, athlete_id, load_start, query_end)
 
-        response = await client.post(endpoint, json=body)
-
-        if response.is_error:
-            return {
-                "isError": True,
-                "error_code": response.error_code.value if response.error_code else "API_ERROR",
-                "message": response.message,
-            }
-
-        if not response.data:
-            return {
-                "start_date": str(query_start),
-                "end_date": str(query_end),
-                "days": query_days,
-                "data": [],
-                "current": None,
-            }
-
-        try:
-            data = response.data
-
-            # Format daily data
-            daily_data = []
-            for entry in data:
-                daily_data.append(
-                    {
-                        "date": entry.get("workoutDay", "").split("T")[0],
-                        "tss": entry.get("tssActual", 0),
-                        "ctl": round(entry.get("ctl", 0), 1),
-                        "atl": round(entry.get("atl", 0), 1),
-                        "tsb": round(entry.get("tsb", 0), 1),
-                    }
-                )
-
-            # Get current (latest) values
-            current = None
-            if daily_data:
-                latest = daily_data[-1]
-                current = {
-                    "ctl": latest["ctl"],
-                    "atl": latest["atl"],
-                    "tsb": latest["tsb"],
-                    "fitness_status": _get_fitness_status(latest["tsb"]),
-                }
+    if series is None:
+        return {
+            "isError": True,
+            "error_code": failed.error_code.value if failed and failed.error_code else "API_ERROR",
+            "message": failed.message if failed else "Could not read fitness data.",
+        }
 
-            return {
-                "start_date": str(query_start),
-                "end_date": str(query_end),
-                "days": query_days,
-                "current": current,
-                "daily_data": daily_data,
-            }
+    reported = set(reported_days(series, query_start, query_end))
+    if not reported:
+        return {
+            "start_date": str(query_start),
+            "end_date": str(query_end),
+            "days": query_days,
+            "data": [],
+            "current": None,
+        }
 
-        except Exception:
-            logger.exception("Failed to parse fitness data")
-            return {
-                "isError": True,
-                "error_code": "API_ERROR",
-                "message": "Failed to parse fitness data.",
-            }
+    if seed_from_history:
+        ctl_start = atl_start = 0
+    points = compute_pmc(
+        daily_tss(series, load_start, query_end), load_start,
+        ctl_constant=ctl_constant, atl_constant=atl_constant,
+        ctl_start=ctl_start, atl_start=atl_start,
+    )
+    # Same rows the endpoint returns: one per day it reported.
+    daily_data = [point_dict(p) for p in points if p.day in reported]
+
+    latest = daily_data[-1]
+    return {
+        "start_date": str(query_start),
+        "end_date": str(query_end),
+        "days": query_days,
+        "current": {
+            "ctl": latest["ctl"],
+            "atl": latest["atl"],
+            "tsb": latest["tsb"],
+            "fitness_status": _get_fitness_status(latest["tsb"]),
+        },
+        "daily_data": daily_data,
+    }
 
 
 def _get_fitness_status(tsb: float) -> str:
@@ -164,6 +164,47 @@ async def tp_list_athletes_in_group(group_id: str) -> dict[str, Any]:
         }
 
 
+async def group_athlete_ids(
+    client: TPClient, group_id: str | int,
+) -> tuple[list[int] | None, dict[str, Any] | None]:
+    """(athleteIds of one group, None) or (None, error_dict).
+
+    Shared by the multi-athlete tools that accept ``group_id`` in place of an
+    explicit athlete list.
+    """
+    try:
+        gid = int(group_id)
+    except (TypeError, ValueError):
+        return None, {
+            "isError": True,
+            "error_code": "VALIDATION_ERROR",
+            "message": f"group_id must be a numeric ID, got {group_id!r}.",
+        }
+    coach_id = await _coach_id(client)
+    if not coach_id:
+        return None, {
+            "isError": True,
+            "error_code": "AUTH_INVALID",
+            "message": "Could not resolve the coach account. Re-authenticate.",
+        }
+    response = await client.get(_TAGS_ENDPOINT.format(coach_id=coach_id))
+    if response.is_error:
+        return None, {
+            "isError": True,
+            "error_code": response.error_code.value if response.error_code else "API_ERROR",
+            "message": response.message,
+        }
+    data = response.data if isinstance(response.data, list) else []
+    tag = next((t for t in data if isinstance(t, dict) and t.get("id") == gid), None)
+    if tag is None:
+        return None, {
+            "isError": True,
+            "error_code": "NOT_FOUND",
+            "message": f"No athlete group with id {gid}. Use tp_list_groups.",
+        }
+    return list(tag.get("athleteIds") or []), None
+
+
 async def _get_tag(client: TPClient, coach_id: int, gid: int) -> dict[str, Any] | None:
     """Fetch one tag by id from the read endpoint (for guards / round-trip)."""
     resp = await client.get(_TAGS_ENDPOINT.format(coach_id=coach_id))
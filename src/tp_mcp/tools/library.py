@@ -8,6 +8,7 @@ from pydantic import ValidationError
 
 from tp_mcp.client import TPClient
 from tp_mcp.client.context import athlete_override
+from tp_mcp.tools._bulk import NOT_STARTED_MESSAGE, bounded_gather, with_retries
 from tp_mcp.tools._validation import WorkoutIdInput, format_validation_error
 
 logger = logging.getLogger("tp-mcp")
@@ -722,54 +723,42 @@ async def tp_schedule_library_workout(
 async def _schedule_item_bulk(
     client: TPClient, item: dict[str, Any], date: str, athletes: list[str]
 ) -> dict[str, Any]:
-    """Schedule one library template to several athletes, sequentially.
+    """Schedule one library template to several athletes.
 
     Each entry is resolved exactly as the single ``athlete`` targeting
-    parameter would be (name or ID, via the athlete_override context var).
+    parameter would be (name or ID), but in one pass over the roster; the
+    POSTs then run concurrently through the bounded retrying pipeline.
     Follows the groups-tools partial-failure pattern: per-athlete ``errors``,
     ``isError`` only when EVERY athlete failed.
     """
-    scheduled: list[dict[str, Any]] = []
-    errors: list[dict[str, Any]] = []
-
-    for entry in athletes:
-        target = str(entry).strip()
-        token = athlete_override.set(target)
-        try:
-            athlete_id = await client.ensure_athlete_id()
-        except ValueError as e:
-            # Ambiguous athlete name — ensure_athlete_id lists the matches.
-            errors.append({"athlete": target, "message": str(e)})
-            continue
-        finally:
-            athlete_override.reset(token)
-
-        if not athlete_id:
-            errors.append({
-                "athlete": target,
-                "message": f"Could not resolve athlete {target!r} in your roster.",
-            })
-            continue
+    targets = [str(entry).strip() for entry in athletes]
+    resolved = await client.resolve_athletes(targets)
 
+    async def schedule(entry: tuple[str, tuple[int | None, str | None]]) -> dict[str, Any]:
+        target, (athlete_id, error) = entry
+        if athlete_id is None:
+            return {"athlete": target, "message": error}
         endpoint = f"/fitness/v6/athletes/{athlete_id}/workouts"
-        response = await client.post(
-            endpoint, json=_template_workout_payload(item, date, athlete_id)
-        )
+        payload = _template_workout_payload(item, date, athlete_id)
+        response = await with_retries(lambda: client.post(endpoint, json=payload))
         if response.is_error:
-            errors.append({
-                "athlete": target,
-                "athlete_id": athlete_id,
-                "message": response.message,
-            })
-        else:
-            workout_id = None
-            if isinstance(response.data, dict):
-                workout_id = response.data.get("workoutId")
-            scheduled.append({
-                "athlete": target,
-                "athlete_id": athlete_id,
-                "workout_id": workout_id,
-            })
+            return {"athlete": target, "athlete_id": athlete_id, "message": response.message}
+        workout_id = None
+        if isinstance(response.data, dict):
+            workout_id = response.data.get("workoutId")
+        return {"athlete": target, "athlete_id": athlete_id, "workout_id": workout_id}
+
+    def not_started(entry: tuple[str, tuple[int | None, str | None]]) -> dict[str, Any]:
+        target, (athlete_id, error) = entry
+        if athlete_id is None:
+            return {"athlete": target, "message": error}
+        return {"athlete": target, "athlete_id": athlete_id, "message": NOT_STARTED_MESSAGE}
+
+    outcomes = await bounded_gather(
+        schedule, list(zip(targets, resolved, strict=True)), not_started=not_started,
+    )
+    scheduled = [o for o in outcomes if "message" not in o]
+    errors = [o for o in outcomes if "message" in o]
 
     result: dict[str, Any] = {
         "date": date,
@@ -12,19 +12,27 @@ athlete's calendar by COPYING each workout to ``start_date + relative_offset``
 via the proven create endpoint (POST /fitness/v6/athletes/{id}/workouts) — there
 is no black-box-discoverable native "apply" endpoint, so this is a faithful
 client-side copy (structure/description/TSS preserved; TP does not record it as a
-linked plan application).
+linked plan application). Applies are resumable: created workouts are recorded in
+a local journal (``_journal.PlanJournal``) so a rerun skips them.
 """
 
+import asyncio
 import json
 import logging
+from collections import Counter
 from datetime import date as date_type
 from datetime import timedelta
-from typing import Any
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
-from tp_mcp.client import TPClient
+from tp_mcp.client import APIResponse, TPClient
+from tp_mcp.client.context import athlete_override, report_progress
+from tp_mcp.tools._bulk import DEFAULT_CONCURRENCY, bounded_gather, not_started_response, with_retries
+from tp_mcp.tools._journal import PlanJournal
 from tp_mcp.tools._validation import format_validation_error
+from tp_mcp.tools.groups import group_athlete_ids
+from tp_mcp.tools.workouts import fetch_workouts_range
 
 logger = logging.getLogger("tp-mcp")
 
@@ -209,18 +217,193 @@ async def tp_get_training_plan_workouts(plan_id: int | str) -> dict[str, Any]:
 # (Revisit native only with a HAR of a CONFIRMED-WORKING web apply's request body.)
 
 
-async def tp_apply_training_plan(plan_id: int | str, start_date: str) -> dict[str, Any]:
+class _PlanJob(NamedTuple):
+    key: str            # journal entry key
+    payload: dict[str, Any]
+
+
+def _plan_workout_payload(w: dict[str, Any], athlete_id: int, day: date_type) -> dict[str, Any]:
+    """Create body copying plan workout ``w`` onto ``day``."""
+    tid = w.get("workoutTypeValueId")
+    payload: dict[str, Any] = {
+        "athleteId": athlete_id,
+        "workoutDay": f"{day.isoformat()}T00:00:00",
+        "workoutTypeFamilyId": tid,   # family == value for standard sports
+        "workoutTypeValueId": tid,
+        "title": (w.get("title") or "Workout").strip(),
+    }
+    if w.get("totalTimePlanned") is not None:
+        payload["totalTimePlanned"] = w["totalTimePlanned"]
+    if w.get("description"):
+        payload["description"] = w["description"]
+    if w.get("distancePlanned") is not None:
+        payload["distancePlanned"] = w["distancePlanned"]
+    if w.get("tssPlanned") is not None:
+        payload["tssPlanned"] = w["tssPlanned"]
+    if w.get("ifPlanned") is not None:
+        payload["ifPlanned"] = w["ifPlanned"]
+    st = w.get("structure")
+    if isinstance(st, dict):
+        payload["structure"] = json.dumps(st)
+    return payload
+
+
+async def _calendar_workout_ids(
+    client: TPClient, athlete_id: int, start: date_type, end: date_type,
+    semaphore: asyncio.Semaphore | None = None,
+) -> set[int] | None:
+    """IDs of every workout on the athlete's calendar in [start, end], or None
+    if the calendar could not be read."""
+    workouts, _ = await fetch_workouts_range(client, athlete_id, start, end, semaphore=semaphore)
+    if workouts is None:
+        return None
+    return {w["workoutId"] for w in workouts if w.get("workoutId")}
+
+
+async def _apply_plan_to_athlete(
+    client: TPClient,
+    v: _ApplyInput,
+    sd: date_type,
+    ws: list[dict[str, Any]],
+    athlete_id: int,
+    *,
+    semaphore: asyncio.Semaphore | None = None,
+    progress: bool = True,
+) -> dict[str, Any]:
+    """Copy the plan workouts ``ws`` (anchored at ``sd``) onto one athlete's
+    calendar, skipping whatever the journal says is already there."""
+    journal = PlanJournal(v.plan_id, athlete_id, v.start_date.isoformat())
+    jobs: list[_PlanJob] = []
+    seen: Counter[tuple[int, str]] = Counter()
+    failed = skipped = 0
+    last_day = v.start_date
+    for w in ws:
+        if w.get("workoutTypeValueId") == _PERIOD_TYPE_ID:
+            skipped += 1   # training-period annotation, not a session
+            continue
+        wd = (w.get("workoutDay") or "")[:10]
+        try:
+            rel = (date_type.fromisoformat(wd) - sd).days if wd else None
+        except ValueError:
+            rel = None
+        if rel is None:
+            failed += 1
+            continue
+        day = v.start_date + timedelta(days=rel)
+        last_day = max(last_day, day)
+        payload = _plan_workout_payload(w, athlete_id, day)
+        occurrence = seen[(rel, payload["title"])]
+        seen[(rel, payload["title"])] += 1
+        jobs.append(_PlanJob(PlanJournal.entry_key(rel, payload["title"], occurrence), payload))
+
+    if any(job.key in journal.entries for job in jobs):
+        # Rerun: trust the journal only for workouts still on the calendar.
+        present = await _calendar_workout_ids(client, athlete_id, v.start_date, last_day, semaphore=semaphore)
+        if present is not None:
+            await journal.forget([
+                job.key for job in jobs
+                if job.key in journal.entries and journal.entries[job.key] not in present
+            ])
+    pending = [job for job in jobs if job.key not in journal.entries]
+    already_applied = len(jobs) - len(pending)
+
+    endpoint = f"/fitness/v6/athletes/{athlete_id}/workouts"
+    total = len(pending)
+    done = 0
+    if progress and total:
+        await report_progress(0, total, f"Creating {total} plan workouts")
+
+    async def create(job: _PlanJob) -> APIResponse:
+        nonlocal done
+        resp = await with_retries(lambda: client.post(endpoint, json=job.payload))
+        if not resp.is_error and isinstance(resp.data, dict) and resp.data.get("workoutId"):
+            await journal.record(job.key, int(resp.data["workoutId"]))
+        done += 1
+        if progress:
+            await report_progress(done, total, f"Created {done}/{total} plan workouts")
+        return resp
+
+    try:
+        responses = await bounded_gather(create, pending, semaphore=semaphore, not_started=not_started_response)
+    finally:
+        await journal.flush()
+
+    created = sum(1 for r in responses if not r.is_error)
+    errors = [r.message for r in responses if r.is_error]
+    failed += len(errors)
+
+    result: dict[str, Any] = {
+        "success": failed == 0 and (created + already_applied) > 0,
+        "method": "synthetic",
+        "plan_id": v.plan_id,
+        "athlete_id": athlete_id,
+        "start_date": v.start_date.isoformat(),
+        "created": created,
+        "already_applied": already_applied,
+        "failed": failed,
+        "skipped_periods": skipped,
+        "total": len(ws),
+    }
+    first_error = next((e for e in errors if e), None)
+    if first_error:
+        result["first_error"] = first_error[:160]
+    return result
+
+
+async def tp_apply_training_plan(
+    plan_id: int | str,
+    start_date: str,
+    athletes: list[str] | None = None,
+    group_id: str | None = None,
+) -> dict[str, Any]:
     """Apply a plan to the athlete's calendar from ``start_date`` by copying each
     plan workout to ``start_date + relative_day`` (structure/description/TSS
     preserved); training-period annotation markers are skipped. Athlete is resolved
     from the coach's athlete_override context (the ``athlete`` arg, handled by the
-    server dispatch)."""
+    server dispatch).
+
+    Creates run concurrently (bounded, on the client's shared throttle) and every
+    success is written to the local plan journal, so rerunning after a partial
+    failure only creates what is still missing. Journaled workouts that have
+    since been deleted from the calendar are recreated.
+
+    ``athletes`` (names/IDs) or ``group_id`` applies the plan to many athletes in
+    one call: the plan is fetched once, the roster resolved once, and all writes
+    share one concurrency cap. Per-athlete results follow the library bulk-
+    schedule pattern (``isError`` only when EVERY athlete failed)."""
     try:
         v = _ApplyInput(plan_id=plan_id, start_date=start_date)  # type: ignore[arg-type]
     except (ValidationError, ValueError) as e:
         return _err("VALIDATION_ERROR",
                     format_validation_error(e) if isinstance(e, ValidationError) else str(e))
+
+    multi = athletes is not None or group_id is not None
+    if multi:
+        if athletes is not None and group_id is not None:
+            return _err("VALIDATION_ERROR", "Pass either 'athletes' or 'group_id', not both.")
+        if athlete_override.get() is not None:
+            return _err("VALIDATION_ERROR",
+                        "Pass either 'athlete' (single target) or 'athletes'/'group_id' (bulk), not both.")
+        if athletes is not None and (
+            not isinstance(athletes, (list, tuple))
+            or not athletes
+            or not all(isinstance(a, (str, int)) and str(a).strip() for a in athletes)
+        ):
+            return _err("VALIDATION_ERROR", "athletes must be a non-empty list of athlete names or IDs.")
+
     async with TPClient() as client:
+        if multi:
+            if group_id is not None:
+                ids, gerr = await group_athlete_ids(client, group_id)
+                if ids is None:
+                    return gerr or _err("API_ERROR", "Could not read the group.")
+                if not ids:
+                    return _err("VALIDATION_ERROR", f"Group {group_id} has no athletes.")
+                targets = [str(a) for a in ids]
+            else:
+                targets = [str(a).strip() for a in athletes or []]
+            return await _apply_plan_to_many(client, v, targets)
+
         athlete_id = await client.ensure_athlete_id()
         if not athlete_id:
             return _err("AUTH_INVALID", "Could not get athlete ID. Re-authenticate.")
@@ -228,63 +411,67 @@ async def tp_apply_training_plan(plan_id: int | str, start_date: str) -> dict[st
         sd, ws = await _fetch_plan_workouts(client, v.plan_id)
         if sd is None:
             return ws  # error dict
-
-        created = failed = skipped = 0
-        first_error: str | None = None
-        for w in ws:
-            tid = w.get("workoutTypeValueId")
-            if tid == _PERIOD_TYPE_ID:
-                skipped += 1   # training-period annotation, not a session
-                continue
-            wd = (w.get("workoutDay") or "")[:10]
-            try:
-                rel = (date_type.fromisoformat(wd) - sd).days if wd else None
-            except ValueError:
-                rel = None
-            if rel is None:
-                failed += 1
-                continue
-            day = v.start_date + timedelta(days=rel)
-            payload: dict[str, Any] = {
-                "athleteId": athlete_id,
-                "workoutDay": f"{day.isoformat()}T00:00:00",
-                "workoutTypeFamilyId": tid,   # family == value for standard sports
-                "workoutTypeValueId": tid,
-                "title": (w.get("title") or "Workout").strip(),
-            }
-            if w.get("totalTimePlanned") is not None:
-                payload["totalTimePlanned"] = w["totalTimePlanned"]
-            if w.get("description"):
-                payload["description"] = w["description"]
-            if w.get("distancePlanned") is not None:
-                payload["distancePlanned"] = w["distancePlanned"]
-            if w.get("tssPlanned") is not None:
-                payload["tssPlanned"] = w["tssPlanned"]
-            if w.get("ifPlanned") is not None:
-                payload["ifPlanned"] = w["ifPlanned"]
-            st = w.get("structure")
-            if isinstance(st, dict):
-                payload["structure"] = json.dumps(st)
-
-            resp = await client.post(f"/fitness/v6/athletes/{athlete_id}/workouts", json=payload)
-            if resp.is_error:
-                failed += 1
-                if first_error is None:
-                    first_error = resp.message
-            else:
-                created += 1
-
-        result: dict[str, Any] = {
-            "success": failed == 0 and created > 0,
-            "method": "synthetic",
-            "plan_id": v.plan_id,
-            "athlete_id": athlete_id,
-            "start_date": v.start_date.isoformat(),
-            "created": created,
-            "failed": failed,
-            "skipped_periods": skipped,
-            "total": len(ws),
+        return await _apply_plan_to_athlete(client, v, sd, ws, athlete_id)
+
+
+async def _apply_plan_to_many(client: TPClient, v: _ApplyInput, targets: list[str]) -> dict[str, Any]:
+    """Multi-athlete apply: one plan fetch, one roster pass, shared write cap."""
+    sd, ws = await _fetch_plan_workouts(client, v.plan_id)
+    if sd is None:
+        return ws  # error dict
+
+    applied: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    resolved: list[tuple[str, int]] = []
+    seen_ids: set[int] = set()
+    for target, (athlete_id, error) in zip(targets, await client.resolve_athletes(targets), strict=True):
+        if athlete_id is None:
+            errors.append({"athlete": target, "message": error})
+        elif athlete_id not in seen_ids:
+            seen_ids.add(athlete_id)
+            resolved.append((target, athlete_id))
+
+    semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+    finished = 0
+    if resolved:
+        await report_progress(0, len(resolved), f"Applying plan to {len(resolved)} athletes")
+
+    async def apply_one(entry: tuple[str, int]) -> dict[str, Any]:
+        nonlocal finished
+        target, athlete_id = entry
+        result = await _apply_plan_to_athlete(
+            client, v, sd, ws, athlete_id, semaphore=semaphore, progress=False,
+        )
+        finished += 1
+        await report_progress(finished, len(resolved), f"Applied plan to {finished}/{len(resolved)} athletes")
+        return {"athlete": target, **result}
+
+    for outcome in await asyncio.gather(*(apply_one(e) for e in resolved)):
+        summary = {
+            k: outcome[k] for k in ("athlete", "athlete_id", "created", "already_applied", "failed")
         }
-        if first_error:
-            result["first_error"] = first_error[:160]
-        return result
+        if outcome["success"]:
+            applied.append(summary)
+        else:
+            errors.append({
+                **summary,
+                "message": outcome.get("first_error")
+                or "Some plan workouts could not be created; rerun to resume.",
+            })
+
+    result: dict[str, Any] = {
+        "method": "synthetic",
+        "plan_id": v.plan_id,
+        "start_date": v.start_date.isoformat(),
+        "applied": applied,
+        "errors": errors,
+        "message": f"Plan applied to {len(applied)} of {len(targets)} athlete(s).",
+    }
+    if errors and not applied:
+        result["isError"] = True
+        result["error_code"] = "API_ERROR"
+        result["message"] = (
+            f"The plan could not be applied to any of the {len(targets)} athlete(s); "
+            "see errors for per-athlete detail."
+        )
+    return result
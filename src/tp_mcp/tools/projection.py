@@ -0,0 +1,246 @@
+"""Forward CTL/ATL/TSB projection to a target date, with taper scenarios.
+
+Answering "what will my form be on race day?" used to take a fitness call, a
+workout call, an ATP call and hand arithmetic. Here one tool reads, in
+parallel: the cached daily TSS history (seed for the chart), the calendar's
+planned TSS from today on, and the ATP weekly volumes. It then projects every
+scenario from the same seed in one pass.
+
+Future load per day, in order of preference:
+
+1. workouts on the calendar - actual TSS once completed, planned TSS otherwise;
+2. for ATP weeks with nothing planned yet, the week's volume spread evenly;
+3. otherwise rest (0).
+
+A taper scenario scales that load to ``load_pct`` over the last
+``taper_days`` days before the target date.
+"""
+
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Any
+
+from pydantic import ValidationError
+
+from tp_mcp.client import TPClient, parse_workout_list
+from tp_mcp.tools._pmc import (
+    DEFAULT_ATL_CONSTANT,
+    DEFAULT_CTL_CONSTANT,
+    compute_pmc,
+    daily_tss,
+    point_dict,
+    tss_cache,
+)
+from tp_mcp.tools._validation import format_validation_error
+from tp_mcp.tools.atp import fetch_atp_range
+from tp_mcp.tools.fitness import _get_fitness_status
+from tp_mcp.tools.workouts import fetch_workouts_range
+
+logger = logging.getLogger("tp-mcp")
+
+MAX_PROJECTION_DAYS = 366
+MAX_SCENARIOS = 10
+HISTORY_DAYS = 180  # enough history for a 42-day CTL to forget its zero seed
+
+DEFAULT_SCENARIOS: list[dict[str, Any]] = [
+    {"name": "as_planned", "taper_days": 0, "load_pct": 100},
+    {"name": "taper_7d_50pct", "taper_days": 7, "load_pct": 50},
+    {"name": "taper_10d_60pct", "taper_days": 10, "load_pct": 60},
+    {"name": "taper_14d_70pct", "taper_days": 14, "load_pct": 70},
+]
+
+
+def _validation_error(message: str) -> dict[str, Any]:
+    return {"isError": True, "error_code": "VALIDATION_ERROR", "message": message}
+
+
+def _check_scenarios(scenarios: Any, horizon: int) -> list[dict[str, Any]] | str:
+    """Normalised scenario list, or an error message."""
+    if not isinstance(scenarios, list) or not 1 <= len(scenarios) <= MAX_SCENARIOS:
+        return f"scenarios must be a list of 1-{MAX_SCENARIOS} items."
+    checked = []
+    for i, s in enumerate(scenarios):
+        if not isinstance(s, dict):
+            return f"scenarios[{i}] must be an object."
+        taper_days = s.get("taper_days", 0)
+        load_pct = s.get("load_pct", 100)
+        if isinstance(taper_days, bool) or not isinstance(taper_days, int) or not 0 <= taper_days <= horizon:
+            return f"scenarios[{i}].taper_days must be an integer between 0 and {horizon}."
+        if isinstance(load_pct, bool) or not isinstance(load_pct, int | float) or not 0 <= load_pct <= 200:
+            return f"scenarios[{i}].load_pct must be a number between 0 and 200."
+        name = s.get("name") or f"taper_{taper_days}d_{load_pct}pct"
+        checked.append({"name": str(name), "taper_days": taper_days, "load_pct": load_pct})
+    return checked
+
+
+def planned_load(
+    workouts: list[dict[str, Any]], atp_weeks: list[dict[str, Any]], start: date, end: date,
+) -> tuple[list[float], dict[str, int]]:
+    """Daily projected TSS for [start, end] and how many days came from each source."""
+    days = (end - start).days + 1
+    load = [0.0] * days
+    planned = [False] * days
+    for w in parse_workout_list(workouts):
+        i = (w.workout_date - start).days
+        if 0 <= i < days:
+            tss = w.tss_actual if w.is_completed else w.tss_planned
+            load[i] += tss or 0
+            planned[i] = planned[i] or bool(w.tss_planned or w.tss_actual)
+
+    atp_days = 0
+    for week in atp_weeks:
+        try:
+            week_start = date.fromisoformat(str(week.get("week", ""))[:10])
+        except ValueError:
+            continue
+        volume = week.get("volume") or 0
+        idx = [i for i in range((week_start - start).days, (week_start - start).days + 7) if 0 <= i < days]
+        if not volume or not idx or any(planned[i] for i in idx):
+            continue
+        for i in idx:
+            load[i] = volume / 7
+        atp_days += len(idx)
+
+    return load, {"planned_days": sum(planned), "atp_days": atp_days}
+
+
+async def tp_project_fitness(
+    until_date: str | None = None,
+    scenarios: list[dict[str, Any]] | None = None,
+    atl_constant: int = DEFAULT_ATL_CONSTANT,
+    ctl_constant: int = DEFAULT_CTL_CONSTANT,
+    include_daily: bool = False,
+) -> dict[str, Any]:
+    """Project CTL/ATL/TSB from today to a target date under taper scenarios.
+
+    Args:
+        until_date: Target date (YYYY-MM-DD). Defaults to the focus event date.
+        scenarios: Taper scenarios ``{name, taper_days, load_pct}``; defaults to
+            as-planned plus three common tapers.
+        atl_constant: ATL decay constant in days (default 7).
+        ctl_constant: CTL decay constant in days (default 42).
+        include_daily: Also return each scenario's daily series.
+
+    Returns:
+        Dict with the seed (today's CTL/ATL), load sources and, per scenario,
+        CTL/ATL/TSB on the target date plus peak CTL.
+    """
+    for name, value in (("atl_constant", atl_constant), ("ctl_constant", ctl_constant)):
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            return _validation_error(f"{name} must be a positive integer.")
+
+    today = date.today()
+    target: date | None = None
+    if until_date is not None:
+        try:
+            target = date.fromisoformat(until_date)
+        except (TypeError, ValueError) as e:
+            return _validation_error(f"Invalid until_date: {e}")
+
+    async with TPClient() as client:
+        athlete_id = await client.ensure_athlete_id()
+        if not athlete_id:
+            return {
+                "isError": True,
+                "error_code": "AUTH_INVALID",
+                "message": "Could not get athlete ID. Re-authenticate.",
+            }
+
+        event: dict[str, Any] | None = None
+        if target is None:
+            response = await client.get(f"/fitness/v6/athletes/{athlete_id}/events/focusevent")
+            if response.is_error:
+                return {
+                    "isError": True,
+                    "error_code": response.error_code.value if response.error_code else "API_ERROR",
+                    "message": response.message,
+                }
+            if not isinstance(response.data, dict) or not response.data.get("eventDate"):
+                return _validation_error("No focus event set; pass until_date.")
+            event = {
+                "id": response.data.get("id"),
+                "name": response.data.get("name"),
+                "date": str(response.data["eventDate"])[:10],
+            }
+            try:
+                target = date.fromisoformat(event["date"])
+            except ValueError:
+                return _validation_error(f"Focus event has an unreadable date: {event['date']}")
+
+        if target < today:
+            return _validation_error("until_date must be today or later.")
+        horizon = (target - today).days + 1
+        if horizon > MAX_PROJECTION_DAYS:
+            return _validation_error(f"until_date too far ahead. Maximum {MAX_PROJECTION_DAYS} days.")
+        if scenarios is None:
+            # Default tapers longer than the horizon collapse to "taper from today".
+            scenarios = [{**s, "taper_days": min(s["taper_days"], horizon)} for s in DEFAULT_SCENARIOS]
+        checked = _check_scenarios(scenarios, horizon)
+        if isinstance(checked, str):
+            return _validation_error(checked)
+
+        history_start = today - timedelta(days=max(HISTORY_DAYS, 3 * ctl_constant))
+        yesterday = today - timedelta(days=1)
+        (series, history_failed), (workouts, workouts_failed), (atp, atp_failed) = await asyncio.gather(
+            tss_cache.load(client, athlete_id, history_start, yesterday),
+            fetch_workouts_range(client, athlete_id, today, target),
+            fetch_atp_range(client, athlete_id, today, target),
+        )
+
+    failed = history_failed or workouts_failed or atp_failed
+    if series is None or workouts is None or atp is None:
+        return {
+            "isError": True,
+            "error_code": failed.error_code.value if failed and failed.error_code else "API_ERROR",
+            "message": failed.message if failed else "Could not read fitness data.",
+        }
+
+    try:
+        load, sources = planned_load(workouts, atp, today, target)
+    except ValidationError as e:
+        logger.exception("Failed to parse workouts")
+        return {"isError": True, "error_code": "API_ERROR", "message": format_validation_error(e)}
+
+    history = compute_pmc(
+        daily_tss(series, history_start, yesterday), history_start,
+        ctl_constant=ctl_constant, atl_constant=atl_constant,
+    )
+    seed_ctl, seed_atl = (history[-1].ctl, history[-1].atl) if history else (0.0, 0.0)
+
+    results = []
+    for s in checked:
+        taper_from = horizon - s["taper_days"]
+        factor = s["load_pct"] / 100
+        scenario_load = [v * factor if i >= taper_from else v for i, v in enumerate(load)]
+        points = compute_pmc(
+            scenario_load, today, ctl_constant=ctl_constant, atl_constant=atl_constant,
+            ctl_start=seed_ctl, atl_start=seed_atl,
+        )
+        final = points[-1]
+        row: dict[str, Any] = {
+            **s,
+            "at_target": {
+                "ctl": round(final.ctl, 1),
+                "atl": round(final.atl, 1),
+                "tsb": round(final.tsb, 1),
+                "fitness_status": _get_fitness_status(final.tsb),
+            },
+            "peak_ctl": round(max(p.ctl for p in points), 1),
+            "total_tss": round(sum(scenario_load), 1),
+        }
+        if include_daily:
+            row["daily_data"] = [point_dict(p) | {"tss": round(p.tss, 1)} for p in points]
+        results.append(row)
+
+    result: dict[str, Any] = {
+        "start_date": today.isoformat(),
+        "until_date": target.isoformat(),
+        "days": horizon,
+        "seed": {"as_of": yesterday.isoformat(), "ctl": round(seed_ctl, 1), "atl": round(seed_atl, 1)},
+        "sources": {**sources, "rest_days": horizon - sources["planned_days"] - sources["atp_days"]},
+        "scenarios": results,
+    }
+    if event:
+        result["event"] = event
+    return result
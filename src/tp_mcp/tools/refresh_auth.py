@@ -10,6 +10,7 @@ from typing import Any
 
 from tp_mcp.auth import store_credential, validate_auth
 from tp_mcp.auth.browser import extract_tp_cookie
+from tp_mcp.client import TPClient
 
 
 def _sanitize_result(result: dict[str, Any]) -> dict[str, Any]:
@@ -89,6 +90,9 @@ async def tp_refresh_auth(browser: str = "auto") -> dict[str, Any]:
             "action_needed": "Run 'tp-mcp auth' manually.",
         }
 
+    # The new cookie may belong to a different account: drop the cached roster.
+    TPClient.invalidate_user_data()
+
     # SECURITY: Sanitize before returning to ensure no cookie leakage
     return _sanitize_result({
         "success": True,
@@ -7,12 +7,14 @@ from typing import Any
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
-from tp_mcp.client import TPClient
+from tp_mcp.client import REFERENCE_TTL, TPClient
 from tp_mcp.tools._validation import format_validation_error
 from tp_mcp.tools.workouts import SPORT_TYPE_MAP
 
 logger = logging.getLogger("tp-mcp")
 
+SETTINGS_ENDPOINT = "/fitness/v1/athletes/{athlete_id}/settings"
+
 POWER_ZONE_LABELS = [
     "Recovery",
     "Endurance",
@@ -115,8 +117,7 @@ async def tp_get_athlete_settings() -> dict[str, Any]:
                 "message": "Could not get athlete ID. Re-authenticate.",
             }
 
-        endpoint = f"/fitness/v1/athletes/{athlete_id}/settings"
-        response = await client.get(endpoint)
+        response = await client.get(SETTINGS_ENDPOINT.format(athlete_id=athlete_id), cache_ttl=REFERENCE_TTL)
 
         if response.is_error:
             return {
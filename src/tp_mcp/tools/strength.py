@@ -50,7 +50,6 @@ parameter the caller supplies (`WeightKg`, `WeightLb`, `WeightPercentage`, …).
 Choosing a default unit (e.g. kg) is the caller's concern, not the connector's.
 """
 
-import json
 import logging
 import uuid
 from functools import lru_cache
@@ -59,6 +58,8 @@ from typing import Any
 import httpx
 
 from tp_mcp.client import TPClient
+from tp_mcp.tools._exercise_search import ExerciseIndex
+from tp_mcp.tools._exercises import Exercise, load_catalogue
 
 logger = logging.getLogger("tp-mcp")
 
@@ -103,21 +104,26 @@ def _err(code: str, message: str) -> dict[str, Any]:
 
 
 @lru_cache(maxsize=1)
-def _catalogue() -> dict[str, dict[str, Any]]:
+def _catalogue() -> dict[str, Exercise]:
     """The built-in exercise library, keyed by string id.
 
     Static snapshot baked from the per-id Peaksware endpoint — see the
-    PROVENANCE note above for how it was generated / how to refresh it."""
-    try:
-        from importlib.resources import files
+    PROVENANCE note above for how it was generated / how to refresh it.
+    Loaded from a compiled cache of just the fields the tools read (see
+    ``_exercises``); the JSON is only parsed when that cache is stale."""
+    return load_catalogue()
+
 
-        text = files("tp_mcp").joinpath("data/exercises.json").read_text(encoding="utf-8")
-    except Exception:  # dev / editable install fallback
-        from pathlib import Path
+_index: ExerciseIndex | None = None
 
-        path = Path(__file__).resolve().parent.parent / "data" / "exercises.json"
-        text = path.read_text(encoding="utf-8")
-    return json.loads(text)
+
+def _search_index() -> ExerciseIndex:
+    """Search index over the current catalogue, built on first use."""
+    global _index
+    catalogue = _catalogue()
+    if _index is None or _index.source is not catalogue:
+        _index = ExerciseIndex(catalogue)
+    return _index
 
 
 async def tp_search_exercises(
@@ -128,46 +134,36 @@ async def tp_search_exercises(
     """Search the built-in exercise library by name (offline, no API call).
 
     Args:
-        query: Substring to match against exercise titles (case-insensitive).
-            Empty query with a muscle_group returns exercises for that muscle.
+        query: Exercise name or part of it (case-insensitive, typo-tolerant;
+            "db"/"kb"/"bb"/"rdl" abbreviations understood). Empty query with a
+            muscle_group returns exercises for that muscle.
         limit: Max results (1-100).
         muscle_group: Optional filter on primary/secondary muscle group
             (case-insensitive substring, e.g. "glute", "ham").
 
     Returns:
         Dict with `count` and `exercises` (id, title, video_url, muscle_groups,
-        and the parameter names the exercise natively prescribes).
+        and the parameter names the exercise natively prescribes), best match
+        first: exact title, prefix, substring, then fuzzy token matches.
     """
-    q = (query or "").strip().lower()
-    mg = (muscle_group or "").strip().lower()
+    q = (query or "").strip()
+    mg = (muscle_group or "").strip()
     limit = max(1, min(int(limit or 20), 100))
     if not q and not mg:
         return _err("VALIDATION_ERROR", "Provide a search query or a muscle_group.")
 
-    out: list[dict[str, Any]] = []
-    for ex in _catalogue().values():
-        if q and q not in ex["title"].lower():
-            continue
-        if mg:
-            groups = " ".join(
-                ex.get("primaryMuscleGroups", []) + ex.get("secondaryMuscleGroups", [])
-            ).lower()
-            if mg not in groups:
-                continue
-        out.append(
-            {
-                "id": ex["id"],
-                "title": ex["title"],
-                "video_url": ex.get("videoUrl"),
-                "muscle_groups": ex.get("primaryMuscleGroups", []),
-                "parameters": [p["parameter"] for p in ex.get("parameters", [])],
-            }
-        )
-    # Rank exact / prefix matches first for a name query — BEFORE truncating, so
-    # an exact match that sits past `limit` in catalogue order isn't dropped.
-    if q:
-        out.sort(key=lambda e: (e["title"].lower() != q, not e["title"].lower().startswith(q)))
-    out = out[:limit]
+    # Ranking happens over every match BEFORE truncating, so an exact match
+    # that sits past `limit` in catalogue order isn't dropped.
+    out = [
+        {
+            "id": ex.id,
+            "title": ex.title,
+            "video_url": ex.video_url,
+            "muscle_groups": list(ex.primary_muscles),
+            "parameters": list(ex.parameters),
+        }
+        for ex in _search_index().search(q, mg)[:limit]
+    ]
     return {"count": len(out), "exercises": out}
 
 
@@ -193,7 +189,7 @@ def _validate_blocks(blocks: list[dict[str, Any]]) -> str | None:
                 return f"block[{bi}].exercise[{ei}] id {eid!r} not in the exercise library."
             sets = ex.get("sets") or []
             if not sets:
-                return f"block[{bi}].exercise[{ei}] ({catalogue[eid]['title']}) has no sets."
+                return f"block[{bi}].exercise[{ei}] ({catalogue[eid].title}) has no sets."
             set_counts.append(len(sets))
             for si, s in enumerate(sets):
                 if not isinstance(s, dict) or not s:
@@ -216,7 +212,7 @@ def _u() -> str:
     return str(uuid.uuid4())
 
 
-def _build_prescription(ex: dict[str, Any], catalogue: dict[str, Any]) -> dict[str, Any]:
+def _build_prescription(ex: dict[str, Any], catalogue: dict[str, Exercise]) -> dict[str, Any]:
     eid = str(ex["id"])
     meta = catalogue[eid]
     sets_in = ex.get("sets") or []
@@ -243,9 +239,9 @@ def _build_prescription(ex: dict[str, Any], catalogue: dict[str, Any]) -> dict[s
     return {
         "id": _u(),
         # Send only id + title; the server enriches the exercise's parameter
-        # metadata from its own library. (Our baked catalogue flattens `unit`
-        # to a string for search, which the save API rejects.)
-        "exercise": {"id": eid, "title": meta["title"], "parameters": []},
+        # metadata from its own library. (Our compiled catalogue keeps only the
+        # parameter names, not the full metadata the save API expects.)
+        "exercise": {"id": eid, "title": meta.title, "parameters": []},
         "parameters": [{"parameter": p, "inputFormat": _input_format(p)} for p in columns],
         "sets": sets_out,
         "coachNotes": ex.get("notes"),
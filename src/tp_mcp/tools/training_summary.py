@@ -0,0 +1,181 @@
+"""Multi-week / multi-month training summary from one range fetch.
+
+``tp_get_weekly_summary`` covers exactly one week; "the last 12 weeks" used to
+be 12 calls and 24 requests. This tool reads the whole range once (workouts in
+concurrent 90-day windows, daily TSS from the PMC cache) and rolls it up per
+period - and optionally per sport - with end-of-period CTL/ATL/TSB.
+
+Workouts are bucketed by (day, sport) with the compliance tallies, then each
+bucket is merged into its period, so the aggregation stays linear in the number
+of workouts.
+"""
+
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Any, Literal
+
+from pydantic import ValidationError
+
+from tp_mcp.client import TPClient, parse_workout_list
+from tp_mcp.tools._pmc import DEFAULT_CTL_CONSTANT, compute_pmc, daily_tss, point_dict, tss_cache
+from tp_mcp.tools._validation import format_validation_error
+from tp_mcp.tools.compliance import ComplianceTally, compute_compliance
+from tp_mcp.tools.workouts import fetch_workouts_range
+
+logger = logging.getLogger("tp-mcp")
+
+MAX_SUMMARY_WEEKS = 104
+MAX_SUMMARY_DAYS = 731
+_SEED_DAYS = 3 * DEFAULT_CTL_CONSTANT  # warm-up so period-end CTL is not seeded at 0
+
+
+def _validation_error(message: str) -> dict[str, Any]:
+    return {"isError": True, "error_code": "VALIDATION_ERROR", "message": message}
+
+
+def _period_start(day: date, group_by: str) -> date:
+    if group_by == "month":
+        return day.replace(day=1)
+    return day - timedelta(days=day.weekday())
+
+
+def _period_end(start: date, group_by: str) -> date:
+    if group_by == "month":
+        next_month = (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        return next_month - timedelta(days=1)
+    return start + timedelta(days=6)
+
+
+def _totals(tally: ComplianceTally) -> dict[str, Any]:
+    return {
+        "sessions": tally.completed_sessions + tally.unplanned_sessions,
+        "planned_sessions": tally.planned_sessions,
+        "hours": round(tally.duration_actual, 2),
+        "hours_planned": round(tally.duration_planned, 2),
+        "tss": round(tally.tss_actual, 1),
+        "tss_planned": round(tally.tss_planned, 1),
+        "distance_km": round(tally.distance_actual / 1000, 2),
+    }
+
+
+async def tp_get_training_summary(
+    weeks: int | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    group_by: Literal["week", "month"] = "week",
+    by_sport: bool = True,
+) -> dict[str, Any]:
+    """Hours, TSS and distance per week or month, with end-of-period fitness.
+
+    Args:
+        weeks: Number of Monday-Sunday weeks ending with the current one
+            (1-104). Default 12 when no dates are given.
+        start_date: Start date (YYYY-MM-DD); use with end_date instead of weeks.
+        end_date: End date (YYYY-MM-DD).
+        group_by: "week" (Monday-based) or "month".
+        by_sport: Also break each period down per sport.
+
+    Returns:
+        Dict with ``periods`` (totals, optional ``by_sport`` and end-of-period
+        ``fitness``) and range-wide ``totals``.
+    """
+    if group_by not in ("week", "month"):
+        return _validation_error("group_by must be 'week' or 'month'.")
+
+    today = date.today()
+    if start_date or end_date:
+        if weeks is not None:
+            return _validation_error("Provide weeks or start_date/end_date, not both.")
+        if not (start_date and end_date):
+            return _validation_error("Provide both start_date and end_date, or neither.")
+        try:
+            start = date.fromisoformat(start_date)
+            end = date.fromisoformat(end_date)
+        except (TypeError, ValueError) as e:
+            return _validation_error(f"Invalid date: {e}")
+        if start > end:
+            return _validation_error("start_date must be before or equal to end_date")
+        if (end - start).days >= MAX_SUMMARY_DAYS:
+            return _validation_error(f"Date range too large. Maximum {MAX_SUMMARY_DAYS} days.")
+    else:
+        weeks = 12 if weeks is None else weeks
+        if isinstance(weeks, bool) or not isinstance(weeks, int) or not 1 <= weeks <= MAX_SUMMARY_WEEKS:
+            return _validation_error(f"weeks must be an integer between 1 and {MAX_SUMMARY_WEEKS}.")
+        end = _period_end(_period_start(today, "week"), "week")
+        start = end - timedelta(days=7 * weeks - 1)
+
+    async with TPClient() as client:
+        athlete_id = await client.ensure_athlete_id()
+        if not athlete_id:
+            return {
+                "isError": True,
+                "error_code": "AUTH_INVALID",
+                "message": "Could not get athlete ID. Re-authenticate.",
+            }
+        # PMC only exists up to today; the warm-up keeps period-end CTL honest.
+        pmc_start = start - timedelta(days=_SEED_DAYS)
+        pmc_end = max(min(end, today), pmc_start)
+        (raw, workouts_failed), (series, pmc_failed) = await asyncio.gather(
+            fetch_workouts_range(client, athlete_id, start, end),
+            tss_cache.load(client, athlete_id, pmc_start, pmc_end),
+        )
+
+    failed = workouts_failed or pmc_failed
+    if raw is None or series is None:
+        return {
+            "isError": True,
+            "error_code": failed.error_code.value if failed and failed.error_code else "API_ERROR",
+            "message": failed.message if failed else "Could not read workouts.",
+        }
+
+    try:
+        workouts = parse_workout_list(raw)
+    except ValidationError as e:
+        logger.exception("Failed to parse workouts")
+        return {"isError": True, "error_code": "API_ERROR", "message": format_validation_error(e)}
+
+    buckets = compute_compliance(workouts, today)
+    fitness_by_day = {
+        p.day: point_dict(p) for p in compute_pmc(daily_tss(series, pmc_start, pmc_end), pmc_start)
+        if p.day <= today
+    }
+
+    totals = ComplianceTally()
+    periods: dict[date, ComplianceTally] = {}
+    sports: dict[date, dict[str, ComplianceTally]] = {}
+    for (day, sport), tally in buckets.items():
+        key = _period_start(day, group_by)
+        totals.merge(tally)
+        periods.setdefault(key, ComplianceTally()).merge(tally)
+        if by_sport:
+            sports.setdefault(key, {}).setdefault(sport, ComplianceTally()).merge(tally)
+
+    rows = []
+    key = _period_start(start, group_by)
+    while key <= end:
+        period_end = _period_end(key, group_by)
+        row: dict[str, Any] = {
+            "start": max(key, start).isoformat(),
+            "end": min(period_end, end).isoformat(),
+            **_totals(periods.get(key, ComplianceTally())),
+        }
+        if by_sport:
+            per_sport = sports.get(key, {})
+            row["by_sport"] = {s: _totals(per_sport[s]) for s in sorted(per_sport)}
+        point = fitness_by_day.get(min(period_end, end, today)) if max(key, start) <= today else None
+        row["fitness"] = (
+            {"date": point["date"], "ctl": point["ctl"], "atl": point["atl"], "tsb": point["tsb"]}
+            if point else None
+        )
+        rows.append(row)
+        key = period_end + timedelta(days=1)
+
+    return {
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "group_by": group_by,
+        "periods": rows,
+        "totals": _totals(totals),
+        "workout_count": len(workouts),
+    }
@@ -3,10 +3,12 @@
 import logging
 from typing import Any
 
-from tp_mcp.client import TPClient
+from tp_mcp.client import REFERENCE_TTL, TPClient
 
 logger = logging.getLogger("tp-mcp")
 
+WORKOUT_TYPES_ENDPOINT = "/fitness/v6/workouttypes"
+
 
 async def tp_get_workout_types() -> dict[str, Any]:
     """List all sport types and their subtypes with IDs.
@@ -23,8 +25,7 @@ async def tp_get_workout_types() -> dict[str, Any]:
                 "message": "Could not get athlete ID. Re-authenticate.",
             }
 
-        endpoint = "/fitness/v6/workouttypes"
-        response = await client.get(endpoint)
+        response = await client.get(WORKOUT_TYPES_ENDPOINT, cache_ttl=REFERENCE_TTL)
 
         if response.is_error:
             return {
@@ -1,14 +1,18 @@
-"""Workout tools: get, create, update, delete, copy, comments, reorder."""
+"""Workout tools: get, create, update, delete, copy, comments, reorder, bulk writes."""
 
+import asyncio
 import json
 import logging
 from datetime import date as date_type
 from datetime import datetime as datetime_type
+from datetime import timedelta
 from typing import Any, Literal, NamedTuple
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
-from tp_mcp.client import TPClient, parse_workout_detail, parse_workout_list
+from tp_mcp.client import APIResponse, TPClient, parse_workout_detail, parse_workout_list
+from tp_mcp.tools._bulk import bounded_gather, not_started_response, with_retries
+from tp_mcp.tools._constants import SPORT_TYPE_MAP
 from tp_mcp.tools._validation import (
     CreateWorkoutInput,
     DateRangeInput,
@@ -126,25 +130,6 @@ def _decode_structured_workout(raw_structure: Any) -> dict[str, Any] | None:
         return parsed if isinstance(parsed, dict) else None
     return None
 
-# Maps sport name to (workoutTypeFamilyId, workoutTypeValueId)
-# IDs confirmed from GET /fitness/v6/workouttypes
-SPORT_TYPE_MAP: dict[str, tuple[int, int]] = {
-    "Swim": (1, 1),
-    "Bike": (2, 2),
-    "Run": (3, 3),
-    "Brick": (4, 4),
-    "Crosstrain": (5, 5),
-    "Race": (6, 6),
-    "DayOff": (7, 7),
-    "MtnBike": (8, 8),
-    "Strength": (9, 9),
-    "Custom": (10, 10),
-    "XCSki": (11, 11),
-    "Rowing": (12, 12),
-    "Walk": (13, 13),
-    "Other": (100, 100),
-}
-
 
 def _format_workout_day(value: date_type | datetime_type) -> str:
     """Format a workout day value for the TrainingPeaks API."""
@@ -166,6 +151,43 @@ def _shift_start_time_planned(existing_start_time: str, target_day: date_type) -
     return datetime_type.combine(target_day, start_dt.timetz()).isoformat(timespec="seconds")
 
 
+# Athlete workout range reads are capped at 90 days per request.
+WORKOUT_RANGE_WINDOW_DAYS = 90
+
+
+async def fetch_workouts_range(
+    client: TPClient, athlete_id: int, start: date_type, end: date_type,
+    semaphore: asyncio.Semaphore | None = None,
+) -> tuple[list[dict[str, Any]] | None, APIResponse | None]:
+    """Raw workouts in [start, end], reading 90-day windows concurrently.
+
+    For in-process aggregation over ranges longer than the API cap. Pass a
+    ``semaphore`` to count the reads against a caller's shared cap.
+
+    Returns:
+        ``(workouts, None)`` in date order, or ``(None, failing_response)``.
+    """
+    windows: list[tuple[date_type, date_type]] = []
+    cursor = start
+    while cursor <= end:
+        window_end = min(end, cursor + timedelta(days=WORKOUT_RANGE_WINDOW_DAYS - 1))
+        windows.append((cursor, window_end))
+        cursor = window_end + timedelta(days=1)
+
+    async def read(window: tuple[date_type, date_type]) -> APIResponse:
+        a, b = window
+        endpoint = f"/fitness/v6/athletes/{athlete_id}/workouts/{a.isoformat()}/{b.isoformat()}"
+        return await with_retries(lambda: client.get(endpoint), idempotent=True)
+
+    workouts: list[dict[str, Any]] = []
+    for response in await bounded_gather(read, windows, semaphore=semaphore, not_started=not_started_response):
+        if response.is_error:
+            return None, response
+        if isinstance(response.data, list):
+            workouts.extend(w for w in response.data if isinstance(w, dict))
+    return workouts, None
+
+
 async def tp_get_workouts(
     start_date: str,
     end_date: str,
@@ -380,6 +402,75 @@ def _m_to_km(metres: float | None) -> float | None:
     return metres / 1000 if metres is not None else None
 
 
+def _create_payload(params: CreateWorkoutInput) -> tuple[dict[str, Any], str | None]:
+    """Build the create POST body for validated input (everything but athleteId).
+
+    Returns ``(body, None)`` or ``({}, error_message)`` when the structure is
+    invalid. Pure - no API calls - so bulk creates can validate every item
+    before the first write.
+    """
+    family_id, type_id = SPORT_TYPE_MAP[params.sport]
+
+    structure_payload = _prepare_structure_payload(params.structure)
+    if structure_payload.error is not None:
+        return {}, structure_payload.error
+    raw_structure_payload, raw_structure_error = _encode_structured_workout(
+        params.structured_workout,
+    )
+    if raw_structure_error is not None:
+        return {}, raw_structure_error
+
+    # Use explicit duration if provided, otherwise use structure-computed
+    effective_duration: float | None = float(params.duration_minutes) if params.duration_minutes is not None else None
+    if effective_duration is None and structure_payload.duration_minutes is not None:
+        effective_duration = structure_payload.duration_minutes
+
+    # Use explicit TSS if provided, otherwise use structure-computed
+    effective_tss = params.tss_planned
+    if effective_tss is None and structure_payload.tss is not None:
+        effective_tss = structure_payload.tss
+
+    # Use structure IF if no explicit TSS was given
+    effective_if = None
+    if params.tss_planned is None and structure_payload.intensity_factor is not None:
+        effective_if = structure_payload.intensity_factor
+
+    payload: dict[str, Any] = {
+        "workoutDay": _format_workout_day(params.date),
+        "workoutTypeFamilyId": family_id,
+        "workoutTypeValueId": type_id,
+        "title": params.title,
+        "isHidden": params.is_hidden if params.is_hidden is not None else False,
+    }
+    if isinstance(params.date, datetime_type):
+        payload["startTimePlanned"] = _format_start_time_planned(params.date)
+    if params.subtype_id is not None:
+        payload["workoutSubTypeId"] = params.subtype_id
+
+    if effective_duration is not None:
+        payload["totalTimePlanned"] = effective_duration / 60.0
+
+    if params.description:
+        payload["description"] = params.description
+    if params.distance_km is not None:
+        payload["distancePlanned"] = _km_to_m(params.distance_km)
+    if effective_tss is not None:
+        payload["tssPlanned"] = effective_tss
+    if effective_if is not None:
+        payload["ifPlanned"] = effective_if
+    if structure_payload.wire_structure is not None:
+        payload["structure"] = json.dumps(structure_payload.wire_structure)
+    elif raw_structure_payload is not None:
+        payload["structure"] = raw_structure_payload
+    if params.tags is not None:
+        payload["userTags"] = params.tags
+    if params.feeling is not None:
+        payload["feeling"] = params.feeling
+    if params.rpe is not None:
+        payload["rpe"] = params.rpe
+    return payload, None
+
+
 async def tp_create_workout(
     date_str: str,
     sport: str,
@@ -442,40 +533,14 @@ async def tp_create_workout(
             "message": msg,
         }
 
-    family_id, type_id = SPORT_TYPE_MAP[params.sport]
-
-    structure_payload = _prepare_structure_payload(params.structure)
-    if structure_payload.error is not None:
-        return {
-            "isError": True,
-            "error_code": "VALIDATION_ERROR",
-            "message": structure_payload.error,
-        }
-    raw_structure_payload, raw_structure_error = _encode_structured_workout(
-        params.structured_workout,
-    )
-    if raw_structure_error is not None:
+    body, error = _create_payload(params)
+    if error is not None:
         return {
             "isError": True,
             "error_code": "VALIDATION_ERROR",
-            "message": raw_structure_error,
+            "message": error,
         }
 
-    # Use explicit duration if provided, otherwise use structure-computed
-    effective_duration: float | None = float(params.duration_minutes) if params.duration_minutes is not None else None
-    if effective_duration is None and structure_payload.duration_minutes is not None:
-        effective_duration = structure_payload.duration_minutes
-
-    # Use explicit TSS if provided, otherwise use structure-computed
-    effective_tss = params.tss_planned
-    if effective_tss is None and structure_payload.tss is not None:
-        effective_tss = structure_payload.tss
-
-    # Use structure IF if no explicit TSS was given
-    effective_if = None
-    if params.tss_planned is None and structure_payload.intensity_factor is not None:
-        effective_if = structure_payload.intensity_factor
-
     async with TPClient() as client:
         athlete_id = await client.ensure_athlete_id()
         if not athlete_id:
@@ -485,41 +550,7 @@ async def tp_create_workout(
                 "message": "Could not get athlete ID. Re-authenticate.",
             }
 
-        payload: dict[str, Any] = {
-            "athleteId": athlete_id,
-            "workoutDay": _format_workout_day(params.date),
-            "workoutTypeFamilyId": family_id,
-            "workoutTypeValueId": type_id,
-            "title": params.title,
-            "isHidden": params.is_hidden if params.is_hidden is not None else False,
-        }
-        if isinstance(params.date, datetime_type):
-            payload["startTimePlanned"] = _format_start_time_planned(params.date)
-        if params.subtype_id is not None:
-            payload["workoutSubTypeId"] = params.subtype_id
-
-        if effective_duration is not None:
-            payload["totalTimePlanned"] = effective_duration / 60.0
-
-        if params.description:
-            payload["description"] = params.description
-        if params.distance_km is not None:
-            payload["distancePlanned"] = _km_to_m(params.distance_km)
-        if effective_tss is not None:
-            payload["tssPlanned"] = effective_tss
-        if effective_if is not None:
-            payload["ifPlanned"] = effective_if
-        if structure_payload.wire_structure is not None:
-            payload["structure"] = json.dumps(structure_payload.wire_structure)
-        elif raw_structure_payload is not None:
-            payload["structure"] = raw_structure_payload
-        if params.tags is not None:
-            payload["userTags"] = params.tags
-        if params.feeling is not None:
-            payload["feeling"] = params.feeling
-        if params.rpe is not None:
-            payload["rpe"] = params.rpe
-
+        payload: dict[str, Any] = {"athleteId": athlete_id, **body}
         endpoint = f"/fitness/v6/athletes/{athlete_id}/workouts"
         response = await client.post(endpoint, json=payload)
 
@@ -547,6 +578,94 @@ async def tp_create_workout(
         }
 
 
+class UpdatePlan(NamedTuple):
+    structure: StructurePayload
+    raw_structure: str | None
+    duration_minutes: float | None
+    tss: float | None
+    intensity_factor: float | None
+
+
+def _prepare_update(params: UpdateWorkoutInput) -> tuple[UpdatePlan | None, str | None]:
+    """Resolve structure-derived values for a validated update (no API calls)."""
+    structure_payload = _prepare_structure_payload(params.structure)
+    if structure_payload.error is not None:
+        return None, structure_payload.error
+    raw_structure_payload, raw_structure_error = _encode_structured_workout(
+        params.structured_workout,
+    )
+    if raw_structure_error is not None:
+        return None, raw_structure_error
+
+    effective_duration = params.duration_minutes
+    if effective_duration is None and structure_payload.duration_minutes is not None:
+        effective_duration = structure_payload.duration_minutes
+
+    effective_tss = params.tss_planned
+    if effective_tss is None and structure_payload.tss is not None:
+        effective_tss = structure_payload.tss
+
+    effective_if = None
+    if params.structure is not None and params.tss_planned is None and structure_payload.intensity_factor is not None:
+        effective_if = structure_payload.intensity_factor
+
+    return UpdatePlan(
+        structure=structure_payload,
+        raw_structure=raw_structure_payload,
+        duration_minutes=effective_duration,
+        tss=effective_tss,
+        intensity_factor=effective_if,
+    ), None
+
+
+def _merge_update(existing: dict[str, Any], params: UpdateWorkoutInput, plan: UpdatePlan) -> None:
+    """Merge the requested changes into a full workout object, in place."""
+    if params.sport is not None:
+        family_id, type_id = SPORT_TYPE_MAP[params.sport]
+        existing["workoutTypeFamilyId"] = family_id
+        existing["workoutTypeValueId"] = type_id
+    if params.subtype_id is not None:
+        existing["workoutSubTypeId"] = params.subtype_id
+    if params.title is not None:
+        existing["title"] = params.title
+    if params.description is not None:
+        existing["description"] = params.description
+    if params.date is not None:
+        existing["workoutDay"] = _format_workout_day(params.date)
+        if isinstance(params.date, datetime_type):
+            existing["startTimePlanned"] = _format_start_time_planned(params.date)
+        elif existing.get("startTimePlanned"):
+            shifted_start = _shift_start_time_planned(existing["startTimePlanned"], params.date)
+            if shifted_start is not None:
+                existing["startTimePlanned"] = shifted_start
+    if plan.duration_minutes is not None:
+        existing["totalTimePlanned"] = plan.duration_minutes / 60.0
+    if params.distance_km is not None:
+        existing["distancePlanned"] = _km_to_m(params.distance_km)
+    if plan.tss is not None:
+        existing["tssPlanned"] = plan.tss
+    if params.tags is not None:
+        existing["userTags"] = params.tags
+    if params.athlete_comment is not None:
+        existing["athleteComments"] = params.athlete_comment
+    if params.coach_comment is not None:
+        existing["coachComments"] = params.coach_comment
+    if params.feeling is not None:
+        existing["feeling"] = params.feeling
+    if params.rpe is not None:
+        existing["rpe"] = params.rpe
+    if params.is_hidden is not None:
+        existing["isHidden"] = params.is_hidden
+    if params.structure is not None:
+        existing["structure"] = json.dumps(plan.structure.wire_structure)
+        if plan.intensity_factor is not None:
+            existing["ifPlanned"] = plan.intensity_factor
+        else:
+            existing.pop("ifPlanned", None)
+    elif plan.raw_structure is not None:
+        existing["structure"] = plan.raw_structure
+
+
 async def tp_update_workout(
     workout_id: str,
     sport: str | None = None,
@@ -604,35 +723,14 @@ async def tp_update_workout(
             "message": msg,
         }
 
-    structure_payload = _prepare_structure_payload(params.structure)
-    if structure_payload.error is not None:
+    plan, error = _prepare_update(params)
+    if plan is None:
         return {
             "isError": True,
             "error_code": "VALIDATION_ERROR",
-            "message": structure_payload.error,
-        }
-    raw_structure_payload, raw_structure_error = _encode_structured_workout(
-        params.structured_workout,
-    )
-    if raw_structure_error is not None:
-        return {
-            "isError": True,
-            "error_code": "VALIDATION_ERROR",
-            "message": raw_structure_error,
+            "message": error,
         }
 
-    effective_duration = params.duration_minutes
-    if effective_duration is None and structure_payload.duration_minutes is not None:
-        effective_duration = structure_payload.duration_minutes
-
-    effective_tss = params.tss_planned
-    if effective_tss is None and structure_payload.tss is not None:
-        effective_tss = structure_payload.tss
-
-    effective_if = None
-    if params.structure is not None and params.tss_planned is None and structure_payload.intensity_factor is not None:
-        effective_if = structure_payload.intensity_factor
-
     async with TPClient() as client:
         athlete_id = await client.ensure_athlete_id()
         if not athlete_id:
@@ -662,51 +760,7 @@ async def tp_update_workout(
 
         # Merge updates into existing workout
         existing = get_response.data
-
-        if params.sport is not None:
-            family_id, type_id = SPORT_TYPE_MAP[params.sport]
-            existing["workoutTypeFamilyId"] = family_id
-            existing["workoutTypeValueId"] = type_id
-        if params.subtype_id is not None:
-            existing["workoutSubTypeId"] = params.subtype_id
-        if params.title is not None:
-            existing["title"] = params.title
-        if params.description is not None:
-            existing["description"] = params.description
-        if params.date is not None:
-            existing["workoutDay"] = _format_workout_day(params.date)
-            if isinstance(params.date, datetime_type):
-                existing["startTimePlanned"] = _format_start_time_planned(params.date)
-            elif existing.get("startTimePlanned"):
-                shifted_start = _shift_start_time_planned(existing["startTimePlanned"], params.date)
-                if shifted_start is not None:
-                    existing["startTimePlanned"] = shifted_start
-        if effective_duration is not None:
-            existing["totalTimePlanned"] = effective_duration / 60.0
-        if params.distance_km is not None:
-            existing["distancePlanned"] = _km_to_m(params.distance_km)
-        if effective_tss is not None:
-            existing["tssPlanned"] = effective_tss
-        if params.tags is not None:
-            existing["userTags"] = params.tags
-        if params.athlete_comment is not None:
-            existing["athleteComments"] = params.athlete_comment
-        if params.coach_comment is not None:
-            existing["coachComments"] = params.coach_comment
-        if params.feeling is not None:
-            existing["feeling"] = params.feeling
-        if params.rpe is not None:
-            existing["rpe"] = params.rpe
-        if params.is_hidden is not None:
-            existing["isHidden"] = params.is_hidden
-        if params.structure is not None:
-            existing["structure"] = json.dumps(structure_payload.wire_structure)
-            if effective_if is not None:
-                existing["ifPlanned"] = effective_if
-            else:
-                existing.pop("ifPlanned", None)
-        elif raw_structure_payload is not None:
-            existing["structure"] = raw_structure_payload
+        _merge_update(existing, params, plan)
 
         # PUT updated workout
         put_endpoint = f"/fitness/v6/athletes/{athlete_id}/workouts/{params.workout_id}"
@@ -907,17 +961,23 @@ async def tp_copy_workout(
         }
 
 
-async def tp_reorder_workouts(workout_ids: list[int]) -> dict[str, Any]:
+async def tp_reorder_workouts(workout_ids: list[int], date: str | None = None) -> dict[str, Any]:
     """Reorder workouts on a given day.
 
+    Reads every target workout with a single range GET for the day, sets
+    ``orderOnDay`` from the list position, then PUTs them back through a
+    bounded pipeline (rate-limited calls are retried). Workouts the range
+    read does not return are fetched individually.
+
     Args:
         workout_ids: List of workout IDs in desired display order.
+        date: Optional calendar day (YYYY-MM-DD) the workouts are on. When
+            omitted, the day is read from the first workout.
 
     Returns:
-        Dict with confirmation or error.
+        Dict with ``reordered`` and per-workout ``errors`` lists. ``isError``
+        is set only when EVERY workout failed.
     """
-    import asyncio
-
     if not workout_ids:
         return {
             "isError": True,
@@ -925,6 +985,17 @@ async def tp_reorder_workouts(workout_ids: list[int]) -> dict[str, Any]:
             "message": "workout_ids must not be empty.",
         }
 
+    try:
+        ids = [WorkoutIdInput(workout_id=wid).workout_id for wid in workout_ids]
+        day = date_type.fromisoformat(date) if date is not None else None
+    except (ValidationError, ValueError) as e:
+        msg = format_validation_error(e) if isinstance(e, ValidationError) else str(e)
+        return {
+            "isError": True,
+            "error_code": "VALIDATION_ERROR",
+            "message": msg,
+        }
+
     async with TPClient() as client:
         athlete_id = await client.ensure_athlete_id()
         if not athlete_id:
@@ -934,37 +1005,418 @@ async def tp_reorder_workouts(workout_ids: list[int]) -> dict[str, Any]:
                 "message": "Could not get athlete ID. Re-authenticate.",
             }
 
-        async def update_order(wid: int, order: int) -> dict[str, Any] | None:
-            get_endpoint = f"/fitness/v6/athletes/{athlete_id}/workouts/{wid}"
-            get_response = await client.get(get_endpoint)
-            if get_response.is_error or not isinstance(get_response.data, dict):
-                return {"workout_id": wid, "error": "Not found"}
+        base = f"/fitness/v6/athletes/{athlete_id}/workouts"
+        existing: dict[int, dict[str, Any]] = {}
+
+        if day is None:
+            # The day is unknown: read it off the first workout (whose full
+            # object then doubles as its PUT body).
+            first = await with_retries(lambda: client.get(f"{base}/{ids[0]}"), idempotent=True)
+            if first.success and isinstance(first.data, dict):
+                existing[ids[0]] = first.data
+                workout_day = str(first.data.get("workoutDay") or "")[:10]
+                try:
+                    day = date_type.fromisoformat(workout_day)
+                except ValueError:
+                    day = None
+
+        if day is not None and any(wid not in existing for wid in ids):
+            day_str = day.isoformat()
+            listed = await with_retries(
+                lambda: client.get(f"{base}/{day_str}/{day_str}"), idempotent=True
+            )
+            if listed.success and isinstance(listed.data, list):
+                wanted = set(ids)
+                for w in listed.data:
+                    if isinstance(w, dict) and w.get("workoutId") in wanted:
+                        existing.setdefault(w["workoutId"], w)
+
+        async def update_order(entry: tuple[int, int]) -> dict[str, Any]:
+            order, wid = entry
+            workout = existing.get(wid)
+            if workout is None:
+                # Not on the listed day (or the day is unknown): single read.
+                get_response = await with_retries(
+                    lambda: client.get(f"{base}/{wid}"), idempotent=True
+                )
+                if get_response.is_error or not isinstance(get_response.data, dict):
+                    return {"workout_id": wid, "error_code": "NOT_FOUND",
+                            "message": f"Workout {wid} not found"}
+                workout = get_response.data
+
+            workout["orderOnDay"] = order
+            put_response = await with_retries(
+                lambda: client.put(f"{base}/{wid}", json=workout), idempotent=True
+            )
+            if put_response.is_error:
+                return {
+                    "workout_id": wid,
+                    "error_code": put_response.error_code.value if put_response.error_code else "API_ERROR",
+                    "message": put_response.message,
+                }
+            return {"workout_id": wid, "order_on_day": order}
 
-            existing = get_response.data
-            existing["orderOnDay"] = order
+        outcomes = await bounded_gather(
+            update_order, list(enumerate(ids)),
+            not_started=lambda entry: _api_failure(not_started_response(), workout_id=entry[1]),
+        )
 
-            put_endpoint = f"/fitness/v6/athletes/{athlete_id}/workouts/{wid}"
-            put_response = await client.put(put_endpoint, json=existing)
-            if put_response.is_error:
-                return {"workout_id": wid, "error": put_response.message}
-            return None
+    reordered = [o for o in outcomes if "error_code" not in o]
+    errors = [o for o in outcomes if "error_code" in o]
+    result: dict[str, Any] = {
+        "success": not errors,
+        "date": day.isoformat() if day is not None else None,
+        "reordered": reordered,
+        "errors": errors,
+        "message": f"Reordered {len(reordered)} of {len(ids)} workouts.",
+    }
+    if errors and not reordered:
+        result["isError"] = True
+        result["error_code"] = "API_ERROR"
+        result["message"] = (
+            f"None of the {len(errors)} workout(s) could be reordered; "
+            "see errors for per-workout detail."
+        )
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Bulk writes: validate every item up front, then execute through a bounded
+# pipeline. Results follow the partial-failure pattern of the groups tools -
+# ``isError`` only when EVERY item failed.
+# ---------------------------------------------------------------------------
+
+MAX_BULK_ITEMS = 100
+
+
+def _check_bulk_list(items: Any, name: str) -> str | None:
+    """Validate the outer list of a bulk call; return an error message or None."""
+    if not isinstance(items, (list, tuple)) or not items:
+        return f"{name} must be a non-empty list."
+    if len(items) > MAX_BULK_ITEMS:
+        return f"{name} has {len(items)} entries; the maximum per call is {MAX_BULK_ITEMS}."
+    return None
+
+
+def _item_error(index: int, error: ValidationError | ValueError | str, **ref: Any) -> dict[str, Any]:
+    """Per-item validation failure entry."""
+    message = format_validation_error(error) if isinstance(error, ValidationError) else str(error)
+    return {"index": index, **ref, "error_code": "VALIDATION_ERROR", "message": message}
+
+
+def _unknown_fields(item: dict[str, Any], model: type[BaseModel]) -> str | None:
+    unknown = sorted(set(item) - set(model.model_fields))
+    return f"Unknown field(s): {', '.join(unknown)}" if unknown else None
+
+
+def _invalid_batch(invalid: list[dict[str, Any]], total: int, verb: str) -> dict[str, Any]:
+    return {
+        "isError": True,
+        "error_code": "VALIDATION_ERROR",
+        "message": (
+            f"{len(invalid)} of {total} item(s) failed validation; nothing was {verb}. "
+            "See failed for per-item detail."
+        ),
+        "failed": invalid,
+    }
+
+
+def _bulk_result(key: str, done: list[dict[str, Any]], failed: list[dict[str, Any]], total: int) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "success": not failed,
+        key: done,
+        "failed": failed,
+        "message": f"{key.capitalize()} {len(done)} of {total} workout(s).",
+    }
+    not_started = sum(1 for f in failed if f.get("error_code") == "TIMEOUT")
+    if not_started:
+        result["message"] += (
+            f" {not_started} not started before the time limit (error_code TIMEOUT); safe to retry."
+        )
+    if failed and not done:
+        result["isError"] = True
+        result["error_code"] = "API_ERROR"
+        result["message"] = (
+            f"None of the {total} workout(s) could be {key}; see failed for per-item detail."
+        )
+    return result
+
+
+def _api_failure(response: Any, **ref: Any) -> dict[str, Any]:
+    return {
+        **ref,
+        "error_code": response.error_code.value if response.error_code else "API_ERROR",
+        "message": response.message,
+    }
+
+
+async def tp_bulk_create_workouts(
+    workouts: list[dict[str, Any]],
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Create many planned workouts in one call.
 
-        tasks = [update_order(wid, idx) for idx, wid in enumerate(workout_ids)]
-        results = await asyncio.gather(*tasks)
+    Every entry takes the same fields as ``tp_create_workout`` and is validated
+    before anything is written; a single invalid entry rejects the batch.
 
-        errors = [r for r in results if r is not None]
-        if errors:
+    Args:
+        workouts: List of workout definitions (date, sport, title, ...).
+        dry_run: Validate and preview without creating anything.
+
+    Returns:
+        Dict with ``created`` and per-item ``failed`` lists.
+    """
+    error = _check_bulk_list(workouts, "workouts")
+    if error:
+        return {"isError": True, "error_code": "VALIDATION_ERROR", "message": error}
+
+    prepared: list[tuple[int, CreateWorkoutInput, dict[str, Any]]] = []
+    invalid: list[dict[str, Any]] = []
+    for index, item in enumerate(workouts):
+        if not isinstance(item, dict):
+            invalid.append(_item_error(index, "Each workout must be an object."))
+            continue
+        unknown = _unknown_fields(item, CreateWorkoutInput)
+        if unknown:
+            invalid.append(_item_error(index, unknown, title=item.get("title")))
+            continue
+        try:
+            params = CreateWorkoutInput(**item)
+        except (ValidationError, ValueError) as e:
+            invalid.append(_item_error(index, e, title=item.get("title")))
+            continue
+        body, body_error = _create_payload(params)
+        if body_error is not None:
+            invalid.append(_item_error(index, body_error, title=params.title))
+            continue
+        prepared.append((index, params, body))
+
+    if invalid:
+        return _invalid_batch(invalid, len(workouts), "created")
+
+    if dry_run:
+        return {
+            "dry_run": True,
+            "would_create": [
+                {
+                    "index": index,
+                    "date": params.date.isoformat(),
+                    "sport": params.sport,
+                    "title": params.title,
+                    "duration_minutes": round(body["totalTimePlanned"] * 60, 1)
+                    if body.get("totalTimePlanned") is not None else None,
+                    "tss_planned": body.get("tssPlanned"),
+                }
+                for index, params, body in prepared
+            ],
+            "count": len(prepared),
+        }
+
+    async with TPClient() as client:
+        athlete_id = await client.ensure_athlete_id()
+        if not athlete_id:
             return {
                 "isError": True,
-                "error_code": "API_ERROR",
-                "message": f"Some workouts failed to reorder: {errors}",
+                "error_code": "AUTH_INVALID",
+                "message": "Could not get athlete ID. Re-authenticate.",
             }
 
+        endpoint = f"/fitness/v6/athletes/{athlete_id}/workouts"
+
+        async def create(entry: tuple[int, CreateWorkoutInput, dict[str, Any]]) -> dict[str, Any]:
+            index, params, body = entry
+            payload = {"athleteId": athlete_id, **body}
+            response = await with_retries(lambda: client.post(endpoint, json=payload))
+            ref = {"index": index, "title": params.title, "date": params.date.isoformat()}
+            if response.is_error:
+                return _api_failure(response, **ref)
+            data = response.data if isinstance(response.data, dict) else {}
+            return {**ref, "workout_id": data.get("workoutId")}
+
+        outcomes = await bounded_gather(
+            create, prepared,
+            not_started=lambda entry: _api_failure(
+                not_started_response(), index=entry[0], title=entry[1].title, date=entry[1].date.isoformat(),
+            ),
+        )
+
+    created = [o for o in outcomes if "error_code" not in o]
+    failed = [o for o in outcomes if "error_code" in o]
+    return _bulk_result("created", created, failed, len(prepared))
+
+
+async def tp_bulk_update_workouts(
+    updates: list[dict[str, Any]],
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Update many workouts in one call.
+
+    Every entry takes the same fields as ``tp_update_workout`` (``workout_id``
+    plus the fields to change) and is validated before anything is written.
+    Each workout is still read-modify-written, because TP's PUT needs the full
+    object, but the reads and writes run through a bounded pipeline.
+
+    Args:
+        updates: List of update definitions, each with a ``workout_id``.
+        dry_run: Validate and preview without writing anything.
+
+    Returns:
+        Dict with ``updated`` and per-item ``failed`` lists.
+    """
+    error = _check_bulk_list(updates, "updates")
+    if error:
+        return {"isError": True, "error_code": "VALIDATION_ERROR", "message": error}
+
+    prepared: list[tuple[int, UpdateWorkoutInput, UpdatePlan]] = []
+    invalid: list[dict[str, Any]] = []
+    seen: set[int] = set()
+    for index, item in enumerate(updates):
+        if not isinstance(item, dict):
+            invalid.append(_item_error(index, "Each update must be an object."))
+            continue
+        unknown = _unknown_fields(item, UpdateWorkoutInput)
+        if unknown:
+            invalid.append(_item_error(index, unknown, workout_id=item.get("workout_id")))
+            continue
+        try:
+            params = UpdateWorkoutInput(**item)
+        except (ValidationError, ValueError) as e:
+            invalid.append(_item_error(index, e, workout_id=item.get("workout_id")))
+            continue
+        if params.workout_id in seen:
+            # Two concurrent read-modify-writes of one workout would race.
+            invalid.append(_item_error(
+                index, "Duplicate workout_id; merge its changes into one entry.",
+                workout_id=params.workout_id,
+            ))
+            continue
+        seen.add(params.workout_id)
+        plan, plan_error = _prepare_update(params)
+        if plan is None:
+            invalid.append(_item_error(index, plan_error or "Invalid update.", workout_id=params.workout_id))
+            continue
+        prepared.append((index, params, plan))
+
+    if invalid:
+        return _invalid_batch(invalid, len(updates), "updated")
+
+    if dry_run:
         return {
-            "success": True,
-            "message": f"Reordered {len(workout_ids)} workouts.",
+            "dry_run": True,
+            "would_update": [
+                {
+                    "index": index,
+                    "workout_id": params.workout_id,
+                    "fields": sorted(params.model_dump(exclude_none=True, exclude={"workout_id"})),
+                }
+                for index, params, _ in prepared
+            ],
+            "count": len(prepared),
         }
 
+    async with TPClient() as client:
+        athlete_id = await client.ensure_athlete_id()
+        if not athlete_id:
+            return {
+                "isError": True,
+                "error_code": "AUTH_INVALID",
+                "message": "Could not get athlete ID. Re-authenticate.",
+            }
+
+        base = f"/fitness/v6/athletes/{athlete_id}/workouts"
+
+        async def update(entry: tuple[int, UpdateWorkoutInput, UpdatePlan]) -> dict[str, Any]:
+            index, params, plan = entry
+            ref = {"index": index, "workout_id": params.workout_id}
+            endpoint = f"{base}/{params.workout_id}"
+            get_response = await with_retries(lambda: client.get(endpoint), idempotent=True)
+            if get_response.is_error:
+                return _api_failure(get_response, **ref)
+            if not isinstance(get_response.data, dict):
+                return {**ref, "error_code": "NOT_FOUND",
+                        "message": f"Workout {params.workout_id} not found"}
+            existing = get_response.data
+            _merge_update(existing, params, plan)
+            put_response = await with_retries(
+                lambda: client.put(endpoint, json=existing), idempotent=True
+            )
+            if put_response.is_error:
+                return _api_failure(put_response, **ref)
+            return ref
+
+        outcomes = await bounded_gather(
+            update, prepared,
+            not_started=lambda entry: _api_failure(
+                not_started_response(), index=entry[0], workout_id=entry[1].workout_id,
+            ),
+        )
+
+    updated = [o for o in outcomes if "error_code" not in o]
+    failed = [o for o in outcomes if "error_code" in o]
+    return _bulk_result("updated", updated, failed, len(prepared))
+
+
+async def tp_bulk_delete_workouts(
+    workout_ids: list[str],
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Delete many workouts in one call.
+
+    Args:
+        workout_ids: Workout IDs to delete.
+        dry_run: Validate and preview without deleting anything.
+
+    Returns:
+        Dict with ``deleted`` and per-item ``failed`` lists.
+    """
+    error = _check_bulk_list(workout_ids, "workout_ids")
+    if error:
+        return {"isError": True, "error_code": "VALIDATION_ERROR", "message": error}
+
+    ids: list[int] = []
+    invalid: list[dict[str, Any]] = []
+    for index, raw_id in enumerate(workout_ids):
+        try:
+            wid = WorkoutIdInput(workout_id=raw_id).workout_id
+        except (ValidationError, ValueError) as e:
+            invalid.append(_item_error(index, e, workout_id=raw_id))
+            continue
+        if wid in ids:
+            invalid.append(_item_error(index, "Duplicate workout_id; list each workout once.", workout_id=wid))
+            continue
+        ids.append(wid)
+
+    if invalid:
+        return _invalid_batch(invalid, len(workout_ids), "deleted")
+
+    if dry_run:
+        return {"dry_run": True, "would_delete": ids, "count": len(ids)}
+
+    async with TPClient() as client:
+        athlete_id = await client.ensure_athlete_id()
+        if not athlete_id:
+            return {
+                "isError": True,
+                "error_code": "AUTH_INVALID",
+                "message": "Could not get athlete ID. Re-authenticate.",
+            }
+
+        base = f"/fitness/v6/athletes/{athlete_id}/workouts"
+
+        async def delete(wid: int) -> dict[str, Any]:
+            response = await with_retries(lambda: client.delete(f"{base}/{wid}"), idempotent=True)
+            if response.is_error:
+                return _api_failure(response, workout_id=wid)
+            return {"workout_id": wid}
+
+        outcomes = await bounded_gather(
+            delete, ids, not_started=lambda wid: _api_failure(not_started_response(), workout_id=wid),
+        )
+
+    deleted = [o for o in outcomes if "error_code" not in o]
+    failed = [o for o in outcomes if "error_code" in o]
+    return _bulk_result("deleted", deleted, failed, len(ids))
+
 
 async def tp_get_workout_comments(workout_id: str) -> dict[str, Any]:
     """Get comments on a workout.
@@ -38,6 +38,10 @@ _PROBE_THRESHOLD = {"power": 250.0, "heartrate": 160.0, "speed": 4.0}
 # are skipped, so this stays correct if TP adds methods.
 _PROBE_METHODS = list(range(0, 16)) + [31]
 
+# (user id, metric) -> probe result. Fingerprints are method-intrinsic, so they
+# are kept for the life of the process (and can be warmed at startup).
+_probe_cache: dict[tuple[int, str], list[dict[str, Any]]] = {}
+
 
 async def _probe_metric(
     client: TPClient, user_id: int, metric: str
@@ -76,6 +80,20 @@ async def _probe_metric(
     return found
 
 
+async def probe_metric_cached(
+    client: TPClient, user_id: int, metric: str
+) -> list[dict[str, Any]]:
+    """``_probe_metric`` through the process cache. An empty result (every
+    probe failed, e.g. offline) is not cached, so the next call retries."""
+    key = (user_id, metric)
+    if key not in _probe_cache:
+        found = await _probe_metric(client, user_id, metric)
+        if not found:
+            return found
+        _probe_cache[key] = found
+    return _probe_cache[key]
+
+
 async def tp_get_zone_methods(metric: str | None = None) -> dict[str, Any]:
     """List available zone-calculation methods, each with its zone count and
     zone labels (the method's fingerprint).
@@ -104,6 +122,6 @@ async def tp_get_zone_methods(metric: str | None = None) -> dict[str, Any]:
                 "error_code": "AUTH_INVALID",
                 "message": "Could not get user id. Re-authenticate.",
             }
-        methods = {m: await _probe_metric(client, user_id, m) for m in metrics}
+        methods = {m: await probe_metric_cached(client, user_id, m) for m in metrics}
 
     return {"methods": methods}
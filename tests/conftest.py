@@ -11,6 +11,46 @@ TEST_ATHLETE_ID = 123456
 TEST_EMAIL = "test@example.com"
 
 
+@pytest.fixture(autouse=True)
+def isolated_plan_journal(tmp_path, monkeypatch):
+    """Keep the plan-apply journal out of the real ~/.config."""
+    from tp_mcp.tools import _journal
+
+    monkeypatch.setattr(_journal, "JOURNAL_FILE", tmp_path / "plan_journal.json")
+    return tmp_path / "plan_journal.json"
+
+
+@pytest.fixture(autouse=True)
+def isolated_exercise_cache(tmp_path, monkeypatch):
+    """Keep the compiled exercise catalogue out of the real ~/.config."""
+    from tp_mcp.tools import _exercises
+
+    monkeypatch.setattr(_exercises, "CACHE_DIR", tmp_path / "cache")
+
+
+@pytest.fixture(autouse=True)
+def empty_tss_cache():
+    """Start every test with a cold PMC cache."""
+    from tp_mcp.tools._pmc import tss_cache
+
+    tss_cache.clear()
+    yield
+    tss_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def empty_reference_caches():
+    """Start every test with no cached reference reads or zone-method probes."""
+    from tp_mcp.client.http import TPClient
+    from tp_mcp.tools import zone_methods
+
+    TPClient._reference_cache.clear()
+    zone_methods._probe_cache.clear()
+    yield
+    TPClient._reference_cache.clear()
+    zone_methods._probe_cache.clear()
+
+
 @pytest.fixture
 def mock_keyring():
     """Mock keyring for testing credential storage."""
@@ -49,6 +49,17 @@ class TestStamping:
         untouched = next(t for t in tools if t.name == "tp_get_profile")
         assert not (untouched.meta or {}).get("ui")
 
+    def test_stamp_covers_extra_tools(self, monkeypatch):
+        binding = apps.AppBinding(
+            tool_name="tp_get_fitness", uri="ui://test/app.html", html_file="test.html", title="Test app",
+            extra_tools=("tp_get_metrics",),
+        )
+        monkeypatch.setattr(apps, "APPS", {binding.uri: binding})
+        tools = [t.model_copy(deep=True) for t in TOOLS]
+        apps.stamp_tools(tools)
+        metrics = next(t for t in tools if t.name == "tp_get_metrics")
+        assert metrics.meta["ui"]["resourceUri"] == binding.uri
+
 
 class TestServerWiring:
     def test_extension_advertised(self):
@@ -73,7 +84,8 @@ class TestRealRegistrations:
     def test_every_binding_targets_a_real_tool(self):
         names = {t.name for t in TOOLS}
         for b in apps.APPS.values():
-            assert b.tool_name in names, f"app {b.uri} bound to unknown tool {b.tool_name}"
+            for tool_name in b.tool_names:
+                assert tool_name in names, f"app {b.uri} bound to unknown tool {tool_name}"
 
     def test_every_binding_html_loads_and_is_self_contained(self):
         xss = json.loads(XSS_FIXTURE.read_text())
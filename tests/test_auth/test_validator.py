@@ -44,6 +44,9 @@ class TestValidateAuth:
             assert result.status == AuthStatus.VALID
             assert result.athlete_id == 789
             assert result.email == "test@example.com"
+            assert result.access_token == "test_token"
+            assert result.expires_in == 3600
+            assert "test_token" not in repr(result)
 
     @pytest.mark.asyncio
     async def test_valid_auth_coach_account(self):
@@ -64,6 +64,24 @@ class TestThrottling:
         expected_min = MIN_REQUEST_INTERVAL * 3 * 0.9  # 10% tolerance
         assert total_duration >= expected_min
 
+    @pytest.mark.asyncio
+    async def test_throttle_spaces_concurrent_callers(self):
+        """Coroutines sharing a client must not all fire at once."""
+        import asyncio
+
+        client = TPClient()
+        fired: list[float] = []
+
+        async def send():
+            await client._throttle()
+            fired.append(time.monotonic())
+
+        await asyncio.gather(*(send() for _ in range(3)))
+
+        fired.sort()
+        gaps = [b - a for a, b in zip(fired, fired[1:], strict=False)]
+        assert all(g >= MIN_REQUEST_INTERVAL * 0.9 for g in gaps)
+
     @pytest.mark.asyncio
     async def test_client_init_sets_last_request_time(self):
         """Client should initialize last request time to 0."""
@@ -187,6 +205,19 @@ class TestSharedTokenCache:
         TPClient()
         assert TPClient._shared_token_cache is not None
 
+    def test_seed_token_fills_empty_cache(self):
+        TPClient.seed_token("seeded", 3600)
+        cache = TPClient()._token_cache
+        assert cache.access_token == "seeded"
+        assert cache.is_valid()
+
+    def test_seed_token_keeps_valid_token(self):
+        cache = TPClient()._token_cache
+        cache.access_token = "fresh"
+        cache.expires_at = time.time() + 3600
+        TPClient.seed_token("seeded", 3600)
+        assert cache.access_token == "fresh"
+
 
 class TestHandleResponse:
     """Tests for HTTP response handling."""
@@ -226,3 +257,140 @@ class TestForbiddenEndpoints:
         # get_raw() is guarded too.
         rr = await client.get_raw("/plans/v1/commands/applyplan")
         assert rr.is_error and rr.error_code == ErrorCode.FORBIDDEN_ENDPOINT
+
+
+class TestReferenceCache:
+    """GET(cache_ttl=...) for slow-changing reference data."""
+
+    SETTINGS = "/fitness/v1/athletes/1/settings"
+
+    @pytest.mark.asyncio
+    async def test_success_cached_error_not(self):
+        client = TPClient()
+        client._send = AsyncMock(side_effect=[
+            APIResponse(success=False, message="boom"),
+            APIResponse(success=True, data={"ftp": 250}),
+        ])
+        assert (await client.get(self.SETTINGS, cache_ttl=60)).is_error
+        assert (await client.get(self.SETTINGS, cache_ttl=60)).data == {"ftp": 250}
+        assert (await client.get(self.SETTINGS, cache_ttl=60)).data == {"ftp": 250}
+        assert client._send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refetched(self):
+        client = TPClient()
+        client._send = AsyncMock(return_value=APIResponse(success=True, data={}))
+        await client.get(self.SETTINGS, cache_ttl=60)
+        fetched_at, response = TPClient._reference_cache[self.SETTINGS]
+        TPClient._reference_cache[self.SETTINGS] = (fetched_at - 61, response)
+        await client.get(self.SETTINGS, cache_ttl=60)
+        assert client._send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_request(self):
+        import asyncio
+
+        async def slow(*args):
+            await asyncio.sleep(0.01)
+            return APIResponse(success=True, data={"ftp": 250})
+
+        client = TPClient()
+        client._send = AsyncMock(side_effect=slow)
+        first, second = await asyncio.gather(
+            client.get(self.SETTINGS, cache_ttl=60), TPClient().get(self.SETTINGS, cache_ttl=60),
+        )
+        assert first is second
+        assert client._send.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_fetches_itself_when_owner_cancelled(self):
+        import asyncio
+
+        async def hang(*args):
+            await asyncio.sleep(3600)
+
+        owner, waiter = TPClient(), TPClient()
+        owner._send = AsyncMock(side_effect=hang)
+        waiter._send = AsyncMock(return_value=APIResponse(success=True, data={"ftp": 250}))
+        owner_task = asyncio.create_task(owner.get(self.SETTINGS, cache_ttl=60))
+        await asyncio.sleep(0)
+        waiter_task = asyncio.create_task(waiter.get(self.SETTINGS, cache_ttl=60))
+        await asyncio.sleep(0)
+        owner_task.cancel()
+        assert (await waiter_task).data == {"ftp": 250}
+        assert TPClient._reference_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_write_drops_only_that_athletes_entries(self):
+        client = TPClient()
+        client._send = AsyncMock(return_value=APIResponse(success=True, data={}))
+        for endpoint in (self.SETTINGS, "/fitness/v1/athletes/2/settings", "/fitness/v6/workouttypes"):
+            await client.get(endpoint, cache_ttl=60)
+        await client.put("/fitness/v2/athletes/1/powerzones", json=[])
+        assert set(TPClient._reference_cache) == {"/fitness/v1/athletes/2/settings", "/fitness/v6/workouttypes"}
+
+
+
+class TestCallDeadline:
+    """The tool call's deadline (context var) caps each request's timeout."""
+
+    @staticmethod
+    def _client(seen):
+        async def request(**kwargs):
+            seen.append(kwargs["timeout"])
+            return httpx.Response(200, json={})
+
+        client = TPClient(timeout=30.0)
+        client._client = AsyncMock(request=AsyncMock(side_effect=request))
+        client._ensure_access_token = AsyncMock(return_value=APIResponse(success=True))
+        return client
+
+    @pytest.mark.asyncio
+    async def test_timeout_capped_by_remaining_time(self):
+        from tp_mcp.client.context import call_deadline
+
+        seen: list[float] = []
+        client = self._client(seen)
+        await client.get("/fitness/v1/athletes/1/settings")
+        token = call_deadline.set(time.monotonic() + 5)
+        try:
+            await client.get("/fitness/v1/athletes/1/settings")
+        finally:
+            call_deadline.reset(token)
+        assert seen[0] == 30.0
+        assert 0 < seen[1] <= 5
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_sends_nothing(self):
+        from tp_mcp.client.context import call_deadline
+        from tp_mcp.client.http import ErrorCode
+
+        seen: list[float] = []
+        client = self._client(seen)
+        token = call_deadline.set(time.monotonic() - 1)
+        try:
+            result = await client.get("/fitness/v1/athletes/1/settings")
+        finally:
+            call_deadline.reset(token)
+        assert result.error_code == ErrorCode.TIMEOUT
+        assert seen == []
+
+
+@pytest.mark.asyncio
+async def test_resolve_athletes_reads_roster_once():
+    client = TPClient.__new__(TPClient)
+    client._get_user_data = AsyncMock(return_value={"athletes": [
+        {"athleteId": 1, "firstName": "Ann", "lastName": "Lee"},
+        {"athleteId": 2, "firstName": "Bob", "lastName": "Lee"},
+    ]})
+    TPClient._last_roster_refresh = time.monotonic()  # suppress the miss refresh
+    try:
+        resolved = await client.resolve_athletes(["Ann", "2", "Lee", "Zed"])
+    finally:
+        TPClient.invalidate_user_data()
+        TPClient._last_roster_refresh = 0.0
+    client._get_user_data.assert_awaited_once()
+    assert resolved[0] == (1, None)
+    assert resolved[1] == (2, None)
+    assert resolved[2][0] is None and "Ambiguous" in resolved[2][1]
+    assert resolved[3] == (None, "Could not resolve athlete 'Zed' in your roster.")
@@ -0,0 +1,107 @@
+"""Tests for tool-result wire encoding (tp_mcp.output)."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from tp_mcp import output
+
+RESULT = {"daily_data": [{"date": "2025-01-01", "ctl": 50.5}], "name": "Zürich ride", 7: "int key"}
+
+
+@pytest.fixture(autouse=True)
+def _default_env(monkeypatch):
+    monkeypatch.delenv(output.OUTPUT_ENV, raising=False)
+    monkeypatch.delenv(output.JSON_ENV, raising=False)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson" and output._orjson() is None:
+        pytest.skip("orjson not installed")
+    if request.param == "stdlib":
+        monkeypatch.setenv(output.JSON_ENV, "stdlib")
+    return request.param
+
+
+class TestDumps:
+    def test_compact_by_default(self, encoder):
+        text = output.dumps(RESULT)
+        assert "\n" not in text and ", " not in text
+        assert "Zürich" in text
+        assert json.loads(text) == json.loads(json.dumps(RESULT))
+
+    def test_pretty(self, encoder):
+        text = output.dumps(RESULT, pretty=True)
+        assert text.startswith('{\n  "')
+        assert json.loads(text) == json.loads(json.dumps(RESULT))
+
+    def test_big_int_falls_back_to_stdlib(self):
+        assert json.loads(output.dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_unserialisable_result_becomes_error_envelope(self, encoder):
+        [content] = output.text_content({"when": object()})
+        assert json.loads(content.text)["error_code"] == "API_ERROR"
+
+
+class TestCallResult:
+    def test_text_mode(self):
+        result = output.call_result({"a": 1})
+        assert result.content[0].text == '{"a":1}'
+        assert result.structured_content is None
+
+    def test_pretty_mode(self, monkeypatch):
+        monkeypatch.setenv(output.OUTPUT_ENV, "pretty")
+        assert output.call_result({"a": 1}).content[0].text == '{\n  "a": 1\n}'
+
+    def test_both_mode(self, monkeypatch):
+        monkeypatch.setenv(output.OUTPUT_ENV, "both")
+        result = output.call_result({"a": 1})
+        assert result.content[0].text == '{"a":1}'
+        assert result.structured_content == {"a": 1}
+
+    def test_structured_mode(self, monkeypatch):
+        monkeypatch.setenv(output.OUTPUT_ENV, "structured")
+        result = output.call_result([1, 2])
+        assert result.content == []
+        assert result.structured_content == {"result": [1, 2]}
+
+    def test_unknown_mode_uses_default(self, monkeypatch):
+        monkeypatch.setenv(output.OUTPUT_ENV, "yaml")
+        assert output.output_mode() == output.DEFAULT_OUTPUT
+
+
+class TestToColumns:
+    def test_daily_series(self):
+        rows = [{"date": f"2025-02-{d}", "ctl": d} for d in (27, 28)] + [{"date": "2025-03-02", "ctl": 2, "tsb": -1}]
+        assert output.to_columns(rows) == {
+            "date": {"start": "2025-02-27", "deltas": [1, 2]},
+            "ctl": [27, 28, 2],
+            "tsb": [None, None, -1],
+        }
+
+    def test_mixed_or_timestamp_columns_kept_as_arrays(self):
+        rows = [{"date": "2025-01-01"}, {"date": None}, {"date": "2025-01-03T06:00:00"}]
+        assert output.to_columns(rows[:2])["date"] == ["2025-01-01", None]
+        assert output.to_columns(rows[2:])["date"] == ["2025-01-03T06:00:00"]
+
+    def test_empty(self):
+        assert output.to_columns([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_server_emits_configured_mode(monkeypatch):
+    from types import SimpleNamespace
+
+    from mcp.types import CallToolRequestParams
+
+    from tp_mcp.server import _on_call_tool
+
+    monkeypatch.setenv(output.OUTPUT_ENV, "both")
+    ctx = SimpleNamespace(meta=None, request_id=1)
+    with patch("tp_mcp.tools.tp_get_profile", return_value={"athlete_id": 1}):
+        result = await _on_call_tool(ctx, CallToolRequestParams(name="tp_get_profile", arguments={}))
+
+    assert result.structured_content == {"athlete_id": 1}
+    assert json.loads(result.content[0].text) == {"athlete_id": 1}
@@ -0,0 +1,99 @@
+"""Tests for compiled tool-argument validation (tp_mcp.schema)."""
+
+import re
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tp_mcp.schema import SchemaError, compile_schema
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "days": {"type": "integer", "minimum": 1, "maximum": 90},
+        "ratio": {"type": "number"},
+        "sport": {"type": "string", "enum": ["Bike", "Run"]},
+        "structure": {"type": ["object", "string"]},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "calls": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "arguments": {"type": "object"}},
+                "required": ["name"],
+            },
+        },
+        "dry_run": {"type": "boolean"},
+    },
+    "required": ["sport"],
+}
+
+validate = compile_schema(SCHEMA)
+
+
+class TestCompileSchema:
+    def test_valid_arguments_pass(self):
+        args = {
+            "sport": "Run", "days": 30, "ratio": 1, "structure": '{"steps": []}', "tags": ["a"],
+            "calls": [{"name": "tp_get_profile", "arguments": {}}], "dry_run": False, "extra": object(),
+        }
+        assert validate(args) == args
+
+    def test_integral_float_becomes_int(self):
+        assert validate({"sport": "Run", "days": 7.0})["days"] == 7
+
+    def test_optional_null_is_omitted_value(self):
+        assert validate({"sport": "Bike", "days": None}) == {"sport": "Bike", "days": None}
+
+    @pytest.mark.parametrize(("args", "message"), [
+        ({}, "missing required argument(s): sport"),
+        ({"sport": None}, "sport: expected string, got null"),
+        ({"sport": "Swim"}, "sport: must be one of Bike, Run"),
+        ({"sport": "Run", "days": "30"}, "days: expected integer, got str"),
+        ({"sport": "Run", "days": 1.5}, "days: expected integer, got float"),
+        ({"sport": "Run", "days": True}, "days: expected integer, got bool"),
+        ({"sport": "Run", "days": 91}, "days: must be from 1 to 90, got 91"),
+        ({"sport": "Run", "ratio": "high"}, "ratio: expected number, got str"),
+        ({"sport": "Run", "structure": []}, "structure: expected object or string, got list"),
+        ({"sport": "Run", "tags": ["a", 2]}, "tags[1]: expected string, got int"),
+        ({"sport": "Run", "calls": [{"arguments": {}}]}, "calls[0]: missing required argument(s): name"),
+        ({"sport": "Run", "calls": [{"name": "x", "arguments": "today"}]}, "calls[0].arguments: expected object"),
+        ({"sport": "Run", "dry_run": "yes"}, "dry_run: expected boolean, got str"),
+    ])
+    def test_mismatch(self, args, message):
+        with pytest.raises(SchemaError, match=re.escape(message)):
+            validate(args)
+
+    def test_input_not_mutated(self):
+        args = {"sport": "Run", "days": 7.0}
+        validate(args)
+        assert args["days"] == 7.0
+
+
+class TestDispatchValidation:
+    def test_every_tool_schema_compiles(self):
+        from tp_mcp.server import _VALIDATORS, TOOLS
+
+        assert _VALIDATORS.keys() == {tool.name for tool in TOOLS}
+
+    @pytest.mark.asyncio
+    async def test_rejected_before_the_tool_runs(self):
+        from tp_mcp.server import _run_tool
+
+        tool = AsyncMock(return_value={"ok": True})
+        with patch("tp_mcp.tools.tp_get_fitness", tool):
+            result = await _run_tool("tp_get_fitness", {"days": "90", "athlete": 7})
+
+        assert result["error_code"] == "INVALID_ARGS"
+        assert result["message"].startswith("Invalid arguments for tp_get_fitness: ")
+        tool.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_injected_parameters_validated(self):
+        from tp_mcp.server import _run_tool
+
+        base = {"start_date": "2026-01-01", "end_date": "2026-01-07"}
+        for bad, field in (({"athlete": 7}, "athlete"), ({"limit": 0}, "limit"), ({"format": "csv"}, "format")):
+            result = await _run_tool("tp_get_workouts", {**base, **bad})
+            assert result["error_code"] == "INVALID_ARGS"
+            assert field in result["message"]
@@ -6,6 +6,9 @@ parsing, validation, and response formatting.
 """
 
 import json
+import re
+import subprocess
+import sys
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -13,6 +16,11 @@ import pytest
 from tp_mcp.client.http import APIResponse
 from tp_mcp.server import call_tool, list_tools
 
+# Modules ``import tp_mcp.server`` must leave unloaded (see scripts/bench_import_time.py).
+LAZY = re.compile(
+    r"^(tp_mcp\.tools\.(?!_constants$)\w+|tp_mcp\.client\.(http|models|roster)|tp_mcp\.auth(\..*)?|keyring)$"
+)
+
 
 def _parse_result(text_contents: list) -> dict:
     """Extract the JSON dict from a call_tool response."""
@@ -52,13 +60,20 @@ class TestListTools:
             "tp_delete_workout",
             "tp_copy_workout",
             "tp_reorder_workouts",
+            "tp_bulk_create_workouts",
+            "tp_bulk_update_workouts",
+            "tp_bulk_delete_workouts",
             "tp_get_workout_comments",
             "tp_add_workout_comment",
             "tp_validate_structure",
             "tp_get_workout_types",
             "tp_get_zone_methods",
             "tp_get_atp",
+            "tp_get_atp_compliance",
             "tp_get_weekly_summary",
+            "tp_get_training_summary",
+            "tp_get_compliance",
+            "tp_project_fitness",
             "tp_get_athlete_settings",
             "tp_update_ftp",
             "tp_update_hr_zones",
@@ -100,6 +115,7 @@ class TestListTools:
             "tp_list_athletes",
             "tp_list_groups",
             "tp_list_athletes_in_group",
+            "tp_get_group_dashboard",
             "tp_create_group",
             "tp_rename_group",
             "tp_delete_group",
@@ -123,6 +139,7 @@ class TestListTools:
             "tp_get_training_plan",
             "tp_get_training_plan_workouts",
             "tp_apply_training_plan",
+            "tp_batch",
         }
         assert v2_tools.issubset(names)
         assert len(names) == len(core_tools) + len(v2_tools)
@@ -361,7 +378,8 @@ class TestCreateWorkoutDispatch:
             )
         )
         assert result["isError"] is True
-        assert result["error_code"] == "VALIDATION_ERROR"
+        assert result["error_code"] == "INVALID_ARGS"  # schema enum, checked before dispatch
+        assert "sport" in result["message"]
 
     @pytest.mark.asyncio
     async def test_empty_title_rejected(self):
@@ -617,7 +635,7 @@ class TestCatchAllErrorHandler:
     @pytest.mark.asyncio
     async def test_internal_error_generic_message(self):
         """An unexpected exception should return generic message, not str(e)."""
-        with patch("tp_mcp.server.tp_get_profile", side_effect=RuntimeError("secret db password")):
+        with patch("tp_mcp.tools.tp_get_profile", side_effect=RuntimeError("secret db password")):
             result = _parse_result(await call_tool("tp_get_profile", {}))
 
         assert result["isError"] is True
@@ -625,3 +643,361 @@ class TestCatchAllErrorHandler:
         assert "secret" not in result["message"]
         assert "password" not in result["message"]
         assert "internal error" in result["message"].lower()
+
+
+
+# ---------------------------------------------------------------------------
+# call_tool: per-call deadlines, concurrency and cancellation
+# ---------------------------------------------------------------------------
+
+
+class TestCallDeadlines:
+    @pytest.fixture(autouse=True)
+    def _no_grace(self, monkeypatch):
+        monkeypatch.setattr("tp_mcp.server._DEADLINE_GRACE", 0)
+        monkeypatch.delenv("TP_MCP_TOOL_TIMEOUT", raising=False)
+
+    def test_budget_from_config_and_hint(self, monkeypatch):
+        from tp_mcp.server import DEFAULT_TOOL_TIMEOUT, _timeout_hint, _tool_timeout
+
+        assert _tool_timeout() == DEFAULT_TOOL_TIMEOUT
+        assert _tool_timeout(hint=20) == 20
+        monkeypatch.setenv("TP_MCP_TOOL_TIMEOUT", "10")
+        assert _tool_timeout(hint=20) == 10
+        monkeypatch.setenv("TP_MCP_TOOL_TIMEOUT", "0")
+        assert _tool_timeout() is None
+        assert _tool_timeout(hint=20) == 20
+        monkeypatch.setenv("TP_MCP_TOOL_TIMEOUT", "soon")
+        assert _tool_timeout() == DEFAULT_TOOL_TIMEOUT
+        assert _timeout_hint({"timeoutMs": 1500}) == 1.5
+        assert _timeout_hint({"timeoutMs": True}) is None
+        assert _timeout_hint(None) is None
+
+    @pytest.mark.asyncio
+    async def test_deadline_visible_to_tool(self):
+        from tp_mcp.client.context import call_deadline, time_remaining
+
+        seen = []
+
+        async def profile():
+            seen.append(time_remaining())
+            return {"ok": True}
+
+        with patch("tp_mcp.tools.tp_get_profile", side_effect=profile):
+            await call_tool("tp_get_profile", {}, timeout=2)
+
+        assert 0 < seen[0] <= 2
+        assert call_deadline.get() is None
+
+    @pytest.mark.asyncio
+    async def test_slow_call_times_out_without_blocking_others(self):
+        import asyncio
+
+        async def slow():
+            await asyncio.sleep(3600)
+
+        async def fast(**kwargs):
+            await asyncio.sleep(0.01)
+            return {"workouts": []}
+
+        with (
+            patch("tp_mcp.tools.tp_get_profile", side_effect=slow),
+            patch("tp_mcp.tools.tp_get_workouts", side_effect=fast),
+        ):
+            slow_result, fast_result = await asyncio.gather(
+                call_tool("tp_get_profile", {}, timeout=0.05),
+                call_tool("tp_get_workouts", {"start_date": "2025-01-01", "end_date": "2025-01-07"}),
+            )
+
+        assert _parse_result(slow_result)["error_code"] == "TIMEOUT"
+        assert _parse_result(fast_result) == {"workouts": []}
+
+    @pytest.mark.asyncio
+    async def test_cancellation_reaches_the_tool(self):
+        import asyncio
+
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def slow():
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch("tp_mcp.tools.tp_get_profile", side_effect=slow):
+            task = asyncio.create_task(call_tool("tp_get_profile", {}))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert cancelled.is_set()
+
+
+
+# ---------------------------------------------------------------------------
+# Result shaping: fields / limit / cursor on large list tools
+# ---------------------------------------------------------------------------
+
+
+class TestResultShaping:
+    WORKOUTS = [{"id": str(i), "date": f"2025-01-0{i + 1}", "title": f"Ride {i}", "tss": 50 + i} for i in range(5)]
+    RANGE = {"start_date": "2025-01-01", "end_date": "2025-01-31"}
+
+    def _patch(self):
+        async def workouts(**kwargs):
+            return {"workouts": [dict(w) for w in self.WORKOUTS], "count": 5, "date_range": {}}
+
+        return patch("tp_mcp.tools.tp_get_workouts", side_effect=workouts)
+
+    @pytest.mark.asyncio
+    async def test_schema_params_only_on_list_tools(self):
+        from tp_mcp.server import _SHAPED_LISTS
+
+        for tool in await list_tools():
+            has = {"fields", "limit", "cursor"} <= tool.input_schema["properties"].keys()
+            assert has == (tool.name in _SHAPED_LISTS), tool.name
+
+    @pytest.mark.asyncio
+    async def test_fields_projection(self):
+        with self._patch():
+            result = _parse_result(await call_tool("tp_get_workouts", {**self.RANGE, "fields": ["date", "tss"]}))
+
+        assert result["workouts"][0] == {"date": "2025-01-01", "tss": 50}
+        assert result["count"] == 5
+        assert "next_cursor" not in result
+
+    @pytest.mark.asyncio
+    async def test_pages_through_with_cursor(self):
+        seen, cursor = [], None
+        with self._patch() as tool:
+            for _ in range(3):
+                args = {**self.RANGE, "limit": 2, **({"cursor": cursor} if cursor else {})}
+                page = _parse_result(await call_tool("tp_get_workouts", args))
+                seen += [w["id"] for w in page["workouts"]]
+                assert page["total"] == 5
+                cursor = page.get("next_cursor")
+            assert "cursor" not in tool.call_args.kwargs
+
+        assert seen == ["0", "1", "2", "3", "4"]
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_bound_to_its_query(self):
+        with self._patch():
+            first = _parse_result(await call_tool("tp_get_workouts", {**self.RANGE, "limit": 2}))
+            other = {"start_date": "2025-02-01", "end_date": "2025-02-28", "limit": 2,
+                     "cursor": first["next_cursor"]}
+            result = _parse_result(await call_tool("tp_get_workouts", other))
+            garbage = _parse_result(await call_tool("tp_get_workouts", {**self.RANGE, "cursor": "???"}))
+
+        assert result["error_code"] == "INVALID_ARGS"
+        assert garbage["error_code"] == "INVALID_ARGS"
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self):
+        for bad in ({"limit": 0}, {"limit": "10"}, {"fields": "date"}, {"fields": []}):
+            result = _parse_result(await call_tool("tp_get_workouts", {**self.RANGE, **bad}))
+            assert result["error_code"] == "INVALID_ARGS", bad
+
+    @pytest.mark.asyncio
+    async def test_columns_format_after_paging(self):
+        with self._patch():
+            args = {**self.RANGE, "format": "columns", "fields": ["date", "tss"], "limit": 3}
+            result = _parse_result(await call_tool("tp_get_workouts", args))
+
+        assert result["format"] == "columns"
+        assert result["workouts"] == {"date": {"start": "2025-01-01", "deltas": [1, 1]}, "tss": [50, 51, 52]}
+        assert result["next_cursor"]
+
+    @pytest.mark.asyncio
+    async def test_columns_format_only_where_offered(self):
+        with self._patch():
+            bad = _parse_result(await call_tool("tp_get_workouts", {**self.RANGE, "format": "csv"}))
+        assert bad["error_code"] == "INVALID_ARGS"
+        props = {t.name: t.input_schema["properties"] for t in await list_tools()}
+        assert "format" in props["tp_get_fitness"]
+        assert "format" not in props["tp_get_events"]
+
+    @pytest.mark.asyncio
+    async def test_error_results_pass_through(self):
+        error = {"isError": True, "error_code": "API_ERROR", "message": "boom"}
+        with patch("tp_mcp.tools.tp_get_metrics", AsyncMock(return_value=error)):
+            result = _parse_result(await call_tool("tp_get_metrics", {**self.RANGE, "limit": 1}))
+        assert result == error
+
+
+
+# ---------------------------------------------------------------------------
+# Tool profiles: subsets of TOOLS for tools/list and dispatch
+# ---------------------------------------------------------------------------
+
+
+class TestToolProfiles:
+    @pytest.fixture(autouse=True)
+    def _restore_profile(self, monkeypatch):
+        import tp_mcp.server as server_module
+
+        monkeypatch.delenv("TP_MCP_PROFILE", raising=False)
+        yield
+        server_module.set_profile("admin")
+
+    def test_profiles_are_subsets_with_auth_status(self):
+        from tp_mcp.server import _TOOLS_BY_NAME, TOOL_PROFILES
+
+        for name, tools in TOOL_PROFILES.items():
+            assert tools <= _TOOLS_BY_NAME.keys(), name
+            assert "tp_auth_status" in tools, name
+        assert all(_TOOLS_BY_NAME[t].annotations.read_only_hint for t in TOOL_PROFILES["read-only"])
+        assert "tp_list_groups" in TOOL_PROFILES["coach"]
+        assert "tp_list_groups" not in TOOL_PROFILES["athlete"]
+        assert TOOL_PROFILES["strength"] < TOOL_PROFILES["athlete"] < TOOL_PROFILES["coach"] < TOOL_PROFILES["admin"]
+
+    @pytest.mark.asyncio
+    async def test_selected_profile_lists_and_dispatches_its_tools_only(self, monkeypatch):
+        from tp_mcp.server import _on_list_tools, set_profile
+
+        monkeypatch.setenv("TP_MCP_PROFILE", "strength")
+        assert set_profile() == "strength"
+        names = {t.name for t in await list_tools()}
+        assert "tp_search_exercises" in names
+        assert "tp_get_fitness" not in names
+        listed = await _on_list_tools(None, None)
+        assert listed is await _on_list_tools(None, None)  # built once per profile
+
+        result = _parse_result(await call_tool("tp_get_fitness", {}))
+        assert result["error_code"] == "UNKNOWN_TOOL"
+        assert "strength" in result["message"]
+
+    def test_explicit_profile_beats_env_and_unknown_rejected(self, monkeypatch):
+        from tp_mcp.server import set_profile
+
+        monkeypatch.setenv("TP_MCP_PROFILE", "strength")
+        assert set_profile("Coach") == "coach"
+        with pytest.raises(ValueError, match="read-only"):
+            set_profile("everything")
+
+
+# ---------------------------------------------------------------------------
+# Cold start: tool modules load on first call, not at import
+# ---------------------------------------------------------------------------
+
+
+class TestLazyToolImports:
+    def test_server_import_loads_no_tool_code(self):
+        code = "import json, sys; import tp_mcp.server; print(json.dumps(sorted(sys.modules)))"
+        out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+        loaded = json.loads(out.stdout)
+        eager = [m for m in loaded if LAZY.match(m)]
+        assert eager == []
+
+    def test_every_handler_resolves_lazily(self):
+        from tp_mcp import tools
+        from tp_mcp.server import _TOOL_HANDLERS
+
+        assert set(_TOOL_HANDLERS) == set(tools._TOOL_MODULES) == set(tools.__all__)
+        for name in _TOOL_HANDLERS:
+            assert callable(getattr(tools, name))
+
+    def test_unknown_attribute(self):
+        from tp_mcp import tools
+
+        with pytest.raises(AttributeError):
+            _ = tools.tp_not_a_tool
+
+
+# ---------------------------------------------------------------------------
+# Startup auth check: background task that seeds the token cache
+# ---------------------------------------------------------------------------
+
+
+class TestStartupAuth:
+    @pytest.fixture(autouse=True)
+    def _reset_token_cache(self):
+        from tp_mcp.client import TPClient
+
+        TPClient._shared_token_cache = None
+        yield
+        TPClient._shared_token_cache = None
+
+    @pytest.mark.asyncio
+    async def test_valid_auth_seeds_token_cache(self):
+        from tp_mcp.auth import AuthResult, AuthStatus, CredentialResult
+        from tp_mcp.client import TPClient
+        from tp_mcp.server import _validate_auth_on_startup
+
+        valid = AuthResult(status=AuthStatus.VALID, athlete_id=1, access_token="tok", expires_in=3600)
+        with (
+            patch("tp_mcp.auth.get_credential", return_value=CredentialResult(True, "ok", cookie="c")),
+            patch("tp_mcp.auth.validate_auth", AsyncMock(return_value=valid)),
+        ):
+            assert await _validate_auth_on_startup() is True
+
+        cache = TPClient()._token_cache
+        assert cache.access_token == "tok"
+        assert cache.is_valid()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_logged_not_raised(self):
+        from tp_mcp.server import _validate_auth_on_startup
+
+        with patch("tp_mcp.auth.get_credential", side_effect=OSError("keyring locked")):
+            assert await _validate_auth_on_startup() is False
+
+    @pytest.mark.asyncio
+    async def test_prefetch_only_after_valid_auth(self, monkeypatch):
+        from tp_mcp import server as server_module
+
+        monkeypatch.delenv("TP_MCP_PREFETCH", raising=False)
+        fetch = AsyncMock(return_value={})
+        with (
+            patch.object(server_module, "_validate_auth_on_startup", AsyncMock(return_value=False)),
+            patch("tp_mcp.tools._prefetch.prefetch", fetch),
+        ):
+            await server_module._startup_warm_up()
+        fetch.assert_not_awaited()
+
+        with (
+            patch.object(server_module, "_validate_auth_on_startup", AsyncMock(return_value=True)),
+            patch("tp_mcp.tools._prefetch.prefetch", fetch),
+        ):
+            await server_module._startup_warm_up()
+        fetch.assert_awaited_once_with(("roster", "settings", "workout_types", "equipment"))
+
+    @pytest.mark.asyncio
+    async def test_serving_does_not_wait_for_validation(self, monkeypatch):
+        import asyncio
+        from contextlib import asynccontextmanager
+
+        from tp_mcp import server as server_module
+
+        monkeypatch.delenv("TP_MCP_SKIP_STARTUP_VALIDATION", raising=False)
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def slow_validation():
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        @asynccontextmanager
+        async def fake_stdio():
+            yield None, None
+
+        async def serve(*args):
+            await started.wait()  # validation runs alongside serving, not before it
+
+        run = AsyncMock(side_effect=serve)
+        with (
+            patch.object(server_module, "_validate_auth_on_startup", slow_validation),
+            patch.object(server_module, "stdio_server", fake_stdio),
+            patch.object(server_module.server, "run", run),
+        ):
+            await asyncio.wait_for(server_module.run_server_async(), timeout=5)
+
+        run.assert_awaited_once()
+        assert cancelled.is_set()
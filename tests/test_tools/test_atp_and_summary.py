@@ -1,11 +1,12 @@
 """Tests for ATP and weekly summary tools."""
 
+from datetime import date, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from tp_mcp.client.http import APIResponse
-from tp_mcp.tools.atp import tp_get_atp
+from tp_mcp.tools.atp import tp_get_atp, tp_get_atp_compliance
 from tp_mcp.tools.weekly_summary import _get_week_bounds, tp_get_weekly_summary
 
 
@@ -116,3 +117,101 @@ class TestWeeklySummary:
 
         assert "week" in result
         assert result["workout_count"] == 0
+
+
+class TestAtpCompliance:
+    ATP = [
+        {"week": "2026-01-05T00:00:00", "volume": 400, "period": "Base 1 - Week 1"},
+        {"week": "2026-01-12T00:00:00", "volume": 450, "period": "Base 1 - Week 2"},
+        {"week": "2026-01-19T00:00:00", "volume": 500, "period": "Build 1 - Week 1"},
+    ]
+    WORKOUTS = [
+        {"workoutId": 1, "workoutDay": "2026-01-06T00:00:00", "tssActual": 200, "totalTime": 2.0,
+         "totalTimePlanned": 2.0},
+        {"workoutId": 2, "workoutDay": "2026-01-11T00:00:00", "tssActual": 220, "totalTime": 2.5},
+        {"workoutId": 3, "workoutDay": "2026-01-13T00:00:00", "tssActual": 300, "totalTime": 3.0},
+        {"workoutId": 4, "workoutDay": "2026-01-21T00:00:00", "tssActual": 550, "totalTime": 5.0},
+        {"workoutId": 5, "workoutDay": "2026-01-30T00:00:00", "tssActual": 50, "totalTime": 0.5},
+    ]
+
+    def _mock(self, mock_client, atp=None, workouts=None):
+        async def get(endpoint):
+            if "/atp/" in endpoint:
+                return APIResponse(success=True, data=self.ATP if atp is None else atp)
+            return APIResponse(success=True, data=self.WORKOUTS if workouts is None else workouts)
+
+        instance = AsyncMock()
+        instance.ensure_athlete_id = AsyncMock(return_value=123)
+        instance.get = AsyncMock(side_effect=get)
+        mock_client.return_value.__aenter__.return_value = instance
+        return instance
+
+    @pytest.mark.asyncio
+    async def test_joins_by_iso_week_and_rolls_up_periods(self):
+        with patch("tp_mcp.tools.atp.TPClient") as mock_client:
+            instance = self._mock(mock_client)
+            result = await tp_get_atp_compliance("2026-01-05", "2026-02-01")
+
+        assert instance.get.await_count == 2  # one ATP read + one workout read, concurrently
+        first, second, third = result["weeks"]
+        assert first["iso_week"] == "2026-W02"
+        assert first["tss_actual"] == 420
+        assert first["deviation"] == 20
+        assert first["pct"] == 105
+        assert first["hours_actual"] == 4.5
+        assert first["hours_planned"] == 2.0
+        assert second["pct"] == 67
+        assert third["period"] == "Build 1 - Week 1"
+
+        periods = {p["period"]: p for p in result["by_period"]}
+        assert periods["Base 1"]["weeks"] == 2
+        assert periods["Base 1"]["tss_planned"] == 850
+        assert periods["Base 1"]["tss_actual"] == 720
+        assert periods["Build 1"]["deviation"] == 50
+        assert result["totals"]["tss_actual"] == 1270
+        assert result["tss_outside_atp"] == 50
+
+    @pytest.mark.asyncio
+    async def test_first_week_counts_actuals_before_start(self):
+        with patch("tp_mcp.tools.atp.TPClient") as mock_client:
+            instance = self._mock(mock_client)
+            result = await tp_get_atp_compliance("2026-01-08", "2026-02-01")  # a Thursday
+
+        workout_reads = [c.args[0] for c in instance.get.await_args_list if "/atp/" not in c.args[0]]
+        assert "2026-01-05" in workout_reads[0]
+        assert result["weeks"][0]["tss_actual"] == 420  # includes Tuesday's 200
+
+    @pytest.mark.asyncio
+    async def test_last_week_counts_actuals_after_end(self):
+        workouts = [*self.WORKOUTS, {"workoutId": 6, "workoutDay": "2026-01-24T00:00:00", "tssActual": 100}]
+        with patch("tp_mcp.tools.atp.TPClient") as mock_client:
+            instance = self._mock(mock_client, workouts=workouts)
+            result = await tp_get_atp_compliance("2026-01-05", "2026-01-21")  # a Wednesday
+
+        workout_reads = [c.args[0] for c in instance.get.await_args_list if "/atp/" not in c.args[0]]
+        assert workout_reads[-1].endswith("/2026-01-25")
+        assert result["weeks"][-1]["tss_actual"] == 650  # includes Saturday's 100
+
+    @pytest.mark.asyncio
+    async def test_last_week_read_stops_at_today(self):
+        today = date.today()
+        with patch("tp_mcp.tools.atp.TPClient") as mock_client:
+            instance = self._mock(mock_client, atp=[])
+            await tp_get_atp_compliance((today - timedelta(days=30)).isoformat(), today.isoformat())
+
+        workout_reads = [c.args[0] for c in instance.get.await_args_list if "/atp/" not in c.args[0]]
+        assert workout_reads[-1].endswith(f"/{today.isoformat()}")
+
+    @pytest.mark.asyncio
+    async def test_no_atp(self):
+        with patch("tp_mcp.tools.atp.TPClient") as mock_client:
+            self._mock(mock_client, atp=[])
+            result = await tp_get_atp_compliance("2026-01-05", "2026-02-01")
+
+        assert result["weeks"] == []
+        assert "No ATP data" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_range_validation(self):
+        result = await tp_get_atp_compliance("2026-01-01", "2027-06-01")
+        assert result["error_code"] == "VALIDATION_ERROR"
@@ -0,0 +1,136 @@
+"""Tests for tp_batch."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tp_mcp.client.context import athlete_override, call_deadline, progress_reporter
+from tp_mcp.server import call_tool
+from tp_mcp.tools.batch import MAX_BATCH_CALLS, tp_batch
+
+ALLOWED = {"tp_get_profile", "tp_get_workouts", "tp_get_metrics"}
+
+
+class TestBatch:
+    @pytest.mark.asyncio
+    async def test_results_in_input_order_with_capped_concurrency(self):
+        in_flight = peak = 0
+
+        async def dispatch(name, arguments):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * (5 - arguments["n"]))  # later entries finish first
+            in_flight -= 1
+            return {"n": arguments["n"]}
+
+        calls = [{"name": "tp_get_metrics", "arguments": {"n": n}} for n in range(5)]
+        result = await tp_batch(calls, dispatch, ALLOWED, max_concurrency=2)
+
+        assert [r["result"]["n"] for r in result["results"]] == [0, 1, 2, 3, 4]
+        assert peak == 2
+        assert result["succeeded"] == 5
+        assert result["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_bad_entries_fail_alone(self):
+        dispatch = AsyncMock(return_value={"ok": True})
+        calls = [
+            {"name": "tp_get_profile"},
+            {"name": "tp_delete_workout", "arguments": {"workout_id": "1"}},
+            {"arguments": {}},
+            {"name": "tp_get_metrics", "arguments": "today"},
+        ]
+        result = await tp_batch(calls, dispatch, ALLOWED)
+
+        assert result["results"][0] == {"name": "tp_get_profile", "result": {"ok": True}}
+        assert [r["result"].get("error_code") for r in result["results"][1:]] == ["INVALID_ARGS"] * 3
+        assert "read-only" in result["results"][1]["result"]["message"]
+        assert dispatch.await_count == 1
+        assert result["failed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_entry_athlete_passed_through(self):
+        dispatch = AsyncMock(return_value={})
+        await tp_batch([{"name": "tp_get_profile", "athlete": "Jane"}], dispatch, ALLOWED)
+        dispatch.assert_awaited_once_with("tp_get_profile", {"athlete": "Jane"})
+
+    @pytest.mark.asyncio
+    async def test_validation(self):
+        dispatch = AsyncMock()
+        assert (await tp_batch([], dispatch, ALLOWED))["error_code"] == "VALIDATION_ERROR"
+        too_many = [{"name": "tp_get_profile"}] * (MAX_BATCH_CALLS + 1)
+        assert (await tp_batch(too_many, dispatch, ALLOWED))["error_code"] == "VALIDATION_ERROR"
+        one = [{"name": "tp_get_profile"}]
+        assert (await tp_batch(one, dispatch, ALLOWED, max_concurrency=0))["error_code"] == "VALIDATION_ERROR"
+        dispatch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_entries_not_started_after_deadline(self):
+        dispatch = AsyncMock(return_value={})
+        token = call_deadline.set(time.monotonic() - 1)
+        try:
+            result = await tp_batch([{"name": "tp_get_profile"}], dispatch, ALLOWED)
+        finally:
+            call_deadline.reset(token)
+        assert result["results"][0]["result"]["error_code"] == "TIMEOUT"
+        dispatch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reports_batch_progress_only(self):
+        seen = []
+
+        async def reporter(progress, total, message):
+            seen.append((progress, total))
+
+        async def dispatch(name, arguments):
+            assert progress_reporter.get() is None
+            return {}
+
+        token = progress_reporter.set(reporter)
+        try:
+            await tp_batch([{"name": "tp_get_profile"}] * 3, dispatch, ALLOWED)
+        finally:
+            progress_reporter.reset(token)
+        assert seen == [(1, 3), (2, 3), (3, 3)]
+
+
+class TestBatchDispatch:
+    """End to end through call_tool and the server's real dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_per_entry_athlete_and_inherited_target(self):
+        targets = []
+
+        async def profile():
+            targets.append(athlete_override.get())
+            return {"athlete": athlete_override.get()}
+
+        with patch("tp_mcp.tools.tp_get_profile", side_effect=profile):
+            out = await call_tool("tp_batch", {
+                "athlete": "Coach Default",
+                "calls": [
+                    {"name": "tp_get_profile"},
+                    {"name": "tp_get_profile", "athlete": "Jane"},
+                    {"name": "tp_get_profile", "arguments": {"athlete": "Sam"}},
+                ],
+            })
+
+        result = json.loads(out[0].text)
+        assert [r["result"]["athlete"] for r in result["results"]] == ["Coach Default", "Jane", "Sam"]
+        assert athlete_override.get() is None
+
+    @pytest.mark.asyncio
+    async def test_writes_and_nested_batches_rejected(self):
+        out = await call_tool("tp_batch", {"calls": [
+            {"name": "tp_delete_workout", "arguments": {"workout_id": "1"}},
+            {"name": "tp_batch", "arguments": {"calls": []}},
+            {"name": "tp_get_workouts", "arguments": {}},
+        ]})
+
+        results = [r["result"] for r in json.loads(out[0].text)["results"]]
+        assert [r["error_code"] for r in results] == ["INVALID_ARGS"] * 3
+        assert "start_date" in results[2]["message"]  # the entry's own required-arg check
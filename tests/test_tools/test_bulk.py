@@ -0,0 +1,112 @@
+"""Tests for the bounded-concurrency helpers shared by multi-item tools."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+import tp_mcp.tools._bulk as bulk
+from tp_mcp.client.context import call_deadline
+from tp_mcp.client.http import APIResponse, ErrorCode
+
+_OK = APIResponse(success=True, data={})
+_LIMITED = APIResponse(success=False, error_code=ErrorCode.RATE_LIMITED, message="Rate limited.")
+_NETWORK = APIResponse(success=False, error_code=ErrorCode.NETWORK_ERROR, message="Request timed out.")
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(bulk, "RETRY_BASE_DELAY", 0)
+
+
+class TestBoundedGather:
+    @pytest.mark.asyncio
+    async def test_preserves_order_and_caps_in_flight(self):
+        in_flight = peak = 0
+
+        async def work(n):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return n * 2
+
+        out = await bulk.bounded_gather(work, range(10), limit=3, not_started=lambda n: None)
+        assert out == [n * 2 for n in range(10)]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_stops_starting_items_after_deadline(self):
+        started = []
+
+        async def work(n):
+            started.append(n)
+            await asyncio.sleep(0.05)
+            return n
+
+        token = call_deadline.set(time.monotonic() + 0.02)
+        try:
+            out = await bulk.bounded_gather(work, range(6), limit=2, not_started=lambda n: -n)
+        finally:
+            call_deadline.reset(token)
+        assert started == [0, 1]
+        assert out == [0, 1, -2, -3, -4, -5]  # in-flight items finish; the rest are reported
+
+    def test_not_started_response_means_nothing_was_sent(self):
+        response = bulk.not_started_response()
+        assert response.error_code == ErrorCode.TIMEOUT
+        assert "Not started" in response.message
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_in_flight_siblings(self):
+        finished = []
+
+        async def work(n):
+            if n == 0:
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.05)
+            finished.append(n)
+
+        with pytest.raises(RuntimeError):
+            await bulk.bounded_gather(work, range(3), limit=3, not_started=lambda n: None)
+        await asyncio.sleep(0.1)
+        assert finished == []
+
+
+class TestWithRetries:
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_until_success(self):
+        call = AsyncMock(side_effect=[_LIMITED, _LIMITED, _OK])
+        r = await bulk.with_retries(call)
+        assert r.success and call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        call = AsyncMock(return_value=_LIMITED)
+        r = await bulk.with_retries(call)
+        assert r.error_code == ErrorCode.RATE_LIMITED
+        assert call.await_count == bulk.MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_network_error_retried_only_when_idempotent(self):
+        post = AsyncMock(side_effect=[_NETWORK, _OK])
+        assert (await bulk.with_retries(post)).is_error
+        assert post.await_count == 1  # a timed-out POST may have landed
+
+        put = AsyncMock(side_effect=[_NETWORK, _OK])
+        assert (await bulk.with_retries(put, idempotent=True)).success
+        assert put.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_retry_that_would_overrun_deadline(self, monkeypatch):
+        monkeypatch.setattr(bulk, "RETRY_BASE_DELAY", 10)
+        call = AsyncMock(side_effect=[_LIMITED, _OK])
+        token = call_deadline.set(time.monotonic() + 5)
+        try:
+            r = await bulk.with_retries(call)
+        finally:
+            call_deadline.reset(token)
+        assert r.error_code == ErrorCode.RATE_LIMITED
+        assert call.await_count == 1
@@ -1,11 +1,13 @@
 """Tests for coach account support: context var, ensure_athlete_id, schema injection."""
 
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from tp_mcp.client.context import athlete_override
-from tp_mcp.client.http import TPClient
+from tp_mcp.client.http import USER_DATA_TTL, APIResponse, TPClient
+from tp_mcp.client.roster import RosterIndex
 
 
 # ---------------------------------------------------------------------------
@@ -84,11 +86,11 @@ SOLO_USER_DATA = {
 @pytest.fixture(autouse=True)
 def _clear_caches():
     """Reset class-level caches between tests."""
-    TPClient._cached_athlete_id = None
-    TPClient._cached_user_data = None
+    TPClient.invalidate_user_data()
+    TPClient._last_roster_refresh = 0.0
     yield
-    TPClient._cached_athlete_id = None
-    TPClient._cached_user_data = None
+    TPClient.invalidate_user_data()
+    TPClient._last_roster_refresh = 0.0
 
 
 def _mock_client(user_data):
@@ -306,6 +308,89 @@ class TestCacheBypass:
             athlete_override.reset(token)
 
 
+# ---------------------------------------------------------------------------
+# Roster index: normalized lookup, TTL and miss-driven refresh
+# ---------------------------------------------------------------------------
+
+class TestRosterIndex:
+    def test_accent_case_and_whitespace_insensitive(self):
+        index = RosterIndex([
+            {"athleteId": 7, "firstName": "José", "lastName": "Núñez"},
+        ])
+        assert index.match("jose  NUNEZ") == 7
+        assert index.match("Núñez") == 7
+        assert index.match(" josé ") == 7
+        assert index.match("7") == 7
+        assert index.match("8") is None
+
+    def test_ambiguous_token_raises(self):
+        index = RosterIndex(AMBIGUOUS_USER_DATA["athletes"])
+        with pytest.raises(ValueError, match="Ambiguous"):
+            index.match("charlotte")
+        assert index.match("Charlotte Smith") == 402
+
+    def test_lookup_reports_status(self):
+        index = RosterIndex(AMBIGUOUS_USER_DATA["athletes"])
+        found = index.lookup("Charlotte Smith")
+        assert (found.status, found.athlete_id) == ("found", 402)
+        ambiguous = index.lookup("charlotte")
+        assert ambiguous.status == "ambiguous"
+        assert ambiguous.athlete_id is None
+        assert len(ambiguous.candidates) > 1
+        assert index.lookup("nobody").status == "missing"
+
+    def test_index_reused_until_user_data_changes(self):
+        first = TPClient._roster(COACH_USER_DATA)
+        assert TPClient._roster(COACH_USER_DATA) is first
+        assert TPClient._roster(dict(COACH_USER_DATA)) is not first
+
+    @pytest.mark.asyncio
+    async def test_user_data_expires_after_ttl(self, monkeypatch):
+        client = TPClient.__new__(TPClient)
+        client.get = AsyncMock(return_value=APIResponse(success=True, data={"user": COACH_USER_DATA}))
+        await client._get_user_data()
+        await client._get_user_data()
+        assert client.get.await_count == 1
+        monkeypatch.setattr(TPClient, "_cached_user_data_at", time.monotonic() - USER_DATA_TTL - 1)
+        await client._get_user_data()
+        assert client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_copy_kept_when_refresh_fails(self, monkeypatch):
+        client = TPClient.__new__(TPClient)
+        client.get = AsyncMock(return_value=APIResponse(success=True, data={"user": COACH_USER_DATA}))
+        await client._get_user_data()
+        client.get = AsyncMock(return_value=APIResponse(success=False, message="down"))
+        assert await client._get_user_data(force_refresh=True) is COACH_USER_DATA
+
+    @pytest.mark.asyncio
+    async def test_miss_refreshes_roster_once(self):
+        newcomer = {"athleteId": 777, "firstName": "Nina", "lastName": "New", "coachedBy": 100}
+        updated = {**COACH_USER_DATA, "athletes": [*COACH_USER_DATA["athletes"], newcomer]}
+        client = TPClient.__new__(TPClient)
+        client._athlete_id = None
+        client._get_user_data = AsyncMock(side_effect=[COACH_USER_DATA, updated, updated])
+        token = athlete_override.set("Nina New")
+        try:
+            assert await client.ensure_athlete_id() == 777
+            assert client._get_user_data.await_args_list[1].kwargs == {"force_refresh": True}
+            # A second miss inside the refresh interval does not refetch again.
+            athlete_override.set("Nobody")
+            assert await client.ensure_athlete_id() is None
+            assert client._get_user_data.await_count == 3
+        finally:
+            athlete_override.reset(token)
+
+    def test_invalidate_clears_everything(self):
+        TPClient._cached_user_data = COACH_USER_DATA
+        TPClient._cached_athlete_id = 100
+        TPClient._roster(COACH_USER_DATA)
+        TPClient.invalidate_user_data()
+        assert TPClient._cached_user_data is None
+        assert TPClient._cached_athlete_id is None
+        assert TPClient._roster_index is None
+
+
 # ---------------------------------------------------------------------------
 # Schema injection
 # ---------------------------------------------------------------------------
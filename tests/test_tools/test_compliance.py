@@ -0,0 +1,99 @@
+"""Tests for the planned-vs-completed compliance engine."""
+
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tp_mcp.client import parse_workout_list
+from tp_mcp.client.http import APIResponse, ErrorCode
+from tp_mcp.tools.compliance import compute_compliance, tp_get_compliance
+
+# Week of Mon 2026-03-02: a completed planned ride, a missed run, an unplanned swim.
+# Week of Mon 2026-03-09: a ride done at 50% of planned duration.
+WORKOUTS = [
+    {"workoutId": 1, "workoutDay": "2026-03-02T00:00:00", "workoutTypeValueId": 2,
+     "totalTimePlanned": 1.0, "totalTime": 1.0, "tssPlanned": 60, "tssActual": 66,
+     "distancePlanned": 30000, "distance": 30000},
+    {"workoutId": 2, "workoutDay": "2026-03-03T00:00:00", "workoutTypeValueId": 3,
+     "totalTimePlanned": 0.5, "tssPlanned": 30},
+    {"workoutId": 3, "workoutDay": "2026-03-04T00:00:00", "workoutTypeValueId": 1,
+     "totalTime": 0.5, "tssActual": 20},
+    {"workoutId": 4, "workoutDay": "2026-03-10T00:00:00", "workoutTypeValueId": 2,
+     "totalTimePlanned": 2.0, "totalTime": 1.0, "tssPlanned": 100, "tssActual": 50},
+]
+
+
+def test_compute_compliance_buckets_by_day_and_sport():
+    buckets = compute_compliance(parse_workout_list(WORKOUTS), today=date(2026, 4, 1))
+    assert set(buckets) == {
+        (date(2026, 3, 2), "Bike"), (date(2026, 3, 3), "Run"),
+        (date(2026, 3, 4), "Swim"), (date(2026, 3, 10), "Bike"),
+    }
+    run = buckets[(date(2026, 3, 3), "Run")]
+    assert run.planned_sessions == 1 and run.missed_sessions == 1 and run.completed_sessions == 0
+    swim = buckets[(date(2026, 3, 4), "Swim")]
+    assert swim.unplanned_sessions == 1 and swim.planned_sessions == 0
+
+
+def test_future_planned_session_is_not_missed():
+    buckets = compute_compliance(parse_workout_list(WORKOUTS[1:2]), today=date(2026, 3, 1))
+    assert buckets[(date(2026, 3, 3), "Run")].missed_sessions == 0
+
+
+def _client(*responses):
+    inst = AsyncMock()
+    inst.ensure_athlete_id = AsyncMock(return_value=123)
+    inst.get = AsyncMock(side_effect=list(responses))
+    return inst
+
+
+@pytest.mark.asyncio
+async def test_get_compliance_rollups():
+    inst = _client(APIResponse(success=True, data=WORKOUTS))
+    with patch("tp_mcp.tools.compliance.TPClient") as mc:
+        mc.return_value.__aenter__.return_value = inst
+        out = await tp_get_compliance("2026-03-02", "2026-03-15", include_days=True)
+
+    totals = out["totals"]
+    assert totals["planned_sessions"] == 3 and totals["completed_sessions"] == 2
+    assert totals["session_pct"] == 67
+    assert totals["tss_planned"] == 190 and totals["tss_actual"] == 136
+    assert out["by_sport"]["Bike"]["duration_pct"] == 67  # 2h done of 3h planned
+    assert out["by_sport"]["Bike"]["distance_pct"] == 100
+    assert out["by_sport"]["Swim"]["tss_pct"] is None  # nothing planned
+    assert [w["week_start"] for w in out["weeks"]] == ["2026-03-02", "2026-03-09"]
+    assert out["weeks"][1]["tss_pct"] == 50
+    assert len(out["days"]) == 4
+    inst.get.assert_awaited_once_with("/fitness/v6/athletes/123/workouts/2026-03-02/2026-03-15")
+
+
+@pytest.mark.asyncio
+async def test_get_compliance_chunks_past_90_days():
+    inst = _client(*(APIResponse(success=True, data=[]) for _ in range(3)))
+    with patch("tp_mcp.tools.compliance.TPClient") as mc:
+        mc.return_value.__aenter__.return_value = inst
+        out = await tp_get_compliance("2026-01-01", "2026-07-01")
+    assert out["workout_count"] == 0
+    endpoints = [c.args[0] for c in inst.get.call_args_list]
+    assert endpoints == [
+        "/fitness/v6/athletes/123/workouts/2026-01-01/2026-03-31",
+        "/fitness/v6/athletes/123/workouts/2026-04-01/2026-06-29",
+        "/fitness/v6/athletes/123/workouts/2026-06-30/2026-07-01",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_compliance_api_error():
+    inst = _client(APIResponse(success=False, error_code=ErrorCode.NOT_FOUND, message="nope"))
+    with patch("tp_mcp.tools.compliance.TPClient") as mc:
+        mc.return_value.__aenter__.return_value = inst
+        out = await tp_get_compliance("2026-03-01", "2026-03-02")
+    assert out["isError"] is True and out["error_code"] == "NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_get_compliance_validation():
+    assert (await tp_get_compliance("2026-03-02", "2026-03-01"))["error_code"] == "VALIDATION_ERROR"
+    assert (await tp_get_compliance("2025-01-01", "2026-06-01"))["error_code"] == "VALIDATION_ERROR"
+    assert (await tp_get_compliance("bad", "2026-06-01"))["error_code"] == "VALIDATION_ERROR"
@@ -0,0 +1,172 @@
+"""Tests for the coach group dashboard."""
+
+import asyncio
+import time
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tp_mcp.client.context import call_deadline
+from tp_mcp.client.http import APIResponse, ErrorCode
+from tp_mcp.client.roster import RosterIndex
+from tp_mcp.tools.dashboard import tp_get_group_dashboard
+from tp_mcp.tools.fitness import tp_get_fitness
+
+USER = {
+    "personId": 1,
+    "athletes": [
+        {"athleteId": 201, "firstName": "Zoe", "lastName": "Horton"},
+        {"athleteId": 202, "firstName": "Ivan", "lastName": "Petrov"},
+    ],
+}
+TAGS = [{"id": 11, "name": "Squad", "athleteIds": [201, 202]}]
+TODAY = date.today()
+
+
+def _day(offset: int) -> str:
+    return f"{(TODAY - timedelta(days=offset)).isoformat()}T00:00:00"
+
+
+PMC = [
+    {"workoutDay": _day(10), "tssActual": 500, "ctl": 40.0, "atl": 50.0, "tsb": -5.0},
+    {"workoutDay": _day(3), "tssActual": 80, "ctl": 41.0, "atl": 52.0, "tsb": -9.0},
+    {"workoutDay": _day(0), "tssActual": 60, "ctl": 42.04, "atl": 55.0, "tsb": -11.0},
+]
+WORKOUTS = [
+    {"workoutId": 1, "workoutDay": _day(2), "tssPlanned": 50, "totalTime": 1.0, "tssActual": 55},
+    {"workoutId": 2, "workoutDay": _day(1), "tssPlanned": 60},
+    {"workoutId": 3, "workoutDay": _day(1), "totalTime": 0.5},  # unplanned, not counted
+    {"workoutId": 4, "workoutDay": _day(0), "distancePlanned": 10000},  # distance-only plan counts
+]
+
+
+def _client(post, get_workouts):
+    inst = AsyncMock()
+    inst._get_user_data = AsyncMock(return_value=USER)  # coach id for the group read
+    inst.roster = AsyncMock(return_value=RosterIndex(USER["athletes"]))
+
+    async def get(endpoint, params=None):
+        if endpoint.startswith("/coaches/"):
+            return APIResponse(success=True, data=TAGS)
+        return get_workouts(endpoint)
+
+    inst.get = AsyncMock(side_effect=get)
+    inst.post = AsyncMock(side_effect=post)
+    return inst
+
+
+@pytest.mark.asyncio
+async def test_dashboard_rows_per_athlete():
+    inst = _client(
+        post=lambda ep, json=None: APIResponse(success=True, data=PMC),
+        get_workouts=lambda ep: APIResponse(success=True, data=WORKOUTS),
+    )
+    with patch("tp_mcp.tools.dashboard.TPClient") as mc:
+        mc.return_value.__aenter__.return_value = inst
+        out = await tp_get_group_dashboard("11", days=7)
+
+    assert out["count"] == 2 and out["errors"] == []
+    assert [r["name"] for r in out["athletes"]] == ["Ivan Petrov", "Zoe Horton"]
+    row = out["athletes"][0]
+    assert row["tss_7d"] == 140  # day -10 falls outside the 7-day window
+    assert row["planned"] == 3 and row["completed"] == 1 and row["compliance_pct"] == 33
+    # one PMC read and one workouts read per athlete, plus the tags read
+    assert inst.post.await_count == 2
+    assert inst.get.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_dashboard_fitness_matches_tp_get_fitness():
+    inst = _client(
+        post=lambda ep, json=None: APIResponse(success=True, data=PMC),
+        get_workouts=lambda ep: APIResponse(success=True, data=WORKOUTS),
+    )
+    inst.ensure_athlete_id = AsyncMock(return_value=202)
+    with patch("tp_mcp.tools.dashboard.TPClient") as mc, patch("tp_mcp.tools.fitness.TPClient") as fc:
+        mc.return_value.__aenter__.return_value = inst
+        fc.return_value.__aenter__.return_value = inst
+        out = await tp_get_group_dashboard("11")
+        fitness = await tp_get_fitness()
+
+    row = next(r for r in out["athletes"] if r["athlete_id"] == 202)
+    current = fitness["current"]
+    assert (row["ctl"], row["atl"], row["tsb"]) == (current["ctl"], current["atl"], current["tsb"])
+    assert row["ctl"] > 0
+
+
+@pytest.mark.asyncio
+async def test_dashboard_partial_failure():
+    def post(ep, json=None):
+        if "/athletes/202/" in ep:
+            return APIResponse(success=False, error_code=ErrorCode.API_ERROR, message="boom")
+        return APIResponse(success=True, data=PMC)
+
+    inst = _client(post=post, get_workouts=lambda ep: APIResponse(success=True, data=[]))
+    with patch("tp_mcp.tools.dashboard.TPClient") as mc:
+        mc.return_value.__aenter__.return_value = inst
+        out = await tp_get_group_dashboard("11")
+
+    assert "isError" not in out
+    assert [r["athlete_id"] for r in out["athletes"]] == [201]
+    assert out["athletes"][0]["compliance_pct"] is None
+    assert out["errors"] == [{"athlete_id": 202, "name": "Ivan Petrov", "error_code": "API_ERROR", "message": "boom"}]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_all_failed_is_error():
+    inst = _client(
+        post=lambda ep, json=None: APIResponse(success=False, error_code=ErrorCode.API_ERROR, message="x"),
+        get_workouts=lambda ep: APIResponse(success=True, data=[]),
+    )
+    with patch("tp_mcp.tools.dashboard.TPClient") as mc:
+        mc.return_value.__aenter__.return_value = inst
+        out = await tp_get_group_dashboard("11")
+    assert out["isError"] is True and len(out["errors"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_dashboard_unknown_group():
+    inst = _client(post=None, get_workouts=None)
+    with patch("tp_mcp.tools.dashboard.TPClient") as mc:
+        mc.return_value.__aenter__.return_value = inst
+        out = await tp_get_group_dashboard("99")
+    assert out["error_code"] == "NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_days_validated():
+    out = await tp_get_group_dashboard("11", days=0)
+    assert out["error_code"] == "VALIDATION_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_deadline_returns_partial_rows():
+    async def slow_post(ep, json=None):
+        await asyncio.sleep(0.05)
+        return APIResponse(success=True, data=PMC)
+
+    user = {"athletes": [{"athleteId": 300 + i, "firstName": "A", "lastName": str(i)} for i in range(12)]}
+    inst = _client(post=None, get_workouts=lambda ep: APIResponse(success=True, data=[]))
+    inst.roster = AsyncMock(return_value=RosterIndex(user["athletes"]))
+    inst.post = AsyncMock(side_effect=slow_post)
+
+    async def get(endpoint, params=None):
+        if endpoint.startswith("/coaches/"):
+            ids = [a["athleteId"] for a in user["athletes"]]
+            return APIResponse(success=True, data=[{"id": 12, "athleteIds": ids}])
+        return APIResponse(success=True, data=[])
+
+    inst.get = AsyncMock(side_effect=get)
+    token = call_deadline.set(time.monotonic() + 0.02)
+    try:
+        with patch("tp_mcp.tools.dashboard.TPClient") as mc:
+            mc.return_value.__aenter__.return_value = inst
+            out = await tp_get_group_dashboard("12")
+    finally:
+        call_deadline.reset(token)
+
+    assert "isError" not in out
+    assert out["count"] > 0
+    assert out["errors"] and {e["error_code"] for e in out["errors"]} == {"TIMEOUT"}
+    assert out["count"] + len(out["errors"]) == 12
@@ -1,10 +1,12 @@
 """Tests for fitness tool."""
 
+from datetime import date, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from tp_mcp.client.http import APIResponse, ErrorCode
+from tp_mcp.tools._pmc import compute_pmc
 from tp_mcp.tools.fitness import tp_get_fitness
 
 
@@ -14,12 +16,15 @@ class TestTpGetFitness:
     @pytest.mark.asyncio
     async def test_get_fitness_success(self):
         """Test successful fitness data retrieval."""
+        today = date.today()
         fitness_response = APIResponse(
             success=True,
             data=[
-                {"workoutDay": "2025-01-07T00:00:00", "tssActual": 50, "ctl": 45.2, "atl": 55.1, "tsb": -9.9},
-                {"workoutDay": "2025-01-08T00:00:00", "tssActual": 80, "ctl": 46.0, "atl": 60.3, "tsb": -14.3},
-                {"workoutDay": "2025-01-09T00:00:00", "tssActual": 0, "ctl": 45.5, "atl": 52.1, "tsb": -6.6},
+                {"workoutDay": f"{today - timedelta(days=2)}T00:00:00", "tssActual": 50,
+                 "ctl": 45.2, "atl": 55.1, "tsb": -9.9},
+                {"workoutDay": f"{today - timedelta(days=1)}T00:00:00", "tssActual": 80,
+                 "ctl": 46.0, "atl": 60.3, "tsb": -14.3},
+                {"workoutDay": f"{today}T00:00:00", "tssActual": 0, "ctl": 45.5, "atl": 52.1, "tsb": -6.6},
             ],
         )
 
@@ -34,9 +39,12 @@ class TestTpGetFitness:
         assert "isError" not in result or not result.get("isError")
         assert result["days"] == 30
         assert len(result["daily_data"]) == 3
-        assert result["current"]["ctl"] == 45.5
-        assert result["current"]["atl"] == 52.1
-        assert result["current"]["tsb"] == -6.6
+        # Recomputed locally from tssActual (no TSS before these three days):
+        # the API's own ctl/atl/tsb fields are deliberately not passed through.
+        assert [d["ctl"] for d in result["daily_data"]] == [1.2, 3.1, 3.0]
+        assert result["current"]["ctl"] == 3.0
+        assert result["current"]["atl"] == 15.0
+        assert result["current"]["tsb"] == -14.5
         assert "fitness_status" in result["current"]
 
     @pytest.mark.asyncio
@@ -91,3 +99,155 @@ class TestTpGetFitness:
         assert "Tired" in _get_fitness_status(-5)
         assert "Very Tired" in _get_fitness_status(-20)
         assert "Exhausted" in _get_fitness_status(-30)
+
+
+def _pmc_entries(start: date, tss: list[float]) -> list[dict]:
+    return [
+        {"workoutDay": f"{start + timedelta(days=i)}T00:00:00", "tssActual": v}
+        for i, v in enumerate(tss)
+    ]
+
+
+class TestComputePmc:
+    """Tests for the local CTL/ATL/TSB recurrence."""
+
+    def test_recurrence(self):
+        points = compute_pmc([100, 0], date(2025, 1, 1), ctl_constant=10, atl_constant=5)
+        assert points[0].ctl == pytest.approx(10)
+        assert points[0].atl == pytest.approx(20)
+        assert points[0].tsb == 0
+        assert points[1].ctl == pytest.approx(9)
+        assert points[1].atl == pytest.approx(16)
+        assert points[1].tsb == pytest.approx(-10)  # yesterday's CTL - ATL
+        assert points[1].day == date(2025, 1, 2)
+
+    def test_seeds(self):
+        points = compute_pmc([0], date(2025, 1, 1), ctl_constant=42, atl_constant=7, ctl_start=84, atl_start=70)
+        assert points[0].tsb == pytest.approx(14)
+        assert points[0].ctl == pytest.approx(82)
+        assert points[0].atl == pytest.approx(60)
+
+
+class TestFitnessCache:
+    """Tests for the per-athlete TSS cache behind tp_get_fitness."""
+
+    def _client(self, mock_client, post):
+        mock_instance = AsyncMock()
+        mock_instance.ensure_athlete_id = AsyncMock(return_value=123)
+        mock_instance.post = post
+        mock_client.return_value.__aenter__.return_value = mock_instance
+        return mock_instance
+
+    @pytest.mark.asyncio
+    async def test_repeat_and_new_constants_hit_cache(self):
+        start = date(2024, 3, 1)
+        post = AsyncMock(return_value=APIResponse(success=True, data=_pmc_entries(start, [60] * 30)))
+
+        with patch("tp_mcp.tools.fitness.TPClient") as mock_client:
+            self._client(mock_client, post)
+            first = await tp_get_fitness(start_date="2024-03-01", end_date="2024-03-30")
+            second = await tp_get_fitness(start_date="2024-03-01", end_date="2024-03-30", ctl_constant=28)
+            third = await tp_get_fitness(
+                start_date="2024-03-10", end_date="2024-03-20", ctl_start=50, atl_start=40,
+            )
+
+        assert post.await_count == 1
+        assert second["current"]["ctl"] > first["current"]["ctl"]
+        assert len(third["daily_data"]) == 11
+        assert third["daily_data"][0]["tsb"] == 10
+
+    @pytest.mark.asyncio
+    async def test_only_uncached_days_are_fetched(self):
+        async def post(endpoint, json=None):
+            a, b = (date.fromisoformat(p) for p in endpoint.split("/")[-2:])
+            return APIResponse(success=True, data=_pmc_entries(a, [40] * ((b - a).days + 1)))
+
+        mock_post = AsyncMock(side_effect=post)
+        with patch("tp_mcp.tools.fitness.TPClient") as mock_client:
+            self._client(mock_client, mock_post)
+            await tp_get_fitness(start_date="2024-03-10", end_date="2024-03-20", seed_from_history=False)
+            result = await tp_get_fitness(start_date="2024-03-01", end_date="2024-03-31", seed_from_history=False)
+
+        endpoints = [c.args[0] for c in mock_post.await_args_list]
+        assert endpoints[1:] == [
+            "/fitness/v1/athletes/123/reporting/performancedata/2024-03-01/2024-03-09",
+            "/fitness/v1/athletes/123/reporting/performancedata/2024-03-21/2024-03-31",
+        ]
+        assert len(result["daily_data"]) == 31
+
+    @pytest.mark.asyncio
+    async def test_long_range_fetched_in_year_windows(self):
+        async def post(endpoint, json=None):
+            return APIResponse(success=True, data=[])
+
+        mock_post = AsyncMock(side_effect=post)
+        with patch("tp_mcp.tools.fitness.TPClient") as mock_client:
+            self._client(mock_client, mock_post)
+            result = await tp_get_fitness(start_date="2021-01-01", end_date="2023-12-31", seed_from_history=False)
+
+        assert mock_post.await_count == 3
+        assert result["current"] is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_is_reported(self):
+        post = AsyncMock(return_value=APIResponse(
+            success=False, error_code=ErrorCode.API_ERROR, message="boom",
+        ))
+        with patch("tp_mcp.tools.fitness.TPClient") as mock_client:
+            self._client(mock_client, post)
+            result = await tp_get_fitness(start_date="2024-03-01", end_date="2024-03-05")
+
+        assert result["isError"] is True
+        assert result["message"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_invalid_constant(self):
+        result = await tp_get_fitness(ctl_constant=0)
+        assert result["error_code"] == "VALIDATION_ERROR"
+
+
+class TestMultiYearFitness:
+    """Tests for multi-year ranges and history seeding."""
+
+    @staticmethod
+    async def _post(endpoint, json=None):
+        a, b = (date.fromisoformat(p) for p in endpoint.split("/")[-2:])
+        return APIResponse(success=True, data=_pmc_entries(a, [50] * ((b - a).days + 1)))
+
+    @pytest.mark.asyncio
+    async def test_years_is_one_continuous_series(self):
+        post = AsyncMock(side_effect=self._post)
+        with patch("tp_mcp.tools.fitness.TPClient") as mock_client:
+            TestFitnessCache()._client(mock_client, post)
+            result = await tp_get_fitness(years=3)
+
+        assert post.await_count == 4  # 1097 days in concurrent 365-day windows
+        ctl = [d["ctl"] for d in result["daily_data"]]
+        # Constant load: CTL climbs monotonically towards 50 with no restart at window edges.
+        assert all(b >= a for a, b in zip(ctl, ctl[1:], strict=False))
+        assert result["current"]["ctl"] == 50.0
+        assert result["days"] == len(ctl) - 1
+
+    @pytest.mark.asyncio
+    async def test_seed_from_history(self):
+        post = AsyncMock(side_effect=self._post)
+        with patch("tp_mcp.tools.fitness.TPClient") as mock_client:
+            TestFitnessCache()._client(mock_client, post)
+            cold = await tp_get_fitness(start_date="2024-06-01", end_date="2024-06-30", seed_from_history=False)
+            seeded = await tp_get_fitness(start_date="2024-06-01", end_date="2024-06-30", seed_from_history=True)
+            default = await tp_get_fitness(start_date="2024-06-01", end_date="2024-06-30")
+            explicit = await tp_get_fitness(start_date="2024-06-01", end_date="2024-06-30", ctl_start=10)
+
+        assert default == seeded
+        assert explicit["daily_data"][0]["tsb"] == 10  # an explicit seed turns history seeding off
+        assert len(seeded["daily_data"]) == 30
+        assert seeded["daily_data"][0]["date"] == "2024-06-01"
+        assert cold["daily_data"][0]["ctl"] == 1.2
+        assert seeded["daily_data"][0]["ctl"] > 40
+
+    @pytest.mark.asyncio
+    async def test_range_cap(self):
+        result = await tp_get_fitness(start_date="2000-01-01", end_date="2025-01-01")
+        assert result["error_code"] == "VALIDATION_ERROR"
+        result = await tp_get_fitness(years=21)
+        assert result["error_code"] == "VALIDATION_ERROR"
@@ -1,5 +1,6 @@
 """Tests for workout library tools."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -382,7 +383,11 @@ class TestScheduleLibraryWorkoutBulk:
     def _mock(self, mock_client, athlete_ids, post_responses):
         items_response = APIResponse(success=True, data=[self.TEMPLATE])
         mock_instance = AsyncMock()
-        mock_instance.ensure_athlete_id = AsyncMock(side_effect=athlete_ids)
+        mock_instance.resolve_athletes = AsyncMock(return_value=[
+            (None, str(a)) if isinstance(a, Exception)
+            else (a, None) if a else (None, "Could not resolve athlete in your roster.")
+            for a in athlete_ids
+        ])
         mock_instance.get = AsyncMock(return_value=items_response)
         mock_instance.post = AsyncMock(side_effect=post_responses)
         mock_client.return_value.__aenter__.return_value = mock_instance
@@ -418,6 +423,31 @@ class TestScheduleLibraryWorkoutBulk:
         assert [p["athleteId"] for p in payloads] == [111, 222]
         assert all(p["title"] == "Sweet Spot" for p in payloads)
 
+    @pytest.mark.asyncio
+    async def test_bulk_resolves_roster_once_and_posts_concurrently(self):
+        in_flight = peak = 0
+
+        async def slow_post(endpoint, json=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return APIResponse(success=True, data={"workoutId": json["athleteId"]})
+
+        with patch("tp_mcp.tools.library.TPClient") as mock_client:
+            mock_instance = self._mock(mock_client, athlete_ids=list(range(1, 9)), post_responses=None)
+            mock_instance.post = AsyncMock(side_effect=slow_post)
+
+            result = await tp_schedule_library_workout(
+                "1", "10", "2026-04-01", athletes=[str(i) for i in range(1, 9)],
+            )
+
+        assert len(result["scheduled"]) == 8
+        mock_instance.resolve_athletes.assert_awaited_once()
+        mock_instance.ensure_athlete_id.assert_not_called()
+        assert 1 < peak <= 4
+
     @pytest.mark.asyncio
     async def test_bulk_partial_failure_is_not_error(self):
         """One athlete failing is reported in errors, without isError."""
@@ -443,8 +473,8 @@ class TestScheduleLibraryWorkoutBulk:
 
     @pytest.mark.asyncio
     async def test_bulk_unresolvable_athlete_reported(self):
-        """An athlete not in the roster (ensure_athlete_id -> None) is a
-        per-athlete error; the rest still get scheduled."""
+        """An athlete not in the roster is a per-athlete error; the rest
+        still get scheduled."""
         with patch("tp_mcp.tools.library.TPClient") as mock_client:
             mock_instance = self._mock(
                 mock_client,
@@ -465,8 +495,8 @@ class TestScheduleLibraryWorkoutBulk:
 
     @pytest.mark.asyncio
     async def test_bulk_ambiguous_name_reported(self):
-        """ensure_athlete_id raising ValueError (ambiguous name) becomes a
-        per-athlete error rather than blowing up the whole call."""
+        """An ambiguous name becomes a per-athlete error rather than blowing
+        up the whole call."""
         with patch("tp_mcp.tools.library.TPClient") as mock_client:
             self._mock(
                 mock_client,
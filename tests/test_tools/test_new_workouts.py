@@ -8,11 +8,15 @@ import pytest
 from tp_mcp.client.http import APIResponse, ErrorCode
 from tp_mcp.tools.workouts import (
     tp_add_workout_comment,
+    tp_bulk_create_workouts,
+    tp_bulk_delete_workouts,
+    tp_bulk_update_workouts,
     tp_copy_workout,
     tp_create_workout,
     tp_delete_workout,
     tp_get_workout_comments,
     tp_get_workout_note,
+    tp_reorder_workouts,
     tp_set_workout_note,
     tp_update_workout,
 )
@@ -728,6 +732,116 @@ class TestDeleteWorkout:
         assert result["error_code"] == "VALIDATION_ERROR"
 
 
+class TestReorderWorkouts:
+    """Tests for tp_reorder_workouts (single range read + bounded PUTs)."""
+
+    _DAY = [
+        {"workoutId": 1001, "workoutDay": "2026-04-01T00:00:00", "title": "A", "orderOnDay": 0},
+        {"workoutId": 1002, "workoutDay": "2026-04-01T00:00:00", "title": "B", "orderOnDay": 1},
+        {"workoutId": 1003, "workoutDay": "2026-04-01T00:00:00", "title": "C", "orderOnDay": 2},
+    ]
+
+    def _get_router(self, endpoint, **kwargs):
+        if endpoint.endswith("/workouts/2026-04-01/2026-04-01"):
+            return APIResponse(success=True, data=[dict(w) for w in self._DAY])
+        wid = int(endpoint.rsplit("/", 1)[1])
+        match = next((w for w in self._DAY if w["workoutId"] == wid), None)
+        if match is None:
+            return APIResponse(success=False, error_code=ErrorCode.NOT_FOUND, message="Resource not found.")
+        return APIResponse(success=True, data=dict(match))
+
+    @pytest.mark.asyncio
+    async def test_reorder_with_date_uses_one_range_read(self):
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.ensure_athlete_id = AsyncMock(return_value=123)
+            mock_instance.get = AsyncMock(side_effect=self._get_router)
+            mock_instance.put = AsyncMock(return_value=APIResponse(success=True, data=None))
+            mock_client.return_value.__aenter__.return_value = mock_instance
+
+            result = await tp_reorder_workouts([1003, 1001, 1002], date="2026-04-01")
+
+        assert result["success"] is True
+        assert result["errors"] == []
+        assert mock_instance.get.call_count == 1
+        orders = {c.args[0].rsplit("/", 1)[1]: c.kwargs["json"]["orderOnDay"]
+                  for c in mock_instance.put.call_args_list}
+        assert orders == {"1003": 0, "1001": 1, "1002": 2}
+        # The full listed object is written back, not just the order field.
+        assert all("title" in c.kwargs["json"] for c in mock_instance.put.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_reorder_without_date_reads_day_from_first_workout(self):
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.ensure_athlete_id = AsyncMock(return_value=123)
+            mock_instance.get = AsyncMock(side_effect=self._get_router)
+            mock_instance.put = AsyncMock(return_value=APIResponse(success=True, data=None))
+            mock_client.return_value.__aenter__.return_value = mock_instance
+
+            result = await tp_reorder_workouts([1002, 1001])
+
+        assert result["success"] is True
+        assert result["date"] == "2026-04-01"
+        # One single read for the day, one range read - not one GET per id.
+        assert mock_instance.get.call_count == 2
+        assert mock_instance.put.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reorder_reports_per_item_failures(self):
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.ensure_athlete_id = AsyncMock(return_value=123)
+            mock_instance.get = AsyncMock(side_effect=self._get_router)
+            mock_instance.put = AsyncMock(return_value=APIResponse(success=True, data=None))
+            mock_client.return_value.__aenter__.return_value = mock_instance
+
+            result = await tp_reorder_workouts([1001, 9999], date="2026-04-01")
+
+        assert result["success"] is False
+        assert "isError" not in result  # partial success is not a total failure
+        assert [r["workout_id"] for r in result["reordered"]] == [1001]
+        assert result["errors"][0]["workout_id"] == 9999
+        assert result["errors"][0]["error_code"] == "NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_reorder_retries_rate_limited_put(self, monkeypatch):
+        import tp_mcp.tools._bulk as bulk
+
+        monkeypatch.setattr(bulk, "RETRY_BASE_DELAY", 0)
+        limited = APIResponse(success=False, error_code=ErrorCode.RATE_LIMITED, message="Rate limited.")
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.ensure_athlete_id = AsyncMock(return_value=123)
+            mock_instance.get = AsyncMock(side_effect=self._get_router)
+            mock_instance.put = AsyncMock(side_effect=[limited, APIResponse(success=True, data=None)])
+            mock_client.return_value.__aenter__.return_value = mock_instance
+
+            result = await tp_reorder_workouts([1001], date="2026-04-01")
+
+        assert result["success"] is True
+        assert mock_instance.put.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reorder_all_failed_is_error(self):
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.ensure_athlete_id = AsyncMock(return_value=123)
+            mock_instance.get = AsyncMock(side_effect=self._get_router)
+            mock_client.return_value.__aenter__.return_value = mock_instance
+
+            result = await tp_reorder_workouts([9998, 9999], date="2026-04-01")
+
+        assert result["isError"] is True
+        assert len(result["errors"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_reorder_validation(self):
+        assert (await tp_reorder_workouts([]))["error_code"] == "VALIDATION_ERROR"
+        assert (await tp_reorder_workouts(["abc"]))["error_code"] == "VALIDATION_ERROR"
+        assert (await tp_reorder_workouts([1001], date="01/04/2026"))["error_code"] == "VALIDATION_ERROR"
+
+
 class TestCopyWorkout:
     """Tests for tp_copy_workout."""
 
@@ -1155,3 +1269,196 @@ class TestWorkoutNote:
         result = await tp_set_workout_note("abc", "note")
         assert result["isError"] is True
         assert result["error_code"] == "VALIDATION_ERROR"
+
+
+def _bulk_client(mock_client, **methods):
+    mock_instance = AsyncMock()
+    mock_instance.ensure_athlete_id = AsyncMock(return_value=123)
+    for name, mock in methods.items():
+        setattr(mock_instance, name, mock)
+    mock_client.return_value.__aenter__.return_value = mock_instance
+    return mock_instance
+
+
+class TestBulkWorkouts:
+    """Tests for tp_bulk_create/update/delete_workouts."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_creates_all_in_order(self):
+        counter = iter(range(500, 600))
+
+        async def post(endpoint, json=None):
+            return APIResponse(success=True, data={"workoutId": next(counter), **json})
+
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            mock_instance = _bulk_client(mock_client, post=AsyncMock(side_effect=post))
+            result = await tp_bulk_create_workouts([
+                {"date": "2026-05-01", "sport": "Bike", "title": "Endurance", "duration_minutes": 90},
+                {"date": "2026-05-02", "sport": "Run", "title": "Easy run", "duration_minutes": 45},
+            ])
+
+        assert result["success"] is True
+        assert [c["title"] for c in result["created"]] == ["Endurance", "Easy run"]
+        assert all(c["workout_id"] for c in result["created"])
+        assert result["failed"] == []
+        payloads = [c.kwargs["json"] for c in mock_instance.post.call_args_list]
+        assert all(p["athleteId"] == 123 for p in payloads)
+        assert [p["totalTimePlanned"] for p in payloads] == [1.5, 0.75]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_invalid_item_rejects_batch(self):
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            mock_instance = _bulk_client(mock_client, post=AsyncMock())
+            result = await tp_bulk_create_workouts([
+                {"date": "2026-05-01", "sport": "Bike", "title": "OK", "duration_minutes": 60},
+                {"date": "not-a-date", "sport": "Bike", "title": "Bad", "duration_minutes": 60},
+                {"date": "2026-05-03", "sport": "Bike", "title": "Typo", "duraton_minutes": 60},
+            ])
+
+        assert result["isError"] is True
+        assert result["error_code"] == "VALIDATION_ERROR"
+        assert [f["index"] for f in result["failed"]] == [1, 2]
+        assert "duraton_minutes" in result["failed"][1]["message"]
+        mock_instance.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_dry_run_writes_nothing(self):
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            result = await tp_bulk_create_workouts(
+                [{"date": "2026-05-01", "sport": "Swim", "title": "Drills", "duration_minutes": 45, "tss_planned": 40}],
+                dry_run=True,
+            )
+            mock_client.assert_not_called()
+
+        assert result["dry_run"] is True
+        assert result["would_create"][0]["tss_planned"] == 40
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_reports_per_item_api_failures(self):
+        async def post(endpoint, json=None):
+            if json["title"] == "Bad":
+                return APIResponse(success=False, error_code=ErrorCode.API_ERROR, message="boom")
+            return APIResponse(success=True, data={"workoutId": 1})
+
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            _bulk_client(mock_client, post=AsyncMock(side_effect=post))
+            result = await tp_bulk_create_workouts([
+                {"date": "2026-05-01", "sport": "Bike", "title": "Good", "duration_minutes": 60},
+                {"date": "2026-05-02", "sport": "Bike", "title": "Bad", "duration_minutes": 60},
+            ])
+
+        assert result["success"] is False
+        assert "isError" not in result
+        assert len(result["created"]) == 1
+        assert result["failed"] == [{
+            "index": 1, "title": "Bad", "date": "2026-05-02",
+            "error_code": "API_ERROR", "message": "boom",
+        }]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_reports_partial_result_at_deadline(self, monkeypatch):
+        """Past the call's time limit the creates already made are still returned,
+        with the rest listed as not started - end to end through the dispatcher."""
+        import asyncio
+
+        from tp_mcp.server import call_tool
+
+        counter = iter(range(500, 600))
+
+        async def post(endpoint, json=None):
+            await asyncio.sleep(0.1)
+            return APIResponse(success=True, data={"workoutId": next(counter)})
+
+        monkeypatch.setenv("TP_MCP_TOOL_TIMEOUT", "0.25")
+        items = [{"date": "2026-05-01", "sport": "Bike", "title": f"W{i}", "duration_minutes": 30} for i in range(20)]
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            mock_instance = _bulk_client(mock_client, post=AsyncMock(side_effect=post))
+            result = json.loads((await call_tool("tp_bulk_create_workouts", {"workouts": items}))[0].text)
+
+        assert result.get("error_code") != "TIMEOUT"
+        created_ids = [c["workout_id"] for c in result["created"]]
+        assert len(created_ids) == mock_instance.post.await_count
+        assert 0 < len(created_ids) < 20
+        assert len(result["created"]) + len(result["failed"]) == 20
+        assert {f["error_code"] for f in result["failed"]} == {"TIMEOUT"}
+        assert "safe to retry" in result["message"]
+        assert {f["title"] for f in result["failed"]}.isdisjoint(c["title"] for c in result["created"])
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_rejects_oversized_batch(self):
+        items = [{"date": "2026-05-01", "sport": "Bike", "title": f"W{i}", "duration_minutes": 30} for i in range(101)]
+        result = await tp_bulk_create_workouts(items)
+        assert result["isError"] is True
+        assert "maximum" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_merges_each_workout(self):
+        async def get(endpoint, params=None):
+            wid = int(endpoint.rsplit("/", 1)[1])
+            return APIResponse(success=True, data={"workoutId": wid, "title": "Old", "tssPlanned": 10})
+
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            mock_instance = _bulk_client(
+                mock_client,
+                get=AsyncMock(side_effect=get),
+                put=AsyncMock(return_value=APIResponse(success=True, data=None)),
+            )
+            result = await tp_bulk_update_workouts([
+                {"workout_id": "11", "title": "New"},
+                {"workout_id": "12", "tss_planned": 80},
+            ])
+
+        assert result["success"] is True
+        assert [u["workout_id"] for u in result["updated"]] == [11, 12]
+        bodies = {c.args[0].rsplit("/", 1)[1]: c.kwargs["json"] for c in mock_instance.put.call_args_list}
+        assert bodies["11"]["title"] == "New"
+        assert bodies["11"]["tssPlanned"] == 10
+        assert bodies["12"]["tssPlanned"] == 80
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_rejects_duplicate_ids(self):
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            result = await tp_bulk_update_workouts([
+                {"workout_id": "11", "title": "A"},
+                {"workout_id": 11, "tss_planned": 50},
+            ])
+            mock_client.assert_not_called()
+
+        assert result["error_code"] == "VALIDATION_ERROR"
+        assert result["failed"][0]["index"] == 1
+        assert "Duplicate" in result["failed"][0]["message"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_dry_run_lists_fields(self):
+        result = await tp_bulk_update_workouts(
+            [{"workout_id": "11", "title": "A", "description": "x"}], dry_run=True,
+        )
+        assert result["would_update"] == [{"index": 0, "workout_id": 11, "fields": ["description", "title"]}]
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_all_failed_is_error(self):
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            _bulk_client(mock_client, delete=AsyncMock(return_value=APIResponse(
+                success=False, error_code=ErrorCode.NOT_FOUND, message="Resource not found.",
+            )))
+            result = await tp_bulk_delete_workouts(["1", "2"])
+
+        assert result["isError"] is True
+        assert result["deleted"] == []
+        assert [f["workout_id"] for f in result["failed"]] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_rejects_duplicate_ids(self):
+        with patch("tp_mcp.tools.workouts.TPClient") as mock_client:
+            result = await tp_bulk_delete_workouts(["7", 7, "8"])
+            mock_client.assert_not_called()
+
+        assert result["error_code"] == "VALIDATION_ERROR"
+        assert result["failed"][0]["index"] == 1
+        assert "Duplicate" in result["failed"][0]["message"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_invalid_id(self):
+        result = await tp_bulk_delete_workouts(["abc"])
+        assert result["error_code"] == "VALIDATION_ERROR"
+        assert result["failed"][0]["workout_id"] == "abc"
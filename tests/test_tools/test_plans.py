@@ -136,3 +136,242 @@ async def test_apply_copies_workouts_skips_period_markers():
 async def test_invalid_plan_id_validation():
     r = await tp_get_training_plan(0)
     assert r["isError"] is True and r["error_code"] == "VALIDATION_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_apply_rerun_skips_journaled_workouts(isolated_plan_journal):
+    """A failed create leaves a gap; the rerun creates only that gap and the
+    journaled workout (still on the calendar) is not duplicated."""
+    ids = iter(range(500, 600))
+
+    async def flaky_post(ep, json=None):
+        if json["title"] == "Run":
+            return APIResponse(success=False, message="boom")
+        return APIResponse(success=True, data={"workoutId": next(ids)})
+
+    inst = _client_with(_get_router, post_side_effect=flaky_post)
+    p = _patch(inst)
+    try:
+        first = await tp_apply_training_plan(163992, "2027-09-01")
+    finally:
+        p.stop()
+    assert first["created"] == 1 and first["failed"] == 1 and first["success"] is False
+    assert first["first_error"] == "boom"
+    assert isolated_plan_journal.exists()
+
+    def calendar_router(ep, **k):
+        if ep.startswith("/fitness/v6/athletes/123/workouts/"):
+            return APIResponse(success=True, data=[{"workoutId": 500}])
+        return _get_router(ep, **k)
+
+    inst = _client_with(calendar_router, post=APIResponse(success=True, data={"workoutId": 777}))
+    p = _patch(inst)
+    try:
+        second = await tp_apply_training_plan(163992, "2027-09-01")
+    finally:
+        p.stop()
+    assert second["success"] is True
+    assert second["created"] == 1 and second["already_applied"] == 1
+    titles = [c.kwargs["json"]["title"] for c in inst.post.call_args_list]
+    assert titles == ["Run"]
+
+
+@pytest.mark.asyncio
+async def test_apply_recreates_journaled_workout_deleted_from_calendar():
+    inst = _client_with(_get_router, post=APIResponse(success=True, data={"workoutId": 500}))
+    p = _patch(inst)
+    try:
+        await tp_apply_training_plan(163992, "2027-09-01")
+    finally:
+        p.stop()
+
+    def empty_calendar(ep, **k):
+        if ep.startswith("/fitness/v6/athletes/123/workouts/"):
+            return APIResponse(success=True, data=[])
+        return _get_router(ep, **k)
+
+    inst = _client_with(empty_calendar, post=APIResponse(success=True, data={"workoutId": 600}))
+    p = _patch(inst)
+    try:
+        r = await tp_apply_training_plan(163992, "2027-09-01")
+    finally:
+        p.stop()
+    assert r["created"] == 2 and r["already_applied"] == 0
+
+
+@pytest.mark.asyncio
+async def test_apply_reports_progress():
+    from tp_mcp.client.context import progress_reporter
+
+    updates = []
+
+    async def reporter(progress, total, message):
+        updates.append((progress, total))
+
+    inst = _client_with(_get_router)
+    p = _patch(inst)
+    token = progress_reporter.set(reporter)
+    try:
+        await tp_apply_training_plan(163992, "2027-09-01")
+    finally:
+        progress_reporter.reset(token)
+        p.stop()
+    assert updates[0] == (0, 2)
+    assert updates[-1] == (2, 2)
+
+
+def _multi_router(ep, **k):
+    if ep.startswith("/coaches/v2/coaches/"):
+        return APIResponse(success=True, data=[{"id": 7, "name": "Squad", "athleteIds": [201, 202]}])
+    return _get_router(ep, **k)
+
+
+@pytest.mark.asyncio
+async def test_apply_to_many_fetches_plan_once():
+    inst = _client_with(_multi_router)
+    inst.resolve_athletes = AsyncMock(return_value=[(201, None), (None, "Could not resolve athlete 'Zed'.")])
+    p = _patch(inst)
+    try:
+        r = await tp_apply_training_plan(163992, "2027-09-01", athletes=["Ann", "Zed"])
+    finally:
+        p.stop()
+    assert "isError" not in r
+    assert r["applied"] == [{"athlete": "Ann", "athlete_id": 201, "created": 2, "already_applied": 0, "failed": 0}]
+    assert r["errors"] == [{"athlete": "Zed", "message": "Could not resolve athlete 'Zed'."}]
+    plan_reads = [c.args[0] for c in inst.get.call_args_list if c.args[0].startswith("/plans/")]
+    assert len(plan_reads) == 2  # detail + workouts, once for the whole call
+    inst.resolve_athletes.assert_awaited_once_with(["Ann", "Zed"])
+    assert {c.kwargs["json"]["athleteId"] for c in inst.post.call_args_list} == {201}
+
+
+@pytest.mark.asyncio
+async def test_apply_to_group_resolves_members():
+    inst = _client_with(_multi_router)
+    inst._get_user_data = AsyncMock(return_value={"personId": 1})
+    inst.resolve_athletes = AsyncMock(return_value=[(201, None), (202, None)])
+    p = _patch(inst)
+    try:
+        r = await tp_apply_training_plan(163992, "2027-09-01", group_id="7")
+    finally:
+        p.stop()
+    inst.resolve_athletes.assert_awaited_once_with(["201", "202"])
+    assert [a["athlete_id"] for a in r["applied"]] == [201, 202]
+    assert inst.post.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_apply_to_many_rerun_calendar_reads_share_the_cap(isolated_plan_journal):
+    """A group rerun re-reads every athlete's calendar; those GETs count against
+    the same cap as the creates instead of bursting one per athlete."""
+    import asyncio
+
+    from tp_mcp.tools._bulk import DEFAULT_CONCURRENCY
+
+    athlete_ids = list(range(201, 211))
+    inst = _client_with(_multi_router, post=APIResponse(success=True, data={"workoutId": 500}))
+    inst.resolve_athletes = AsyncMock(return_value=[(a, None) for a in athlete_ids])
+    p = _patch(inst)
+    try:
+        await tp_apply_training_plan(163992, "2027-09-01", athletes=[str(a) for a in athlete_ids])
+    finally:
+        p.stop()
+
+    in_flight = peak = 0
+
+    async def calendar_router(ep, **k):
+        nonlocal in_flight, peak
+        if "/workouts/" in ep and ep.startswith("/fitness/v6/athletes/"):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return APIResponse(success=True, data=[{"workoutId": 500}])
+        return _multi_router(ep, **k)
+
+    inst = _client_with(calendar_router)
+    inst.resolve_athletes = AsyncMock(return_value=[(a, None) for a in athlete_ids])
+    p = _patch(inst)
+    try:
+        r = await tp_apply_training_plan(163992, "2027-09-01", athletes=[str(a) for a in athlete_ids])
+    finally:
+        p.stop()
+    assert all(a["already_applied"] == 2 for a in r["applied"])
+    assert 1 < peak <= DEFAULT_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_apply_to_many_all_failed_is_error():
+    inst = _client_with(_multi_router, post=APIResponse(success=False, message="nope"))
+    inst.resolve_athletes = AsyncMock(return_value=[(201, None)])
+    p = _patch(inst)
+    try:
+        r = await tp_apply_training_plan(163992, "2027-09-01", athletes=["201"])
+    finally:
+        p.stop()
+    assert r["isError"] is True
+    assert r["errors"][0]["failed"] == 2 and r["errors"][0]["message"] == "nope"
+
+
+@pytest.mark.asyncio
+async def test_apply_athletes_and_group_are_exclusive():
+    r = await tp_apply_training_plan(163992, "2027-09-01", athletes=["a"], group_id="7")
+    assert r["error_code"] == "VALIDATION_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_journal_records_are_durable_and_coalesced(isolated_plan_journal, monkeypatch):
+    import asyncio
+    import json
+    import threading
+
+    from tp_mcp.tools import _journal
+
+    writes = []
+    release = threading.Event()
+    real_write = _journal.PlanJournal._write
+
+    def slow_write(self, payload):
+        writes.append(1)
+        release.wait(5)
+        real_write(self, payload)
+
+    monkeypatch.setattr(_journal.PlanJournal, "_write", slow_write)
+
+    journal = _journal.PlanJournal(1, 123, "2027-09-01")
+    records = asyncio.gather(*(journal.record(f"{i}|Run|0", 1000 + i) for i in range(30)))
+    await asyncio.sleep(0.05)
+    release.set()
+    await records
+    # The first write was in flight while the other 29 records arrived: they share one more.
+    assert len(writes) == 2
+    await journal.flush()  # nothing unsaved: no rewrite
+    assert len(writes) == 2
+
+    runs = json.loads(isolated_plan_journal.read_text())["runs"]
+    assert len(runs["1:123:2027-09-01"]["entries"]) == 30
+
+    await journal.record("30|Run|0", 1030)  # on disk as soon as record returns
+    assert _journal.PlanJournal(1, 123, "2027-09-01").entries == journal.entries
+
+
+@pytest.mark.asyncio
+async def test_journal_prunes_stale_runs_and_reads_v1(isolated_plan_journal):
+    import json
+    import time
+
+    from tp_mcp.tools import _journal
+
+    stale = time.time() - (_journal.RUN_MAX_AGE_DAYS + 1) * 86400
+    isolated_plan_journal.write_text(json.dumps({"version": 2, "runs": {
+        "1:1:2020-01-01": {"updated": stale, "entries": {"0|Run|0": 1}},
+        "2:2:2027-01-01": {"0|Ride|0": 2},  # version-1 layout
+    }}))
+    assert _journal.PlanJournal(2, 2, "2027-01-01").entries == {"0|Ride|0": 2}
+
+    journal = _journal.PlanJournal(3, 3, "2027-09-01")
+    await journal.record("0|Swim|0", 3)
+    await journal.flush()
+
+    runs = json.loads(isolated_plan_journal.read_text())["runs"]
+    assert set(runs) == {"2:2:2027-01-01", "3:3:2027-09-01"}
+    assert runs["2:2:2027-01-01"]["entries"] == {"0|Ride|0": 2}
@@ -0,0 +1,89 @@
+"""Tests for the startup reference-data prefetch."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tp_mcp.client.http import REFERENCE_TTL, APIResponse
+from tp_mcp.tools._prefetch import DEFAULT_ITEMS, ITEMS, configured_items, prefetch
+
+
+class TestConfiguredItems:
+    def test_default_excludes_zone_methods(self, monkeypatch):
+        monkeypatch.delenv("TP_MCP_PREFETCH", raising=False)
+        assert configured_items() == DEFAULT_ITEMS
+        assert "zone_methods" not in DEFAULT_ITEMS
+
+    @pytest.mark.parametrize("value", ["off", "0", "none", ""])
+    def test_disabled(self, value):
+        assert configured_items(value) == ()
+
+    def test_list_and_all(self):
+        assert configured_items("equipment, Roster") == ("roster", "equipment")
+        assert configured_items("all") == ITEMS
+
+    def test_unknown_names_ignored(self, caplog):
+        assert configured_items("settings,bogus") == ("settings",)
+        assert "bogus" in caplog.text
+
+
+def _mock(mock_client, athlete_id=123, get=None):
+    instance = AsyncMock()
+    instance.ensure_athlete_id = AsyncMock(return_value=athlete_id)
+    instance.get = get or AsyncMock(return_value=APIResponse(success=True, data={}))
+    mock_client.return_value.__aenter__.return_value = instance
+    return instance
+
+
+class TestPrefetch:
+    @pytest.mark.asyncio
+    async def test_defaults_fill_reference_caches(self):
+        with patch("tp_mcp.tools._prefetch.TPClient") as mock_client:
+            instance = _mock(mock_client)
+            done = await prefetch(DEFAULT_ITEMS)
+
+        assert done == dict.fromkeys(DEFAULT_ITEMS, True)
+        instance.ensure_athlete_id.assert_awaited_once()
+        fetched = {c.args[0] for c in instance.get.await_args_list}
+        assert fetched == {
+            "/fitness/v1/athletes/123/settings", "/fitness/v6/workouttypes", "/fitness/v1/athletes/123/equipment",
+        }
+        assert all(c.kwargs == {"cache_ttl": REFERENCE_TTL} for c in instance.get.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_one_failure_does_not_stop_the_rest(self):
+        async def get(endpoint, cache_ttl=None):
+            if endpoint.endswith("/equipment"):
+                raise RuntimeError("boom")
+            return APIResponse(success=not endpoint.endswith("/settings"), data={})
+
+        with patch("tp_mcp.tools._prefetch.TPClient") as mock_client:
+            _mock(mock_client, get=AsyncMock(side_effect=get))
+            done = await prefetch(("settings", "workout_types", "equipment"))
+
+        assert done == {"settings": False, "workout_types": True, "equipment": False}
+
+    @pytest.mark.asyncio
+    async def test_no_athlete_skips(self):
+        with patch("tp_mcp.tools._prefetch.TPClient") as mock_client:
+            instance = _mock(mock_client, athlete_id=None)
+            done = await prefetch(("roster", "settings"))
+
+        assert done == {"roster": False, "settings": False}
+        instance.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_zone_methods_warm_probe_cache(self):
+        from tp_mcp.tools import zone_methods
+
+        async def post(endpoint, json=None):
+            return APIResponse(success=True, data={"zones": [{"label": "Z1"}], "lactateThreshold": 250})
+
+        with patch("tp_mcp.tools._prefetch.TPClient") as mock_client:
+            instance = _mock(mock_client)
+            instance._get_user_data = AsyncMock(return_value={"userId": 7})
+            instance.post = AsyncMock(side_effect=post)
+            done = await prefetch(("zone_methods",))
+
+        assert done == {"zone_methods": True}
+        assert set(zone_methods._probe_cache) == {(7, m) for m in zone_methods.METRICS}
@@ -0,0 +1,135 @@
+"""Tests for tp_project_fitness."""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tp_mcp.client.http import APIResponse, ErrorCode
+from tp_mcp.tools.projection import planned_load, tp_project_fitness
+
+TODAY = date.today()
+
+
+def _day(offset: int) -> str:
+    return (TODAY + timedelta(days=offset)).isoformat()
+
+
+def _mock(mock_client, *, history_tss=50, workouts=None, atp=None, focus=None):
+    async def post(endpoint, json=None):
+        a, b = (date.fromisoformat(p) for p in endpoint.split("/")[-2:])
+        return APIResponse(success=True, data=[
+            {"workoutDay": f"{a + timedelta(days=i)}T00:00:00", "tssActual": history_tss}
+            for i in range((b - a).days + 1)
+        ])
+
+    async def get(endpoint):
+        if endpoint.endswith("/focusevent"):
+            return APIResponse(success=True, data=focus)
+        if "/atp/" in endpoint:
+            return APIResponse(success=True, data=atp or [])
+        return APIResponse(success=True, data=workouts or [])
+
+    instance = AsyncMock()
+    instance.ensure_athlete_id = AsyncMock(return_value=123)
+    instance.post = AsyncMock(side_effect=post)
+    instance.get = AsyncMock(side_effect=get)
+    mock_client.return_value.__aenter__.return_value = instance
+    return instance
+
+
+class TestPlannedLoad:
+    def test_workouts_then_atp_then_rest(self):
+        start = date(2026, 3, 2)  # Monday
+        workouts = [
+            {"workoutId": 1, "workoutDay": "2026-03-02T00:00:00", "tssPlanned": 80},
+            {"workoutId": 2, "workoutDay": "2026-03-03T00:00:00", "tssPlanned": 60,
+             "tssActual": 70, "totalTime": 1.0},
+        ]
+        atp = [
+            {"week": "2026-03-02T00:00:00", "volume": 700},  # already planned: ignored
+            {"week": "2026-03-09T00:00:00", "volume": 350},
+        ]
+        load, sources = planned_load(workouts, atp, start, date(2026, 3, 22))
+
+        assert load[0] == 80
+        assert load[1] == 70  # completed: actual wins over planned
+        assert load[2] == 0
+        assert load[7:14] == [50] * 7
+        assert load[14:] == [0] * 7
+        assert sources == {"planned_days": 2, "atp_days": 7}
+
+
+class TestProjectFitness:
+    @pytest.mark.asyncio
+    async def test_scenarios_share_one_fetch(self):
+        workouts = [
+            {"workoutId": i, "workoutDay": f"{_day(i)}T00:00:00", "tssPlanned": 100}
+            for i in range(21)
+        ]
+        with patch("tp_mcp.tools.projection.TPClient") as mock_client:
+            instance = _mock(mock_client, workouts=workouts)
+            result = await tp_project_fitness(until_date=_day(20))
+
+        assert "isError" not in result
+        assert result["days"] == 21
+        assert result["seed"]["ctl"] > 40
+        by_name = {s["name"]: s for s in result["scenarios"]}
+        assert set(by_name) == {"as_planned", "taper_7d_50pct", "taper_10d_60pct", "taper_14d_70pct"}
+        # Tapering trades fitness for form.
+        assert by_name["taper_7d_50pct"]["at_target"]["tsb"] > by_name["as_planned"]["at_target"]["tsb"]
+        assert by_name["taper_7d_50pct"]["at_target"]["ctl"] < by_name["as_planned"]["at_target"]["ctl"]
+        assert by_name["as_planned"]["total_tss"] == 2100
+        assert "daily_data" not in by_name["as_planned"]
+        assert instance.post.await_count == 1  # history: one cached read
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_focus_event(self):
+        focus = {"id": 9, "name": "A Race", "eventDate": f"{_day(10)}T00:00:00"}
+        with patch("tp_mcp.tools.projection.TPClient") as mock_client:
+            _mock(mock_client, focus=focus)
+            result = await tp_project_fitness(
+                scenarios=[{"name": "rest", "taper_days": 11, "load_pct": 0}], include_daily=True,
+            )
+
+        assert result["event"] == {"id": 9, "name": "A Race", "date": _day(10)}
+        assert result["until_date"] == _day(10)
+        assert len(result["scenarios"][0]["daily_data"]) == 11
+        assert result["sources"]["rest_days"] == 11
+
+    @pytest.mark.asyncio
+    async def test_no_focus_event(self):
+        with patch("tp_mcp.tools.projection.TPClient") as mock_client:
+            _mock(mock_client, focus=None)
+            result = await tp_project_fitness()
+
+        assert result["error_code"] == "VALIDATION_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_past_date_rejected(self):
+        with patch("tp_mcp.tools.projection.TPClient") as mock_client:
+            _mock(mock_client)
+            result = await tp_project_fitness(until_date=_day(-1))
+
+        assert result["error_code"] == "VALIDATION_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_bad_scenario(self):
+        with patch("tp_mcp.tools.projection.TPClient") as mock_client:
+            _mock(mock_client)
+            result = await tp_project_fitness(until_date=_day(5), scenarios=[{"taper_days": 30}])
+
+        assert result["error_code"] == "VALIDATION_ERROR"
+        assert "taper_days" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_upstream_error(self):
+        with patch("tp_mcp.tools.projection.TPClient") as mock_client:
+            instance = _mock(mock_client)
+            instance.get = AsyncMock(return_value=APIResponse(
+                success=False, error_code=ErrorCode.API_ERROR, message="boom",
+            ))
+            result = await tp_project_fitness(until_date=_day(5))
+
+        assert result["isError"] is True
+        assert result["message"] == "boom"
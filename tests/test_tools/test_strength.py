@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from tp_mcp.client.http import APIResponse
+from tp_mcp.tools._exercises import Exercise
 from tp_mcp.tools.strength import (
     _build_payload,
     _fmt_set,
@@ -86,9 +87,7 @@ class TestSearchExercises:
         match last in catalogue order and limit=1, it must still win — not be
         cut by an earlier substring match."""
         def _ex(eid, title):
-            return {"id": eid, "title": title, "videoUrl": None,
-                    "primaryMuscleGroups": [], "secondaryMuscleGroups": [],
-                    "parameters": []}
+            return Exercise(eid, title, None, (), (), ())
         catalogue = {
             "1": _ex("1", "Back Squat"),
             "2": _ex("2", "Front Squat"),
@@ -99,6 +98,63 @@ class TestSearchExercises:
         assert r["count"] == 1
         assert r["exercises"][0]["title"] == "Squat"
 
+    @pytest.mark.asyncio
+    async def test_typo_tolerant(self):
+        r = await tp_search_exercises("romainian deadlift", limit=3)
+        assert r["exercises"][0]["title"] == "Romanian Deadlift"
+
+    @pytest.mark.asyncio
+    async def test_aliases_both_ways(self):
+        r = await tp_search_exercises("dumbbell bench press", limit=1)
+        assert r["exercises"][0]["title"] == "DB Bench Press"
+        r = await tp_search_exercises("rdl", limit=5)
+        assert "Romanian Deadlift" in [e["title"] for e in r["exercises"]]
+
+    @pytest.mark.asyncio
+    async def test_query_and_muscle_group(self):
+        from tp_mcp.tools.strength import _catalogue
+
+        r = await tp_search_exercises("deadlift", muscle_group="ham", limit=100)
+        assert r["count"] >= 1
+        assert "deadlift" in r["exercises"][0]["title"].lower()
+        for e in r["exercises"]:
+            ex = _catalogue()[e["id"]]
+            assert "Hamstrings" in ex.primary_muscles + ex.secondary_muscles
+
+    def test_index_rebuilt_for_new_catalogue(self):
+        from tp_mcp.tools.strength import _search_index
+
+        first = _search_index()
+        assert _search_index() is first
+        with patch("tp_mcp.tools.strength._catalogue", return_value={}):
+            assert _search_index() is not first
+
+
+class TestCompiledCatalogue:
+    def test_compiles_once_then_reads_cache(self):
+        from tp_mcp.tools import _exercises
+
+        first = _exercises.load_catalogue()
+        assert _exercises._cache_file().exists()
+        with patch("tp_mcp.tools._exercises.json.loads") as parse:
+            second = _exercises.load_catalogue()
+        parse.assert_not_called()
+        assert second == first
+        assert first["1"] == Exercise(
+            "1", "Air Squat", "https://youtu.be/xPtIxrUwnxg", ("Hamstrings",), ("Quads",), ("Reps",),
+        )
+
+    def test_stale_or_corrupt_cache_recompiles(self):
+        from tp_mcp.tools import _exercises
+
+        _exercises.load_catalogue()
+        cache = _exercises._cache_file()
+        cache.write_bytes(b"not marshal")
+        assert len(_exercises.load_catalogue()) == 944
+        with patch("tp_mcp.tools._exercises._fingerprint", return_value=(0, 0)):
+            assert _exercises._read_cache(cache, (0, 0)) is None  # written for the real fingerprint
+            assert len(_exercises.load_catalogue()) == 944
+
 
 # ── Validation (returns before any network call) ─────────────────────────────
 
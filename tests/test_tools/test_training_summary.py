@@ -0,0 +1,110 @@
+"""Tests for tp_get_training_summary."""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tp_mcp.client.http import APIResponse, ErrorCode
+from tp_mcp.tools.training_summary import tp_get_training_summary
+
+
+def _mock(mock_client, workouts, tss=40):
+    async def post(endpoint, json=None):
+        a, b = (date.fromisoformat(p) for p in endpoint.split("/")[-2:])
+        return APIResponse(success=True, data=[
+            {"workoutDay": f"{a + timedelta(days=i)}T00:00:00", "tssActual": tss}
+            for i in range((b - a).days + 1)
+        ])
+
+    instance = AsyncMock()
+    instance.ensure_athlete_id = AsyncMock(return_value=123)
+    instance.get = AsyncMock(return_value=APIResponse(success=True, data=workouts))
+    instance.post = AsyncMock(side_effect=post)
+    mock_client.return_value.__aenter__.return_value = instance
+    return instance
+
+
+WORKOUTS = [
+    {"workoutId": 1, "workoutDay": "2025-03-03T00:00:00", "workoutTypeValueId": 2,
+     "totalTime": 1.5, "tssActual": 90, "distance": 45000, "tssPlanned": 80, "totalTimePlanned": 1.5},
+    {"workoutId": 2, "workoutDay": "2025-03-05T00:00:00", "workoutTypeValueId": 3,
+     "totalTime": 1.0, "tssActual": 60, "distance": 12000},
+    {"workoutId": 3, "workoutDay": "2025-03-12T00:00:00", "workoutTypeValueId": 2,
+     "totalTime": 2.0, "tssActual": 110, "distance": 60000},
+]
+
+
+class TestTrainingSummary:
+    @pytest.mark.asyncio
+    async def test_weekly_rollup_with_sports_and_fitness(self):
+        with patch("tp_mcp.tools.training_summary.TPClient") as mock_client:
+            instance = _mock(mock_client, WORKOUTS)
+            result = await tp_get_training_summary(start_date="2025-03-03", end_date="2025-03-16")
+
+        assert instance.get.await_count == 1
+        assert instance.post.await_count == 1
+        assert [p["start"] for p in result["periods"]] == ["2025-03-03", "2025-03-10"]
+        first, second = result["periods"]
+        assert first["sessions"] == 2
+        assert first["hours"] == 2.5
+        assert first["tss"] == 150
+        assert first["distance_km"] == 57.0
+        assert first["by_sport"]["Bike"]["tss"] == 90
+        assert first["by_sport"]["Run"]["hours"] == 1.0
+        assert second["by_sport"] == {"Bike": {
+            "sessions": 1, "planned_sessions": 0, "hours": 2.0, "hours_planned": 0.0,
+            "tss": 110.0, "tss_planned": 0.0, "distance_km": 60.0,
+        }}
+        # End-of-period fitness is seeded from prior history, not from zero.
+        assert first["fitness"]["date"] == "2025-03-09"
+        assert first["fitness"]["ctl"] > 30
+        assert result["totals"]["tss"] == 260
+        assert result["workout_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_group_by_month(self):
+        with patch("tp_mcp.tools.training_summary.TPClient") as mock_client:
+            _mock(mock_client, WORKOUTS)
+            result = await tp_get_training_summary(
+                start_date="2025-02-15", end_date="2025-03-31", group_by="month", by_sport=False,
+            )
+
+        assert [(p["start"], p["end"]) for p in result["periods"]] == [
+            ("2025-02-15", "2025-02-28"), ("2025-03-01", "2025-03-31"),
+        ]
+        assert result["periods"][1]["sessions"] == 3
+        assert "by_sport" not in result["periods"][1]
+
+    @pytest.mark.asyncio
+    async def test_weeks_ends_with_current_week(self):
+        with patch("tp_mcp.tools.training_summary.TPClient") as mock_client:
+            _mock(mock_client, [])
+            result = await tp_get_training_summary(weeks=4)
+
+        today = date.today()
+        sunday = today - timedelta(days=today.weekday()) + timedelta(days=6)
+        assert result["end_date"] == sunday.isoformat()
+        assert len(result["periods"]) == 4
+        assert result["periods"][-1]["fitness"]["date"] == today.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_validation(self):
+        assert (await tp_get_training_summary(weeks=0))["error_code"] == "VALIDATION_ERROR"
+        assert (await tp_get_training_summary(group_by="day"))["error_code"] == "VALIDATION_ERROR"
+        result = await tp_get_training_summary(weeks=4, start_date="2025-01-01", end_date="2025-02-01")
+        assert result["error_code"] == "VALIDATION_ERROR"
+        result = await tp_get_training_summary(start_date="2023-01-01", end_date="2025-02-01")
+        assert result["error_code"] == "VALIDATION_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_api_error(self):
+        with patch("tp_mcp.tools.training_summary.TPClient") as mock_client:
+            instance = _mock(mock_client, [])
+            instance.get = AsyncMock(return_value=APIResponse(
+                success=False, error_code=ErrorCode.API_ERROR, message="boom",
+            ))
+            result = await tp_get_training_summary(weeks=2)
+
+        assert result["isError"] is True
+        assert result["message"] == "boom"
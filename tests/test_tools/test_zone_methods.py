@@ -109,3 +109,18 @@ async def test_missing_user_id_is_auth_error():
     finally:
         p.stop()
     assert out["isError"] and out["error_code"] == "AUTH_INVALID"
+
+
+@pytest.mark.asyncio
+async def test_probe_results_cached_but_failures_retried():
+    p, mi = _client({("power", 1): {"zones": _zones(["1"]), "lactateThreshold": 250}})
+    try:
+        await tp_get_zone_methods(metric="power")
+        probes = mi.post.await_count
+        await tp_get_zone_methods(metric="power")
+        assert mi.post.await_count == probes      # fingerprints served from cache
+        await tp_get_zone_methods(metric="speed")
+        await tp_get_zone_methods(metric="speed")
+        assert mi.post.await_count == 3 * probes  # nothing found -> not cached
+    finally:
+        p.stop()